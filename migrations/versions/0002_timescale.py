@@ -0,0 +1,39 @@
+"""timescale hypertable, compression and continuous aggregates for metrics
+
+Revision ID: 0002_timescale
+Revises: 0001_initial
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.infrastructure.persistence.timescale import disable_timescale, enable_timescale
+from src.shared.config import get_settings
+
+
+revision: str = "0002_timescale"
+down_revision: Union[str, None] = "0001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only runs on PostgreSQL with the timescaledb extension and TIMESCALE_ENABLED=true.
+    settings = get_settings()
+    if not settings.timescale_enabled:
+        return
+    enable_timescale(
+        op.get_bind(),
+        timedelta(days=settings.timescale_chunk_interval_days),
+        timedelta(days=settings.timescale_compress_after_days),
+    )
+
+
+def downgrade() -> None:
+    # Chunks cannot be merged back into a plain table; the hypertable is left in place.
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql" and get_settings().timescale_enabled:
+        disable_timescale(bind)
@@ -0,0 +1,47 @@
+"""composite and covering indexes for metric queries
+
+Revision ID: 0003_metric_indexes
+Revises: 0002_timescale
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003_metric_indexes"
+down_revision: Union[str, None] = "0002_timescale"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_history: metric_name equality, optional widget_id equality, then the timestamp range,
+    # returned in index order without a sort step.
+    op.create_index(
+        "ix_metrics_name_widget_timestamp",
+        "metrics",
+        ["metric_name", "widget_id", "timestamp"],
+        if_not_exists=True,
+    )
+    # Latest value and deletes per widget, newest first; metric_value is covered on PostgreSQL.
+    op.create_index(
+        "ix_metrics_widget_timestamp",
+        "metrics",
+        ["widget_id", sa.text("timestamp DESC")],
+        postgresql_include=["metric_value"],
+        if_not_exists=True,
+    )
+    op.create_index("ix_metrics_timestamp", "metrics", ["timestamp"], if_not_exists=True)
+    # Both are left-prefixes of the composite indexes above.
+    op.drop_index("ix_metrics_widget_id", table_name="metrics", if_exists=True)
+    op.drop_index("ix_metrics_metric_name", table_name="metrics", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_metrics_metric_name", "metrics", ["metric_name"], if_not_exists=True)
+    op.create_index("ix_metrics_widget_id", "metrics", ["widget_id"], if_not_exists=True)
+    op.drop_index("ix_metrics_widget_timestamp", table_name="metrics", if_exists=True)
+    op.drop_index("ix_metrics_name_widget_timestamp", table_name="metrics", if_exists=True)
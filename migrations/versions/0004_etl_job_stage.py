@@ -0,0 +1,51 @@
+"""stage checkpoint columns on etl_jobs
+
+Revision ID: 0004_etl_job_stage
+Revises: 0003_metric_indexes
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004_etl_job_stage"
+down_revision: Union[str, None] = "0003_metric_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _stage_columns() -> list[sa.Column]:
+    return [
+        sa.Column("stage", sa.String(length=50), nullable=True),
+        sa.Column("stage_cursor", sa.JSON(), nullable=True),
+    ]
+
+
+def _existing_columns() -> set[str] | None:
+    inspector = sa.inspect(op.get_bind())
+    # etl_jobs is created by the application's create_all, not by 0001_initial.
+    if not inspector.has_table("etl_jobs"):
+        return None
+    return {column["name"] for column in inspector.get_columns("etl_jobs")}
+
+
+def upgrade() -> None:
+    existing = _existing_columns()
+    if existing is None:
+        return
+    for column in _stage_columns():
+        if column.name not in existing:
+            op.add_column("etl_jobs", column)
+
+
+def downgrade() -> None:
+    existing = _existing_columns()
+    if existing is None:
+        return
+    with op.batch_alter_table("etl_jobs") as batch:
+        for column in reversed(_stage_columns()):
+            if column.name in existing:
+                batch.drop_column(column.name)
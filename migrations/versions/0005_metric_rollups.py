@@ -0,0 +1,105 @@
+"""metric rollup tables
+
+Revision ID: 0005_metric_rollups
+Revises: 0004_etl_job_stage
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.infrastructure.persistence.rollups import (
+    ROLLUP_RESOLUTIONS,
+    floor_timestamp,
+    rollup_states,
+)
+
+
+revision: str = "0005_metric_rollups"
+down_revision: Union[str, None] = "0004_etl_job_stage"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("metric_rollups"):
+        # init_db's create_all may have built the table and written rollups before this revision
+        # ran; they are rebuilt below together with every older metric.
+        op.execute("DELETE FROM metric_rollups")
+    else:
+        op.create_table(
+            "metric_rollups",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("resolution", sa.String(length=10), nullable=False),
+            sa.Column("metric_name", sa.String(length=255), nullable=False),
+            sa.Column("widget_id", sa.String(length=36), nullable=False, server_default=""),
+            sa.Column("bucket", sa.DateTime(), nullable=False),
+            sa.Column("count", sa.Integer(), nullable=False),
+            sa.Column("sum", sa.Float(), nullable=False),
+            sa.Column("min", sa.Float(), nullable=False),
+            sa.Column("max", sa.Float(), nullable=False),
+            sa.Column("sketch", sa.JSON(), nullable=False),
+            sa.UniqueConstraint(
+                "resolution", "metric_name", "widget_id", "bucket", name="uq_metric_rollups_bucket"
+            ),
+        )
+        op.create_index("ix_metric_rollups_widget_id", "metric_rollups", ["widget_id"])
+    _backfill_rollups()
+
+
+def _backfill_rollups() -> None:
+    metrics = sa.table(
+        "metrics",
+        sa.column("widget_id", sa.String),
+        sa.column("metric_name", sa.String),
+        sa.column("timestamp", sa.DateTime),
+        sa.column("metric_value", sa.Float),
+    )
+    rollups = sa.table(
+        "metric_rollups",
+        sa.column("resolution", sa.String),
+        sa.column("metric_name", sa.String),
+        sa.column("widget_id", sa.String),
+        sa.column("bucket", sa.DateTime),
+        sa.column("count", sa.Integer),
+        sa.column("sum", sa.Float),
+        sa.column("min", sa.Float),
+        sa.column("max", sa.Float),
+        sa.column("sketch", sa.JSON),
+    )
+    points = op.get_bind().execute(
+        sa.select(
+            metrics.c.widget_id, metrics.c.metric_name, metrics.c.timestamp, metrics.c.metric_value
+        )
+        .order_by(metrics.c.timestamp)
+        .execution_options(yield_per=10_000)
+    )
+    # Every rollup width divides a day, so one day of points completes all of its buckets.
+    day = ROLLUP_RESOLUTIONS["day"]
+    for _, day_points in groupby(points, key=lambda point: floor_timestamp(point[2], day)):
+        rows = [
+            {
+                "resolution": resolution,
+                "metric_name": metric_name,
+                "widget_id": widget_id,
+                "bucket": bucket,
+                "count": state.count,
+                "sum": state.sum,
+                "min": state.min,
+                "max": state.max,
+                "sketch": state.sketch.to_dict(),
+            }
+            for (resolution, metric_name, widget_id, bucket), state in rollup_states(
+                day_points
+            ).items()
+        ]
+        op.bulk_insert(rollups, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_metric_rollups_widget_id", table_name="metric_rollups", if_exists=True)
+    op.drop_table("metric_rollups", if_exists=True)
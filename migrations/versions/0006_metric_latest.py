@@ -0,0 +1,63 @@
+"""latest value per widget and metric name
+
+Revision ID: 0006_metric_latest
+Revises: 0005_metric_rollups
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006_metric_latest"
+down_revision: Union[str, None] = "0005_metric_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("metric_latest"):
+        op.create_table(
+            "metric_latest",
+            sa.Column("widget_id", sa.String(length=36), primary_key=True),
+            sa.Column("metric_name", sa.String(length=255), primary_key=True),
+            sa.Column("metric_id", sa.String(length=36), nullable=False),
+            sa.Column("metric_value", sa.Float(), nullable=False),
+            sa.Column("metric_type", sa.String(length=50), nullable=True),
+            sa.Column("dimensions", sa.JSON(), nullable=True),
+            sa.Column("timestamp", sa.DateTime(), nullable=False),
+        )
+
+    # Same result as TimescaleMetricRepository.rebuild_latest(): the newest metric per
+    # (widget, metric name), replacing whatever create_all-era writes left in the table.
+    op.execute("DELETE FROM metric_latest")
+    op.execute(
+        """
+        INSERT INTO metric_latest
+            (widget_id, metric_name, metric_id, metric_value, metric_type, dimensions, timestamp)
+        SELECT widget_id, metric_name, id, metric_value, metric_type, dimensions, timestamp
+        FROM (
+            SELECT
+                id,
+                widget_id,
+                metric_name,
+                metric_value,
+                metric_type,
+                dimensions,
+                timestamp,
+                ROW_NUMBER() OVER (
+                    PARTITION BY widget_id, metric_name ORDER BY timestamp DESC
+                ) AS rank
+            FROM metrics
+            WHERE widget_id IS NOT NULL
+        ) AS ranked
+        WHERE rank = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("metric_latest", if_exists=True)
@@ -0,0 +1,174 @@
+from pathlib import Path
+import sys
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, text
+
+from src.shared.utils import generate_uuid
+
+# A scratch copy of the metrics columns the queries touch, so the benchmark can run against a
+# real database without modifying the metrics table.
+TABLE = "metrics_index_benchmark"
+START = datetime(2024, 1, 1)
+
+BEFORE_INDEXES = [
+    f"CREATE INDEX ix_{TABLE}_widget_id ON {TABLE} (widget_id)",
+    f"CREATE INDEX ix_{TABLE}_metric_name ON {TABLE} (metric_name)",
+    f"CREATE INDEX ix_{TABLE}_timestamp ON {TABLE} (timestamp)",
+]
+# Same definitions as migrations/versions/0003_metric_indexes.py.
+AFTER_INDEXES = [
+    f"DROP INDEX ix_{TABLE}_widget_id",
+    f"DROP INDEX ix_{TABLE}_metric_name",
+    f"CREATE INDEX ix_{TABLE}_name_widget_timestamp ON {TABLE} (metric_name, widget_id, timestamp)",
+    f"CREATE INDEX ix_{TABLE}_widget_timestamp ON {TABLE} (widget_id, timestamp DESC){{include}}",
+]
+
+QUERIES = {
+    "history_for_widget": (
+        f"SELECT id, metric_value, timestamp FROM {TABLE} WHERE metric_name = :metric_name "
+        "AND widget_id = :widget_id AND timestamp >= :start AND timestamp <= :end "
+        "ORDER BY timestamp"
+    ),
+    "history_all_widgets": (
+        f"SELECT id, widget_id, metric_value, timestamp FROM {TABLE} "
+        "WHERE metric_name = :metric_name AND timestamp >= :start AND timestamp <= :end "
+        "ORDER BY timestamp"
+    ),
+    "latest_for_widget": (
+        f"SELECT metric_value, timestamp FROM {TABLE} WHERE widget_id = :widget_id "
+        "ORDER BY timestamp DESC LIMIT 1"
+    ),
+}
+
+
+def populate(connection, rows: int, widgets: int, metric_names: int) -> dict:
+    widget_ids = [generate_uuid() for _ in range(widgets)]
+    names = [f"metric_{index}" for index in range(metric_names)]
+    step = timedelta(days=365) / max(rows // (widgets * metric_names), 1)
+    rng = random.Random(42)
+    batch = []
+    for index in range(rows):
+        per_series = index // (widgets * metric_names)
+        batch.append(
+            {
+                "id": generate_uuid(),
+                "widget_id": widget_ids[index % widgets],
+                "metric_name": names[(index // widgets) % metric_names],
+                "metric_value": rng.random() * 1000,
+                "timestamp": START + step * per_series,
+            }
+        )
+        if len(batch) == 10_000 or index == rows - 1:
+            connection.execute(
+                text(
+                    f"INSERT INTO {TABLE} (id, widget_id, metric_name, metric_value, timestamp) "
+                    "VALUES (:id, :widget_id, :metric_name, :metric_value, :timestamp)"
+                ),
+                batch,
+            )
+            batch = []
+    return {
+        "metric_name": names[0],
+        "widget_id": widget_ids[0],
+        "start": START + timedelta(days=90),
+        "end": START + timedelta(days=120),
+    }
+
+
+def explain(connection, sql: str, params: dict) -> list[str]:
+    if connection.dialect.name == "postgresql":
+        rows = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)
+        return [row[0] for row in rows]
+    rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)
+    return [row[-1] for row in rows]
+
+
+def measure(connection, params: dict, repeat: int) -> dict:
+    results = {}
+    for name, sql in QUERIES.items():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            connection.execute(text(sql), params).fetchall()
+            timings.append(time.perf_counter() - started)
+        results[name] = {
+            "median_ms": round(statistics.median(timings) * 1000, 3),
+            "plan": explain(connection, sql, params),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare metric query plans before and after the composite indexes"
+    )
+    parser.add_argument(
+        "--url", default=None, help="database URL, defaults to a scratch SQLite file"
+    )
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--widgets", type=int, default=200)
+    parser.add_argument("--metric-names", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    scratch = None
+    url = args.url
+    if url is None:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        url = f"sqlite:///{scratch.name}"
+    engine = create_engine(url)
+    include = " INCLUDE (metric_value)" if engine.dialect.name == "postgresql" else ""
+
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+            connection.execute(
+                text(
+                    f"CREATE TABLE {TABLE} (id VARCHAR(36) PRIMARY KEY, widget_id VARCHAR(36), "
+                    "metric_name VARCHAR(255) NOT NULL, metric_value FLOAT NOT NULL, "
+                    "timestamp TIMESTAMP NOT NULL)"
+                )
+            )
+            params = populate(connection, args.rows, args.widgets, args.metric_names)
+            for statement in BEFORE_INDEXES:
+                connection.execute(text(statement))
+            connection.execute(text(f"ANALYZE {TABLE}"))
+
+        with engine.connect() as connection:
+            before = measure(connection, params, args.repeat)
+        with engine.begin() as connection:
+            for statement in AFTER_INDEXES:
+                connection.execute(text(statement.format(include=include)))
+            connection.execute(text(f"ANALYZE {TABLE}"))
+        with engine.connect() as connection:
+            after = measure(connection, params, args.repeat)
+
+        print(f"{args.rows} rows, {engine.dialect.name}")
+        for name in QUERIES:
+            print(f"\n== {name}: {before[name]['median_ms']} ms -> {after[name]['median_ms']} ms")
+            print("before:")
+            for line in before[name]["plan"]:
+                print(f"  {line}")
+            print("after:")
+            for line in after[name]["plan"]:
+                print(f"  {line}")
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        engine.dispose()
+        if scratch is not None:
+            Path(scratch.name).unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
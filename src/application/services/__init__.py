@@ -1,5 +1,6 @@
 from src.application.services.alert_service import AlertService
 from src.application.services.dashboard_service import DashboardService
+from src.application.services.etl_job_stats_service import ETLJobStatsService
 from src.application.services.etl_service import ETLService
 from src.application.services.metric_calculation_service import MetricCalculationService
 from src.application.services.report_service import ReportService
@@ -7,6 +8,7 @@ from src.application.services.report_service import ReportService
 __all__ = [
     "AlertService",
     "DashboardService",
+    "ETLJobStatsService",
     "ETLService",
     "MetricCalculationService",
     "ReportService",
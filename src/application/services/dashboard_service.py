@@ -12,9 +12,10 @@ class DashboardService:
     def build_dashboard_data(self, dashboard: Dashboard) -> dict:
         widgets = self.widget_repo.list_by_dashboard(dashboard.id)
         payload_widgets: list[dict] = []
+        latest_metrics = self.metric_repo.get_latest_by_widgets([widget.id for widget in widgets])
 
         for widget in widgets:
-            latest_metric = self.metric_repo.get_latest_by_widget(widget.id)
+            latest_metric = latest_metrics.get(widget.id)
             payload_widgets.append(
                 {
                     "id": widget.id,
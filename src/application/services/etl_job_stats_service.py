@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from datetime import UTC, datetime
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities import ETLJob
+from src.domain.repositories import ETLJobRepository
+
+PERIOD_FREQUENCIES = {"hour": "h", "day": "D", "week": "W-SUN"}
+
+
+def _percentile(values: list[float], q: float) -> float | None:
+    return round(float(np.percentile(values, q)), 6) if values else None
+
+
+def _naive_utc(timestamp: datetime) -> datetime:
+    # Drivers differ on whether job timestamps come back zone-aware; buckets are naive UTC.
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(UTC).replace(tzinfo=None)
+
+
+class ETLJobStatsService:
+    def __init__(self, job_repo: ETLJobRepository) -> None:
+        self.job_repo = job_repo
+
+    def performance(
+        self, data_source_id: str, start: datetime, end: datetime, period: str = "day"
+    ) -> list[dict]:
+        frequency = PERIOD_FREQUENCIES.get(period)
+        if frequency is None:
+            raise ValueError(f"Unsupported period: {period}")
+
+        buckets: dict[datetime, list[ETLJob]] = defaultdict(list)
+        for job in self.job_repo.list_finished(data_source_id, start, end):
+            if job.started_at is None or job.completed_at is None:
+                continue
+            bucket_start = (
+                pd.Timestamp(_naive_utc(job.started_at))
+                .to_period(frequency)
+                .start_time.to_pydatetime()
+            )
+            buckets[bucket_start].append(job)
+        return [self._bucket(bucket_start, jobs) for bucket_start, jobs in sorted(buckets.items())]
+
+    @staticmethod
+    def _bucket(bucket_start: datetime, jobs: list[ETLJob]) -> dict:
+        # Unchanged, blocked and failed runs end early, so only completed runs feed the percentiles.
+        completed = [job for job in jobs if job.status == "completed"]
+        timed = [
+            (job, (_naive_utc(job.completed_at) - _naive_utc(job.started_at)).total_seconds())
+            for job in completed
+            if job.completed_at is not None and job.started_at is not None
+        ]
+        durations = [duration for _, duration in timed]
+        throughput = [job.rows_processed / duration for job, duration in timed if duration > 0]
+        stage_seconds: dict[str, list[float]] = defaultdict(list)
+        for job in completed:
+            for stage, seconds in ((job.metadata or {}).get("stages") or {}).items():
+                stage_seconds[stage].append(seconds)
+
+        return {
+            "period_start": bucket_start,
+            "runs": len(jobs),
+            "statuses": dict(Counter(job.status for job in jobs)),
+            "rows_processed": sum(job.rows_processed for job in completed),
+            "rows_failed": sum(job.rows_failed for job in jobs),
+            "p50_seconds": _percentile(durations, 50),
+            "p95_seconds": _percentile(durations, 95),
+            "p50_rows_per_second": _percentile(throughput, 50),
+            "p95_rows_per_second": _percentile(throughput, 95),
+            "p95_stage_seconds": {
+                stage: _percentile(values, 95) for stage, values in stage_seconds.items()
+            },
+            "peak_rss_bytes": max(
+                ((job.metadata or {}).get("peak_rss_bytes") or 0 for job in jobs), default=0
+            ),
+        }
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.domain.repositories import MetricRepository
 
@@ -13,5 +13,9 @@ class GetMetricHistoryUseCase:
         start_date: datetime,
         end_date: datetime,
         widget_id: str | None = None,
+        resolution: timedelta | None = None,
+        aggregation: str = "avg",
     ):
-        return self.repository.get_history(metric_name, start_date, end_date, widget_id)
+        return self.repository.get_history(
+            metric_name, start_date, end_date, widget_id, resolution, aggregation
+        )
@@ -12,7 +12,7 @@ class GetWidgetDataUseCase:
         if widget is None:
             raise EntityNotFoundError("Widget not found")
 
-        metric = self.metric_repo.get_latest_by_widget(widget_id)
+        metric = self.metric_repo.get_latest_by_widgets([widget_id]).get(widget_id)
         return {
             "id": widget.id,
             "name": widget.name,
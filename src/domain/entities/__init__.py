@@ -1,5 +1,6 @@
 from src.domain.entities.alert import Alert
 from src.domain.entities.dashboard import Dashboard
+from src.domain.entities.data_quality_check import DataQualityCheck
 from src.domain.entities.data_source import DataSource
 from src.domain.entities.etl_job import ETLJob
 from src.domain.entities.metric import Metric
@@ -10,6 +11,7 @@ from src.domain.entities.widget import Widget
 __all__ = [
     "Alert",
     "Dashboard",
+    "DataQualityCheck",
     "DataSource",
     "ETLJob",
     "Metric",
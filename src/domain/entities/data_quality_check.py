@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class DataQualityCheck:
+    id: str
+    data_source_id: str
+    check_type: str
+    column_name: str | None = None
+    expectation: dict = field(default_factory=dict)
+    last_run_at: datetime | None = None
+    last_status: str | None = None
+    failure_count: int = 0
+    is_active: bool = True
@@ -14,3 +14,5 @@ class ETLJob:
     rows_failed: int = 0
     error_message: str | None = None
     metadata: dict | None = None
+    stage: str | None = None
+    stage_cursor: dict | None = None
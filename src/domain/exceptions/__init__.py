@@ -1,4 +1,5 @@
 from src.domain.exceptions.domain_exceptions import (
+    DataQualityError,
     DataSourceConnectionError,
     DomainError,
     EntityNotFoundError,
@@ -9,6 +10,7 @@ from src.domain.exceptions.domain_exceptions import (
 )
 
 __all__ = [
+    "DataQualityError",
     "DataSourceConnectionError",
     "DomainError",
     "EntityNotFoundError",
@@ -24,3 +24,7 @@ class DataSourceConnectionError(DomainError):
 
 class ValidationError(DomainError):
     pass
+
+
+class DataQualityError(DomainError):
+    pass
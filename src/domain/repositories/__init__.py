@@ -1,6 +1,8 @@
 from src.domain.repositories.alert_repository import AlertRepository
 from src.domain.repositories.dashboard_repository import DashboardRepository
+from src.domain.repositories.data_quality_check_repository import DataQualityCheckRepository
 from src.domain.repositories.data_source_repository import DataSourceRepository
+from src.domain.repositories.etl_job_repository import ETLJobRepository
 from src.domain.repositories.metric_repository import MetricRepository
 from src.domain.repositories.report_repository import ReportRepository
 from src.domain.repositories.user_repository import UserRepository
@@ -9,7 +11,9 @@ from src.domain.repositories.widget_repository import WidgetRepository
 __all__ = [
     "AlertRepository",
     "DashboardRepository",
+    "DataQualityCheckRepository",
     "DataSourceRepository",
+    "ETLJobRepository",
     "MetricRepository",
     "ReportRepository",
     "UserRepository",
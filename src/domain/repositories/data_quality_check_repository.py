@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import DataQualityCheck
+
+
+class DataQualityCheckRepository(ABC):
+    @abstractmethod
+    def create(self, check: DataQualityCheck) -> DataQualityCheck:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_active_by_data_source(self, data_source_id: str) -> list[DataQualityCheck]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_results(self, checks: list[DataQualityCheck]) -> int:
+        raise NotImplementedError
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.entities import ETLJob
+
+
+class ETLJobRepository(ABC):
+    @abstractmethod
+    def create(self, job: ETLJob) -> ETLJob:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, job: ETLJob) -> ETLJob:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_stage(self, job_id: str, stage: str | None, cursor: dict | None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_id(self, job_id: str) -> ETLJob | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_latest_completed(self, data_source_id: str) -> ETLJob | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_finished(self, data_source_id: str, start: datetime, end: datetime) -> list[ETLJob]:
+        raise NotImplementedError
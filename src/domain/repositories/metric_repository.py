@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.domain.entities import Metric
 
@@ -20,9 +20,35 @@ class MetricRepository(ABC):
         start_date: datetime,
         end_date: datetime,
         widget_id: str | None = None,
+        resolution: timedelta | None = None,
+        aggregation: str = "avg",
     ) -> list[Metric]:
         raise NotImplementedError
 
     @abstractmethod
     def get_latest_by_widget(self, widget_id: str) -> Metric | None:
         raise NotImplementedError
+
+    @abstractmethod
+    def get_latest_by_widgets(self, widget_ids: list[str]) -> dict[str, Metric]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_widgets(
+        self,
+        widget_ids: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        metric_names: list[str] | None = None,
+    ) -> list[Metric]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_by_widgets(
+        self,
+        widget_ids: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        metric_names: list[str] | None = None,
+    ) -> int:
+        raise NotImplementedError
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+
+from src.infrastructure.etl import MetricBackfill
+from src.infrastructure.etl.metric_materializer import parse_period
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute per-period metrics from a data source warehouse table"
+    )
+    parser.add_argument("data_source_id", help="data source id")
+    parser.add_argument(
+        "start", type=datetime.fromisoformat, help="first date to recompute (ISO 8601)"
+    )
+    parser.add_argument(
+        "end", type=datetime.fromisoformat, help="last date to recompute (ISO 8601)"
+    )
+    parser.add_argument("--period", default=None, help="hourly|daily|weekly|monthly")
+    parser.add_argument(
+        "--table", default=None, help="warehouse table, defaults to data_source_<id>"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="parallel window readers")
+    args = parser.parse_args()
+
+    period = parse_period(args.period) if args.period else None
+    if args.period and period is None:
+        parser.error(f"unsupported period: {args.period}")
+
+    result = MetricBackfill(max_workers=args.workers).run(
+        args.data_source_id, args.start, args.end, period, args.table
+    )
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
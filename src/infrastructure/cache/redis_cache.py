@@ -28,9 +28,17 @@ class InMemoryCache:
             return None
         return value
 
-    def setex(self, key: str, ttl: int, value: str) -> None:
+    def setex(self, key: str, ttl: int, value: str | bytes) -> None:
         self._data[key] = (value, time.time() + ttl)
 
+    def mget(self, keys: list[str]) -> list[Any]:
+        return [self.get(key) for key in keys]
+
+    def expire(self, key: str, ttl: int) -> None:
+        item = self._data.get(key)
+        if item is not None:
+            self._data[key] = (item[0], time.time() + ttl)
+
     def delete(self, *keys: str) -> None:
         for key in keys:
             self._data.pop(key, None)
@@ -47,18 +55,23 @@ class RedisCacheService:
         settings = get_settings()
         self._enabled = settings.cache_enabled
         self._backend: redis.Redis | InMemoryCache
+        self._binary_backend: redis.Redis | InMemoryCache
 
         if not self._enabled:
             self._backend = InMemoryCache()
+            self._binary_backend = self._backend
             return
 
         try:
             client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
             client.ping()
             self._backend = client
+            # Binary payloads need a client that hands back raw bytes.
+            self._binary_backend = redis.Redis.from_url(settings.redis_url)
         except Exception:
             logger.warning("redis_unavailable_falling_back_to_memory")
             self._backend = InMemoryCache()
+            self._binary_backend = self._backend
 
     def get(self, key: str) -> Any | None:
         payload = self._backend.get(key)
@@ -74,6 +87,37 @@ class RedisCacheService:
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
         self._backend.setex(key, ttl, json.dumps(value, default=str))
 
+    def set_many_bytes(self, values: dict[str, bytes], ttl: int = 300) -> None:
+        if isinstance(self._binary_backend, InMemoryCache):
+            for key, value in values.items():
+                self._binary_backend.setex(key, ttl, value)
+            return
+        pipeline = self._binary_backend.pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.setex(key, ttl, value)
+        pipeline.execute()
+
+    def set_with_expiry(
+        self, key: str, value: Any, expiring_keys: list[str], ttl: int = 300
+    ) -> None:
+        # The value and the TTL of the keys it references are written in one transaction.
+        payload = json.dumps(value, default=str)
+        if isinstance(self._backend, InMemoryCache):
+            for expiring_key in expiring_keys:
+                self._backend.expire(expiring_key, ttl)
+            self._backend.setex(key, ttl, payload)
+            return
+        pipeline = self._backend.pipeline(transaction=True)
+        for expiring_key in expiring_keys:
+            pipeline.expire(expiring_key, ttl)
+        pipeline.setex(key, ttl, payload)
+        pipeline.execute()
+
+    def get_many_bytes(self, keys: list[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return list(self._binary_backend.mget(keys))
+
     def delete(self, key: str) -> None:
         self._backend.delete(key)
 
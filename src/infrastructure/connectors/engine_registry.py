@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+from src.infrastructure.monitoring import (
+    external_db_connections_checked_out,
+    external_db_engines_active,
+)
+from src.shared.config import get_settings
+
+
+@dataclass(slots=True)
+class _RegisteredEngine:
+    engine: Engine
+    last_used: float
+
+
+class EngineRegistry:
+    def __init__(
+        self,
+        pool_size: int = 5,
+        max_overflow: int = 5,
+        pool_recycle: int = 1800,
+        idle_timeout: float = 900.0,
+        max_engines: int = 200,
+    ) -> None:
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.idle_timeout = idle_timeout
+        self.max_engines = max_engines
+        self._engines: OrderedDict[str, _RegisteredEngine] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_engine(self, connection_string: str) -> Engine:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            registered = self._engines.get(connection_string)
+            if registered is None:
+                registered = _RegisteredEngine(
+                    engine=self._create_engine(connection_string), last_used=now
+                )
+                self._engines[connection_string] = registered
+                self._evict_over_capacity()
+            else:
+                registered.last_used = now
+                self._engines.move_to_end(connection_string)
+            self._publish_gauges()
+            return registered.engine
+
+    def evict_idle(self) -> int:
+        with self._lock:
+            evicted = self._evict_idle(time.monotonic())
+            self._publish_gauges()
+            return evicted
+
+    def dispose_all(self) -> None:
+        with self._lock:
+            for registered in self._engines.values():
+                registered.engine.dispose()
+            self._engines.clear()
+            self._publish_gauges()
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "url": make_url(connection_string).render_as_string(hide_password=True),
+                    "idle_seconds": round(now - registered.last_used, 3),
+                    **self._pool_stats(registered.engine),
+                }
+                for connection_string, registered in self._engines.items()
+            ]
+
+    def _create_engine(self, connection_string: str) -> Engine:
+        url = make_url(connection_string)
+        if url.get_backend_name() == "sqlite":
+            return create_engine(url, pool_pre_ping=True)
+        return create_engine(
+            url,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=True,
+        )
+
+    def _evict_idle(self, now: float) -> int:
+        expired = [
+            connection_string
+            for connection_string, registered in self._engines.items()
+            if now - registered.last_used > self.idle_timeout
+            and self._checked_out(registered.engine) == 0
+        ]
+        for connection_string in expired:
+            self._engines.pop(connection_string).engine.dispose()
+        return len(expired)
+
+    def _evict_over_capacity(self) -> None:
+        overflow = len(self._engines) - self.max_engines
+        if overflow <= 0:
+            return
+        idle = [
+            connection_string
+            for connection_string, registered in self._engines.items()
+            if self._checked_out(registered.engine) == 0
+        ][:overflow]
+        for connection_string in idle:
+            self._engines.pop(connection_string).engine.dispose()
+
+    def _publish_gauges(self) -> None:
+        external_db_engines_active.set(len(self._engines))
+        external_db_connections_checked_out.set(
+            sum(self._checked_out(registered.engine) for registered in self._engines.values())
+        )
+
+    @classmethod
+    def _checked_out(cls, engine: Engine) -> int:
+        return int(cls._pool_stats(engine).get("checked_out", 0))
+
+    @staticmethod
+    def _pool_stats(engine: Engine) -> dict:
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            return {
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        return {"pool": pool.status()}
+
+
+def _build_registry() -> EngineRegistry:
+    settings = get_settings()
+    return EngineRegistry(
+        pool_size=settings.external_db_pool_size,
+        max_overflow=settings.external_db_max_overflow,
+        idle_timeout=settings.external_db_pool_idle_seconds,
+        max_engines=settings.external_db_max_engines,
+    )
+
+
+engine_registry = _build_registry()
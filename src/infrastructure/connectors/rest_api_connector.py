@@ -1,16 +1,31 @@
 from __future__ import annotations
 
-import time
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
+import httpx
 import requests
 
 from src.infrastructure.connectors.base_connector import BaseConnector
 
 
 class RestAPIConnector(BaseConnector):
-    def __init__(self, timeout: int = 30, max_retries: int = 3) -> None:
+    PAGINATION_TYPES = {"page", "offset", "cursor", "link"}
+    RETRYABLE_STATUS_CODES = {429}
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_concurrency: int = 8,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.transport = transport
 
     def test_connection(self, config: dict) -> bool:
         endpoint = config.get("endpoint")
@@ -23,18 +38,207 @@ class RestAPIConnector(BaseConnector):
             return False
 
     def fetch(self, config: dict):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_async(config))
+        # asyncio.run cannot nest inside a running loop; async callers should await fetch_async.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.fetch_async(config)).result()
+
+    async def fetch_async(self, config: dict):
         endpoint = config["endpoint"]
         params = config.get("params", {})
-        headers = config.get("headers", {})
+        pagination = config.get("pagination")
+        concurrency = max(1, int((pagination or {}).get("max_concurrency", self.max_concurrency)))
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+        async with httpx.AsyncClient(
+            headers=config.get("headers", {}),
+            timeout=self.timeout,
+            limits=limits,
+            transport=self.transport,
+        ) as client:
+            semaphore = asyncio.Semaphore(concurrency)
+            if not pagination:
+                response = await self._get(client, semaphore, endpoint, params)
+                return response.json()
+
+            pagination_type = pagination.get("type", "page")
+            if pagination_type not in self.PAGINATION_TYPES:
+                raise ValueError(f"Unsupported pagination type: {pagination_type}")
+            if pagination_type in {"page", "offset"}:
+                return await self._fetch_numbered_pages(
+                    client, semaphore, endpoint, params, pagination, concurrency
+                )
+            if pagination_type == "cursor":
+                return await self._fetch_cursor_pages(
+                    client, semaphore, endpoint, params, pagination
+                )
+            return await self._fetch_link_pages(client, semaphore, endpoint, params, pagination)
+
+    async def _fetch_numbered_pages(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        endpoint: str,
+        params: dict,
+        pagination: dict,
+        concurrency: int,
+    ) -> list:
+        page_size = int(pagination.get("page_size", 100))
+        max_pages = pagination.get("max_pages")
+        records_field = pagination.get("records_field", "data")
+
+        def page_params(index: int) -> dict:
+            if pagination.get("type", "page") == "page":
+                page = int(pagination.get("start_page", 1)) + index
+                return {
+                    **params,
+                    pagination.get("page_param", "page"): page,
+                    pagination.get("size_param", "per_page"): page_size,
+                }
+            return {
+                **params,
+                pagination.get("offset_param", "offset"): index * page_size,
+                pagination.get("limit_param", "limit"): page_size,
+            }
+
+        async def fetch_page(index: int) -> list:
+            response = await self._get(client, semaphore, endpoint, page_params(index))
+            return self._extract_records(response.json(), records_field)
+
+        first_response = await self._get(client, semaphore, endpoint, page_params(0))
+        first_body = first_response.json()
+        pages = [self._extract_records(first_body, records_field)]
+
+        total_pages = self._total_pages(first_body, pagination, page_size)
+        page_limit: float = math.inf
+        if max_pages is not None:
+            total_pages = min(total_pages, int(max_pages)) if total_pages is not None else None
+            page_limit = int(max_pages)
+
+        if total_pages is not None:
+            pages.extend(
+                await asyncio.gather(*(fetch_page(index) for index in range(1, total_pages)))
+            )
+            return [record for page in pages for record in page]
 
+        # Without a total in the payload, pages are requested in waves until one comes back short.
+        next_index = 1
+        exhausted = len(pages[0]) < page_size
+        while not exhausted and next_index < page_limit:
+            wave = range(next_index, int(min(next_index + concurrency, page_limit)))
+            for page in await asyncio.gather(*(fetch_page(index) for index in wave)):
+                pages.append(page)
+                if len(page) < page_size:
+                    exhausted = True
+                    break
+            next_index += len(wave)
+        return [record for page in pages for record in page]
+
+    async def _fetch_cursor_pages(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        endpoint: str,
+        params: dict,
+        pagination: dict,
+    ) -> list:
+        records_field = pagination.get("records_field", "data")
+        cursor_param = pagination.get("cursor_param", "cursor")
+        next_cursor_field = pagination.get("next_cursor_field", "next_cursor")
+        max_pages = pagination.get("max_pages")
+
+        records: list = []
+        cursor = None
+        pages_fetched = 0
+        while max_pages is None or pages_fetched < int(max_pages):
+            page_params = {**params, cursor_param: cursor} if cursor else params
+            response = await self._get(client, semaphore, endpoint, page_params)
+            body = response.json()
+            records.extend(self._extract_records(body, records_field))
+            pages_fetched += 1
+            cursor = self._resolve_field(body, next_cursor_field)
+            if not cursor:
+                break
+        return records
+
+    async def _fetch_link_pages(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        endpoint: str,
+        params: dict,
+        pagination: dict,
+    ) -> list:
+        records_field = pagination.get("records_field", "data")
+        max_pages = pagination.get("max_pages")
+
+        records: list = []
+        url: str | None = endpoint
+        page_params: dict | None = params
+        pages_fetched = 0
+        while url and (max_pages is None or pages_fetched < int(max_pages)):
+            response = await self._get(client, semaphore, url, page_params)
+            records.extend(self._extract_records(response.json(), records_field))
+            pages_fetched += 1
+            url = response.links.get("next", {}).get("url")
+            # The next link already carries the query string of the following page.
+            page_params = None
+        return records
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        params: dict | None,
+    ) -> httpx.Response:
         attempt = 0
-        while attempt < self.max_retries:
+        while True:
             try:
-                response = requests.get(endpoint, params=params, headers=headers, timeout=self.timeout)
+                async with semaphore:
+                    response = await client.get(url, params=params)
                 response.raise_for_status()
-                return response.json()
-            except Exception:
+                return response
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
                 attempt += 1
-                if attempt >= self.max_retries:
+                if attempt >= self.max_retries or not self._is_retryable(exc):
                     raise
-                time.sleep(0.5 * attempt)
+                await asyncio.sleep(0.5 * attempt)
+
+    def _is_retryable(self, exc: httpx.HTTPError) -> bool:
+        if isinstance(exc, httpx.HTTPStatusError):
+            status_code = exc.response.status_code
+            return status_code in self.RETRYABLE_STATUS_CODES or status_code >= 500
+        return True
+
+    def _total_pages(self, body: Any, pagination: dict, page_size: int) -> int | None:
+        total_pages_field = pagination.get("total_pages_field")
+        if total_pages_field:
+            total_pages = self._resolve_field(body, total_pages_field)
+            return int(total_pages) if total_pages is not None else None
+
+        total_field = pagination.get("total_field")
+        if total_field:
+            total = self._resolve_field(body, total_field)
+            return math.ceil(int(total) / page_size) if total is not None else None
+        return None
+
+    def _extract_records(self, body: Any, records_field: str | None) -> list:
+        if isinstance(body, list):
+            return body
+        records = self._resolve_field(body, records_field) if records_field else body
+        if isinstance(records, list):
+            return records
+        return [records] if records is not None else []
+
+    @staticmethod
+    def _resolve_field(body: Any, path: str) -> Any:
+        value = body
+        for key in path.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
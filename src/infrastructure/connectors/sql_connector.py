@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine, text
+from collections.abc import Iterator
+
+import pandas as pd
+from sqlalchemy import text
 
 from src.infrastructure.connectors.base_connector import BaseConnector
+from src.infrastructure.connectors.engine_registry import EngineRegistry, engine_registry
 
 
 class SQLConnector(BaseConnector):
+    def __init__(self, batch_size: int = 10_000, registry: EngineRegistry | None = None) -> None:
+        self.batch_size = batch_size
+        self.registry = registry or engine_registry
+
     def test_connection(self, config: dict) -> bool:
         try:
-            engine = create_engine(config["connection_string"])
+            engine = self.registry.get_engine(config["connection_string"])
             with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             return True
@@ -16,9 +24,32 @@ class SQLConnector(BaseConnector):
             return False
 
     def fetch(self, config: dict):
-        engine = create_engine(config["connection_string"])
+        engine = self.registry.get_engine(config["connection_string"])
         query = config["query"]
         params = config.get("params", {})
         with engine.connect() as conn:
             result = conn.execute(text(query), params)
             return [dict(row._mapping) for row in result]
+
+    def fetch_dataframe(self, config: dict) -> pd.DataFrame:
+        batches = list(self.fetch_batches(config))
+        if len(batches) == 1:
+            return batches[0]
+        return pd.concat(batches, ignore_index=True)
+
+    def fetch_batches(self, config: dict, batch_size: int | None = None) -> Iterator[pd.DataFrame]:
+        engine = self.registry.get_engine(config["connection_string"])
+        query = config["query"]
+        params = config.get("params", {})
+        batch_size = batch_size or self.batch_size
+        with engine.connect() as conn:
+            # stream_results asks the driver for a server-side cursor so only one batch is buffered at a time.
+            streaming_conn = conn.execution_options(stream_results=True, max_row_buffer=batch_size)
+            result = streaming_conn.execute(text(query), params)
+            columns = list(result.keys())
+            emitted = False
+            for partition in result.partitions(batch_size):
+                emitted = True
+                yield pd.DataFrame.from_records(partition, columns=columns)
+            if not emitted:
+                yield pd.DataFrame(columns=columns)
@@ -1,3 +1,4 @@
+from src.infrastructure.etl.backfill import MetricBackfill
 from src.infrastructure.etl.pipeline import ETLPipeline
 
-__all__ = ["ETLPipeline"]
+__all__ = ["ETLPipeline", "MetricBackfill"]
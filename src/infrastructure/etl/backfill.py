@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.engine import Engine
+
+from src.domain.entities import Metric, Widget
+from src.domain.enums import AggregationType
+from src.infrastructure.etl.metric_materializer import (
+    PERIOD_FREQUENCIES,
+    MetricMaterializer,
+    MetricTarget,
+    parse_period,
+)
+from src.infrastructure.persistence import db_session_scope
+from src.infrastructure.persistence.database import engine
+from src.infrastructure.persistence.repositories import (
+    PostgresDataSourceRepository,
+    PostgresWidgetRepository,
+    TimescaleMetricRepository,
+)
+from src.shared.config import get_settings
+
+
+def warehouse_table_name(data_source_id: str) -> str:
+    return f"data_source_{data_source_id.replace('-', '_')}"
+
+
+class MetricBackfill:
+    def __init__(
+        self,
+        bind: Engine | None = None,
+        max_workers: int | None = None,
+        window_buckets: int = 31,
+        materializer: MetricMaterializer | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.bind = bind or engine
+        self.max_workers = max(1, max_workers or settings.metric_backfill_workers)
+        self.window_buckets = max(1, window_buckets)
+        self.materializer = materializer or MetricMaterializer()
+
+    def run(
+        self,
+        data_source_id: str,
+        start: datetime,
+        end: datetime,
+        period: AggregationType | None = None,
+        table: str | None = None,
+    ) -> dict:
+        with db_session_scope() as session:
+            data_source = PostgresDataSourceRepository(session).get_by_id(data_source_id)
+            if data_source is None:
+                raise ValueError(f"Unknown data source: {data_source_id}")
+            widgets = PostgresWidgetRepository(session).list_by_data_source(data_source_id)
+
+        options = (
+            data_source.config.get("materialization")
+            if isinstance(data_source.config, dict)
+            else None
+        )
+        options = options if isinstance(options, dict) else {}
+        time_column = str(options.get("time_column", "date"))
+        default_period = period or parse_period(options.get("period")) or AggregationType.DAILY
+        table = table or warehouse_table_name(data_source_id)
+
+        targets = self.resolve_targets(widgets, table, time_column, default_period)
+        return {
+            "data_source_id": data_source_id,
+            "table": table,
+            **self.materialize(data_source_id, table, time_column, targets, start, end),
+        }
+
+    def materialize(
+        self,
+        data_source_id: str,
+        table: str,
+        time_column: str,
+        targets: list[MetricTarget],
+        start: datetime,
+        end: datetime,
+    ) -> dict:
+        periods = sorted(
+            {target.period for target in targets if target.period is not None},
+            key=lambda item: item.value,
+        )
+        windows = [
+            (target_period, window_start, window_end)
+            for target_period in periods
+            for window_start, window_end in self.windows(start, end, target_period)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda window: self._compute_window(table, time_column, targets, *window),
+                    windows,
+                )
+            )
+
+        metrics: list[Metric] = []
+        for values in results:
+            metrics.extend(self.materializer.build_period_metrics(data_source_id, targets, values))
+
+        deleted = 0
+        created = 0
+        if targets and windows:
+            with db_session_scope() as session:
+                metric_repo = TimescaleMetricRepository(session)
+                for target_period in periods:
+                    # Each period only clears its own windows and the metric names it rewrites.
+                    period_targets = [
+                        target for target in targets if target.period == target_period
+                    ]
+                    period_windows = [window for window in windows if window[0] == target_period]
+                    range_start = min(window_start for _, window_start, _ in period_windows)
+                    range_end = max(window_end for _, _, window_end in period_windows)
+                    deleted += metric_repo.delete_by_widgets(
+                        sorted({target.widget.id for target in period_targets}),
+                        range_start.to_pydatetime(),
+                        (range_end - pd.Timedelta(microseconds=1)).to_pydatetime(),
+                        sorted({target.metric_name for target in period_targets}),
+                    )
+                created = metric_repo.create_many(metrics)
+
+        return {"windows": len(windows), "metrics_deleted": deleted, "metrics_generated": created}
+
+    def resolve_targets(
+        self,
+        widgets: list[Widget],
+        table: str,
+        time_column: str,
+        default_period: AggregationType,
+    ) -> list[MetricTarget]:
+        if not widgets:
+            return []
+        sample = pd.read_sql(text(f"SELECT * FROM {self._quote(table)} LIMIT 1000"), self.bind)
+        return [
+            target
+            for target in self.materializer.resolve_targets(
+                widgets, sample, time_column, default_period
+            )
+            if target.period is not None
+        ]
+
+    def windows(
+        self,
+        start: datetime,
+        end: datetime,
+        period: AggregationType,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        buckets = pd.period_range(
+            start=pd.Timestamp(start), end=pd.Timestamp(end), freq=PERIOD_FREQUENCIES[period]
+        )
+        windows = []
+        for offset in range(0, len(buckets), self.window_buckets):
+            group = buckets[offset : offset + self.window_buckets]
+            windows.append((group[0].start_time, (group[-1] + 1).start_time))
+        return windows
+
+    def _compute_window(
+        self,
+        table: str,
+        time_column: str,
+        targets: list[MetricTarget],
+        period: AggregationType,
+        window_start: pd.Timestamp,
+        window_end: pd.Timestamp,
+    ) -> dict:
+        query = text(
+            f"SELECT * FROM {self._quote(table)} "
+            f"WHERE {self._quote(time_column)} >= :window_start AND {self._quote(time_column)} < :window_end"
+        ).bindparams(
+            bindparam("window_start", type_=DateTime()), bindparam("window_end", type_=DateTime())
+        )
+        frame = pd.read_sql(
+            query,
+            self.bind,
+            params={
+                "window_start": window_start.to_pydatetime(),
+                "window_end": window_end.to_pydatetime(),
+            },
+            parse_dates=[time_column],
+        )
+        if frame.empty:
+            return {}
+        period_targets = [target for target in targets if target.period == period]
+        return self.materializer.compute_periods(frame, period_targets, time_column)
+
+    def _quote(self, identifier: str) -> str:
+        return self.bind.dialect.identifier_preparer.quote(identifier)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from src.infrastructure.persistence import db_session_scope
+from src.infrastructure.persistence.repositories import PostgresETLJobRepository
+
+CHECKPOINT_STAGES = ("extracted", "transformed", "loaded")
+
+
+class StageCheckpoint:
+    def __init__(
+        self,
+        job_id: str,
+        root: str | Path,
+        stage: str | None = None,
+        cursor: dict | None = None,
+    ) -> None:
+        self.job_id = job_id
+        self.directory = Path(root) / job_id
+        self.stage = stage
+        self.cursor = dict(cursor or {})
+
+    @property
+    def resumed(self) -> bool:
+        return self.stage is not None or bool(self.cursor)
+
+    def reached(self, stage: str) -> bool:
+        if self.stage is None:
+            return False
+        return CHECKPOINT_STAGES.index(self.stage) >= CHECKPOINT_STAGES.index(stage)
+
+    def write(self, name: str, dataframe: pd.DataFrame) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(name)
+        # A retry must never read a half-written artifact, so the file is renamed into place.
+        partial_path = path.with_suffix(".parquet.partial")
+        dataframe.to_parquet(partial_path, index=False)
+        partial_path.replace(path)
+
+    def read(self, name: str) -> pd.DataFrame:
+        return pd.read_parquet(self._path(name))
+
+    def advance(self, stage: str | None = None, **cursor) -> None:
+        if stage is not None:
+            self.stage = stage
+        self.cursor.update(cursor)
+        with db_session_scope() as session:
+            PostgresETLJobRepository(session).update_stage(self.job_id, self.stage, self.cursor)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def chunk_name(name: str, index: int) -> str:
+        return f"{name}-{index:06d}"
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.parquet"
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from src.infrastructure.monitoring.logger import get_logger
+
+logger = get_logger()
+
+STAGING_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def staged_parquet_path(csv_path: Path) -> Path:
+    return csv_path.with_suffix(".parquet")
+
+
+def stage_csv_as_parquet(
+    csv_path: Path,
+    delimiter: str = ",",
+    column_names: list[str] | None = None,
+) -> Path | None:
+    target_path = staged_parquet_path(csv_path)
+    try:
+        reader = pa_csv.open_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(
+                block_size=STAGING_BLOCK_SIZE, column_names=column_names
+            ),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        )
+        with pq.ParquetWriter(target_path, reader.schema, compression="zstd") as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+    except Exception as exc:
+        # Columns whose inferred type changes after the first block cannot be staged; syncs keep using the CSV.
+        target_path.unlink(missing_ok=True)
+        logger.warning("csv_parquet_staging_failed", filepath=str(csv_path), error=str(exc))
+        return None
+    return target_path
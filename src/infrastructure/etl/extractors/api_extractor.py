@@ -1,20 +1,37 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pandas as pd
 
 from src.infrastructure.connectors import RestAPIConnector
 from src.infrastructure.etl.extractors.base_extractor import BaseExtractor
+from src.infrastructure.etl.fingerprint import hash_payload
 
 
 class APIExtractor(BaseExtractor):
     def __init__(self, connector: RestAPIConnector | None = None) -> None:
         self.connector = connector or RestAPIConnector()
+        self._prefetched: tuple[str, Any] | None = None
 
-    def extract(self, config: dict) -> pd.DataFrame:
+    def fingerprint(self, config: dict) -> str | None:
+        # The payload has to be fetched to hash it, so it is kept for the extract that follows.
         payload = self.connector.fetch(config)
+        self._prefetched = (hash_payload(config), payload)
+        return hash_payload(payload)
+
+    def extract(self, config: dict) -> pd.DataFrame:
+        payload = self._fetch(config)
         if isinstance(payload, dict):
             records = payload.get("data")
             if isinstance(records, list):
                 return pd.DataFrame(records)
             return pd.DataFrame([payload])
         return pd.DataFrame(payload)
+
+    def _fetch(self, config: dict) -> Any:
+        if self._prefetched is not None and self._prefetched[0] == hash_payload(config):
+            payload = self._prefetched[1]
+            self._prefetched = None
+            return payload
+        return self.connector.fetch(config)
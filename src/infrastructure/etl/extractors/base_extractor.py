@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 import pandas as pd
 
@@ -9,3 +10,23 @@ class BaseExtractor(ABC):
     @abstractmethod
     def extract(self, config: dict) -> pd.DataFrame:
         raise NotImplementedError
+
+    def fingerprint(self, config: dict) -> str | None:
+        return None
+
+    def extract_chunks(self, config: dict, chunk_size: int) -> Iterator[pd.DataFrame]:
+        dataframe = self.extract(config)
+        for start in range(0, len(dataframe.index), chunk_size):
+            yield dataframe.iloc[start : start + chunk_size]
+
+    def resume_chunks(
+        self, config: dict, chunk_size: int, skip_rows: int
+    ) -> Iterator[pd.DataFrame]:
+        # The first skip_rows rows were extracted by an earlier attempt and are replayed from its
+        # checkpoint; extractors that can seek override this to avoid reading them again.
+        for chunk in self.extract_chunks(config, chunk_size):
+            if skip_rows >= len(chunk.index):
+                skip_rows -= len(chunk.index)
+                continue
+            yield chunk.iloc[skip_rows:]
+            skip_rows = 0
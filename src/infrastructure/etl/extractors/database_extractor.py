@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pandas as pd
 
 from src.infrastructure.connectors import SQLConnector
 from src.infrastructure.etl.extractors.base_extractor import BaseExtractor
+from src.infrastructure.etl.fingerprint import hash_payload
+from src.infrastructure.etl.watermark import decode_watermark
+from src.infrastructure.persistence.safe_query import SafeQueryExecutor
 
 
 class DatabaseExtractor(BaseExtractor):
@@ -11,5 +16,47 @@ class DatabaseExtractor(BaseExtractor):
         self.connector = connector or SQLConnector()
 
     def extract(self, config: dict) -> pd.DataFrame:
-        rows = self.connector.fetch(config)
-        return pd.DataFrame(rows)
+        return self.connector.fetch_dataframe(self.build_incremental_config(config))
+
+    def extract_chunks(self, config: dict, chunk_size: int) -> Iterator[pd.DataFrame]:
+        yield from self.connector.fetch_batches(
+            self.build_incremental_config(config), batch_size=chunk_size
+        )
+
+    def fingerprint(self, config: dict) -> str | None:
+        change_column = config.get("change_column") or (config.get("incremental") or {}).get(
+            "cursor_column"
+        )
+        if not change_column:
+            return None
+        change_column = SafeQueryExecutor.validate_identifier(str(change_column))
+        base_query = str(config["query"]).strip().rstrip(";")
+        probe = {
+            **config,
+            "query": (
+                f"SELECT COUNT(*) AS row_count, MAX({change_column}) AS change_mark "
+                f"FROM ({base_query}) AS fingerprint_source"
+            ),
+        }
+        return hash_payload(self.connector.fetch(probe))
+
+    @staticmethod
+    def build_incremental_config(config: dict) -> dict:
+        incremental = config.get("incremental")
+        if not incremental:
+            return config
+
+        cursor_column = SafeQueryExecutor.validate_identifier(
+            str(incremental.get("cursor_column", ""))
+        )
+        base_query = str(config["query"]).strip().rstrip(";")
+        query = f"SELECT * FROM ({base_query}) AS incremental_source"
+        params = dict(config.get("params", {}))
+
+        watermark = decode_watermark(incremental.get("watermark"))
+        if watermark is not None:
+            query += f" WHERE {cursor_column} > :incremental_watermark"
+            params["incremental_watermark"] = watermark
+        query += f" ORDER BY {cursor_column}"
+
+        return {**config, "query": query, "params": params}
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pandas as pd
 
 from src.infrastructure.etl.extractors.base_extractor import BaseExtractor
+from src.infrastructure.etl.fingerprint import hash_payload
 
 
 class GoogleSheetsExtractor(BaseExtractor):
@@ -10,3 +11,6 @@ class GoogleSheetsExtractor(BaseExtractor):
         # Lightweight fallback: accept injected rows from config when gspread is not configured.
         rows = config.get("rows", [])
         return pd.DataFrame(rows)
+
+    def fingerprint(self, config: dict) -> str | None:
+        return hash_payload(config.get("rows", []))
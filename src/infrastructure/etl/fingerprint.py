@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+# Keys the pipeline writes into a source config at run time; they do not describe the source.
+RUNTIME_CONFIG_KEYS = {"watermark"}
+
+
+def hash_file(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def hash_payload(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def source_fingerprint(source_type: str, config: dict, content_fingerprint: str) -> str:
+    # The config is part of the fingerprint so that editing a source always triggers a full run.
+    return hash_payload(
+        {
+            "source_type": source_type,
+            "config": _strip_runtime_keys(config),
+            "content": content_fingerprint,
+        }
+    )
+
+
+def _strip_runtime_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _strip_runtime_keys(item)
+            for key, item in value.items()
+            if key not in RUNTIME_CONFIG_KEYS
+        }
+    if isinstance(value, list):
+        return [_strip_runtime_keys(item) for item in value]
+    return value
@@ -1,13 +1,195 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+
 import pandas as pd
+import pyarrow as pa
 
-from src.infrastructure.cache import cache_service
+from src.infrastructure.cache import RedisCacheService, cache_service
 from src.infrastructure.etl.loaders.base_loader import BaseLoader
+from src.infrastructure.monitoring.logger import get_logger
+from src.shared.config import get_settings
+from src.shared.utils import generate_uuid
+
+logger = get_logger()
+
+SNAPSHOT_FORMAT = "arrow-ipc-zstd"
+# Chunks of an unpublished snapshot must outlive the run that writes them; publish() sets the
+# real TTL, and this one only cleans up after runs that never publish.
+PENDING_CHUNK_TTL = 24 * 60 * 60
+
+
+@dataclass(slots=True)
+class CacheSnapshot:
+    destination: str
+    snapshot_id: str
+    columns: list[str] | None = None
+    rows: int = 0
+    source_rows: int = 0
+    bytes: int = 0
+    truncated: bool = False
+    failed: bool = False
+    chunks: list[dict] = field(default_factory=list)
 
 
 class CacheLoader(BaseLoader):
+    def __init__(
+        self,
+        cache: RedisCacheService | None = None,
+        chunk_rows: int | None = None,
+        max_bytes: int | None = None,
+        ttl: int = 300,
+    ) -> None:
+        settings = get_settings()
+        self.cache = cache or cache_service
+        self.chunk_rows = max(1, chunk_rows or settings.cache_snapshot_chunk_rows)
+        self.max_bytes = max_bytes if max_bytes is not None else settings.cache_snapshot_max_bytes
+        self.ttl = ttl
+        self._write_options = pa.ipc.IpcWriteOptions(compression="zstd")
+
     def load(self, dataframe: pd.DataFrame, destination: str) -> int:
-        rows = dataframe.to_dict(orient="records")
-        cache_service.set(destination, rows, ttl=300)
-        return len(rows)
+        snapshot = self.begin(destination)
+        self.append(snapshot, dataframe)
+        return self.publish(snapshot)
+
+    def begin(self, destination: str) -> CacheSnapshot:
+        return CacheSnapshot(destination=destination, snapshot_id=generate_uuid())
+
+    def append(self, snapshot: CacheSnapshot, dataframe: pd.DataFrame) -> None:
+        # Streaming runs append every chunk; the previous snapshot stays readable until publish.
+        if snapshot.failed:
+            return
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+            logger.warning(
+                "cache_snapshot_encoding_failed", destination=snapshot.destination, error=str(exc)
+            )
+            snapshot.failed = True
+            return
+
+        table = table.replace_schema_metadata(None)
+        if snapshot.columns is None:
+            snapshot.columns = table.column_names
+        snapshot.source_rows += table.num_rows
+        if snapshot.truncated:
+            return
+        if table.column_names != snapshot.columns:
+            logger.warning(
+                "cache_snapshot_columns_changed",
+                destination=snapshot.destination,
+                columns=table.column_names,
+            )
+            snapshot.truncated = True
+            return
+
+        for offset in range(0, table.num_rows, self.chunk_rows):
+            chunk = table.slice(offset, self.chunk_rows)
+            index = len(snapshot.chunks)
+            # Each column of each chunk is its own key, so readers only fetch what they select.
+            values = {
+                self._chunk_key(
+                    snapshot.destination, snapshot.snapshot_id, index, position
+                ): self._encode(chunk.select([position]))
+                for position in range(table.num_columns)
+            }
+            chunk_bytes = sum(len(value) for value in values.values())
+            if self.max_bytes and snapshot.bytes + chunk_bytes > self.max_bytes:
+                snapshot.truncated = True
+                return
+            self.cache.set_many_bytes(values, ttl=max(self.ttl, PENDING_CHUNK_TTL))
+            snapshot.bytes += chunk_bytes
+            snapshot.chunks.append(
+                {"index": index, "offset": snapshot.rows, "rows": chunk.num_rows}
+            )
+            snapshot.rows += chunk.num_rows
+
+    def publish(self, snapshot: CacheSnapshot) -> int:
+        if snapshot.failed or snapshot.columns is None:
+            return 0
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "snapshot_id": snapshot.snapshot_id,
+            "columns": snapshot.columns,
+            "rows": snapshot.rows,
+            "source_rows": snapshot.source_rows,
+            "bytes": snapshot.bytes,
+            "truncated": snapshot.truncated,
+            "chunks": snapshot.chunks,
+        }
+        if snapshot.truncated:
+            logger.warning(
+                "cache_snapshot_truncated",
+                destination=snapshot.destination,
+                rows=snapshot.rows,
+                source_rows=snapshot.source_rows,
+            )
+        chunk_keys = [
+            self._chunk_key(snapshot.destination, snapshot.snapshot_id, chunk["index"], position)
+            for chunk in snapshot.chunks
+            for position in range(len(snapshot.columns))
+        ]
+        self.cache.set_with_expiry(snapshot.destination, manifest, chunk_keys, ttl=self.ttl)
+        return snapshot.rows
+
+    def read(
+        self,
+        destination: str,
+        columns: list[str] | None = None,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> pd.DataFrame | None:
+        manifest = self.cache.get(destination)
+        if not isinstance(manifest, dict) or manifest.get("format") != SNAPSHOT_FORMAT:
+            return None
+
+        available = manifest["columns"]
+        selected = (
+            available if columns is None else [column for column in columns if column in available]
+        )
+        positions = [available.index(column) for column in selected]
+        stop = manifest["rows"] if stop is None else min(stop, manifest["rows"])
+        chunks = [
+            chunk
+            for chunk in manifest["chunks"]
+            if chunk["offset"] < stop and chunk["offset"] + chunk["rows"] > start
+        ]
+        if not chunks or not positions:
+            return pd.DataFrame(columns=selected)
+
+        keys = [
+            self._chunk_key(destination, manifest["snapshot_id"], chunk["index"], position)
+            for chunk in chunks
+            for position in positions
+        ]
+        payloads = [payload for payload in self.cache.get_many_bytes(keys) if payload is not None]
+        if len(payloads) != len(keys):
+            return None
+
+        tables = []
+        for chunk_number, chunk in enumerate(chunks):
+            chunk_payloads = payloads[
+                chunk_number * len(positions) : (chunk_number + 1) * len(positions)
+            ]
+            columns_table = pa.Table.from_arrays(
+                [self._decode(payload).column(0) for payload in chunk_payloads], names=selected
+            )
+            local_start = max(start - chunk["offset"], 0)
+            local_stop = min(stop - chunk["offset"], chunk["rows"])
+            tables.append(columns_table.slice(local_start, local_stop - local_start))
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+    def _encode(self, table: pa.Table) -> bytes:
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema, options=self._write_options) as writer:
+            writer.write_table(table)
+        payload: bytes = sink.getvalue().to_pybytes()
+        return payload
+
+    @staticmethod
+    def _decode(payload: bytes) -> pa.Table:
+        return pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+
+    @staticmethod
+    def _chunk_key(destination: str, snapshot_id: str, chunk: int, position: int) -> str:
+        return f"{destination}:{snapshot_id}:{chunk}:{position}"
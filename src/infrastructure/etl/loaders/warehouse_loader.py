@@ -1,12 +1,265 @@
 from __future__ import annotations
 
+import csv
+import io
+from collections.abc import Iterable
+from typing import Any, Literal
+from uuid import uuid4
+
 import pandas as pd
+from sqlalchemy import BigInteger, Float, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.types import TypeEngine
 
 from src.infrastructure.etl.loaders.base_loader import BaseLoader
 from src.infrastructure.persistence.database import engine
+from src.infrastructure.persistence.safe_query import SafeQueryExecutor
+
+COPY_NULL_MARKER = r"\N"
+STAGED_ROW_COLUMN = "__staged_row"
+
+
+def _quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def copy_from_stdin(table: Any, conn: Any, keys: list[str], data_iter: Iterable[tuple]) -> int:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    rows = 0
+    for row in data_iter:
+        writer.writerow(COPY_NULL_MARKER if value is None else value for value in row)
+        rows += 1
+    buffer.seek(0)
+
+    target = _quote_identifier(table.name)
+    if table.schema:
+        target = f"{_quote_identifier(table.schema)}.{target}"
+    columns = ", ".join(_quote_identifier(key) for key in keys)
+    statement = f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL_MARKER}')"
+
+    cursor = conn.connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            cursor.copy_expert(statement, buffer)
+        else:
+            with cursor.copy(statement) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+    return rows
 
 
 class WarehouseLoader(BaseLoader):
+    LOAD_MODES = {"append", "replace", "merge"}
+
+    def __init__(self, bind: Engine | None = None, batch_size: int = 50_000) -> None:
+        self.bind = bind or engine
+        self.batch_size = batch_size
+
     def load(self, dataframe: pd.DataFrame, destination: str) -> int:
-        dataframe.to_sql(destination, engine, if_exists="append", index=False)
-        return len(dataframe.index)
+        with self.open(destination) as writer:
+            return writer.write(dataframe)
+
+    def open(
+        self,
+        destination: str,
+        mode: str = "append",
+        key_columns: list[str] | None = None,
+        deferred: bool = False,
+    ) -> WarehouseTableWriter:
+        if mode not in self.LOAD_MODES:
+            raise ValueError(f"Unsupported load mode: {mode}")
+        if mode == "merge" and not key_columns:
+            raise ValueError("Merge load mode requires key_columns")
+        return WarehouseTableWriter(self, destination, mode, list(key_columns or []), deferred)
+
+    def write_frame(
+        self,
+        dataframe: pd.DataFrame,
+        destination: str,
+        if_exists: Literal["fail", "replace", "append"] = "append",
+    ) -> None:
+        # PostgreSQL receives each batch through COPY FROM STDIN; other dialects fall back to batched executemany.
+        method = copy_from_stdin if self.bind.dialect.name == "postgresql" else None
+        dataframe.to_sql(
+            destination,
+            self.bind,
+            if_exists=if_exists,
+            index=False,
+            chunksize=self.batch_size,
+            method=method,
+            dtype=self._widened_column_types(dataframe),
+        )
+
+    @staticmethod
+    def _widened_column_types(dataframe: pd.DataFrame) -> dict[str, TypeEngine[Any]]:
+        # Downcast frames must not create narrow warehouse columns that a later, wider sync would overflow.
+        column_types: dict[str, TypeEngine[Any]] = {}
+        for column, dtype in dataframe.dtypes.items():
+            if dtype.kind in {"i", "u"}:
+                column_types[column] = BigInteger()
+            elif dtype == "float32":
+                column_types[column] = Float(precision=53)
+        return column_types
+
+
+class WarehouseTableWriter:
+    def __init__(
+        self,
+        loader: WarehouseLoader,
+        destination: str,
+        mode: str,
+        key_columns: list[str],
+        deferred: bool = False,
+    ) -> None:
+        self.loader = loader
+        self.bind = loader.bind
+        self.destination = SafeQueryExecutor.validate_identifier(destination)
+        # A per-run suffix keeps concurrent runs against one table from sharing a staging table.
+        self.staging = f"{self.destination[:40]}__staging_{uuid4().hex[:12]}"
+        self.mode = mode
+        self.key_columns = key_columns
+        # Deferred append and merge writers hold every chunk in staging until finish().
+        self.deferred = deferred and mode != "replace"
+        self._staged = False
+        self._staged_rows = 0
+        self._template: pd.DataFrame | None = None
+
+    def __enter__(self) -> WarehouseTableWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.finish()
+        elif self.mode != "append" or self.deferred:
+            self._drop_staging()
+
+    @property
+    def discards_on_failure(self) -> bool:
+        return self.mode == "replace" or self.deferred
+
+    def write(self, dataframe: pd.DataFrame) -> int:
+        if self.mode == "append" and not self.deferred:
+            self.loader.write_frame(dataframe, self.destination)
+            return len(dataframe.index)
+
+        if self.mode in {"replace", "append"}:
+            self.loader.write_frame(dataframe, self.staging)
+            self._stage(dataframe)
+            return len(dataframe.index)
+
+        missing = [column for column in self.key_columns if column not in dataframe.columns]
+        if missing:
+            raise ValueError(f"Merge key columns not found in data: {', '.join(missing)}")
+        # ON CONFLICT cannot touch the same row twice in one statement, so keep the last version of each key.
+        deduplicated = dataframe.drop_duplicates(subset=self.key_columns, keep="last")
+        if self.deferred:
+            # The running row number decides which chunk's version of a key wins at finish().
+            rows = range(self._staged_rows, self._staged_rows + len(deduplicated.index))
+            self.loader.write_frame(deduplicated.assign(**{STAGED_ROW_COLUMN: rows}), self.staging)
+            self._stage(deduplicated)
+            return len(deduplicated.index)
+        self.loader.write_frame(deduplicated, self.staging, if_exists="replace")
+        self._merge_staging(list(deduplicated.columns), deduplicated.head(0))
+        return len(deduplicated.index)
+
+    def finish(self) -> None:
+        if self.mode == "replace" and not self._staged:
+            # An empty extract still replaces the table's contents; the existing schema is kept.
+            if inspect(self.bind).has_table(self.destination):
+                with self.bind.begin() as conn:
+                    conn.execute(text(f"DELETE FROM {_quote_identifier(self.destination)}"))
+        elif self.mode == "replace":
+            with self.bind.begin() as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS {_quote_identifier(self.destination)}"))
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {_quote_identifier(self.staging)} RENAME TO {_quote_identifier(self.destination)}"
+                    )
+                )
+        elif self.mode == "merge":
+            if self.deferred and self._template is not None:
+                self._merge_staging(list(self._template.columns), self._template, ranked=True)
+            self._drop_staging()
+        elif self.deferred and self._template is not None:
+            if not inspect(self.bind).has_table(self.destination):
+                self.loader.write_frame(self._template, self.destination)
+            column_list = ", ".join(_quote_identifier(column) for column in self._template.columns)
+            with self.bind.begin() as conn:
+                conn.execute(
+                    text(
+                        f"INSERT INTO {_quote_identifier(self.destination)} ({column_list}) "
+                        f"SELECT {column_list} FROM {_quote_identifier(self.staging)}"
+                    )
+                )
+            self._drop_staging()
+
+    def _stage(self, dataframe: pd.DataFrame) -> None:
+        self._staged = True
+        self._staged_rows += len(dataframe.index)
+        if self._template is None:
+            self._template = dataframe.head(0)
+
+    def _merge_staging(
+        self, columns: list[str], empty_frame: pd.DataFrame, ranked: bool = False
+    ) -> None:
+        if not inspect(self.bind).has_table(self.destination):
+            self.loader.write_frame(empty_frame, self.destination)
+
+        destination = _quote_identifier(self.destination)
+        keys = ", ".join(_quote_identifier(column) for column in self.key_columns)
+        column_list = ", ".join(_quote_identifier(column) for column in columns)
+        updates = [column for column in columns if column not in self.key_columns]
+        if updates:
+            conflict_action = "DO UPDATE SET " + ", ".join(
+                f"{_quote_identifier(column)} = excluded.{_quote_identifier(column)}"
+                for column in updates
+            )
+        else:
+            conflict_action = "DO NOTHING"
+
+        source, condition = _quote_identifier(self.staging), "true"
+        if ranked:
+            # Deferred chunks can repeat a key; only the most recently staged version is merged.
+            source = (
+                f"(SELECT {column_list}, ROW_NUMBER() OVER (PARTITION BY {keys} "
+                f"ORDER BY {_quote_identifier(STAGED_ROW_COLUMN)} DESC) AS staged_rank "
+                f"FROM {source}) AS ranked"
+            )
+            condition = "staged_rank = 1"
+
+        index_name = f"ux_{self.destination}_merge_keys"
+        with self.bind.begin() as conn:
+            indexes = {index["name"] for index in inspect(conn).get_indexes(self.destination)}
+            if index_name not in indexes:
+                self._check_unique_keys(conn, destination, keys)
+                conn.execute(
+                    text(
+                        f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote_identifier(index_name)} "
+                        f"ON {destination} ({keys})"
+                    )
+                )
+            # WHERE keeps SQLite from parsing ON CONFLICT as part of the SELECT's join clause.
+            conn.execute(
+                text(
+                    f"INSERT INTO {destination} ({column_list}) "
+                    f"SELECT {column_list} FROM {source} WHERE {condition} "
+                    f"ON CONFLICT ({keys}) {conflict_action}"
+                )
+            )
+
+    def _check_unique_keys(self, conn: Connection, destination: str, keys: str) -> None:
+        duplicate = conn.execute(
+            text(f"SELECT 1 FROM {destination} GROUP BY {keys} HAVING COUNT(*) > 1 LIMIT 1")
+        ).first()
+        if duplicate is not None:
+            raise ValueError(
+                f"Cannot merge into {self.destination}: existing rows repeat the key columns "
+                f"({', '.join(self.key_columns)}). Deduplicate the table or use replace mode first."
+            )
+
+    def _drop_staging(self) -> None:
+        with self.bind.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {_quote_identifier(self.staging)}"))
+        self._staged = False
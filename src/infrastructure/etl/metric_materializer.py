@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities import Metric, Widget
+from src.domain.enums import AggregationType, MetricType
+from src.domain.value_objects import MetricValue
+from src.infrastructure.etl.running_aggregate import RunningAggregate, RunningPeriodAggregate
+from src.infrastructure.persistence.rollups import QuantileSketch, naive_utc
+from src.shared.utils import generate_uuid
+
+AGGREGATION_ALIASES = {
+    "sum": MetricType.SUM,
+    "total": MetricType.SUM,
+    "avg": MetricType.AVG,
+    "average": MetricType.AVG,
+    "mean": MetricType.AVG,
+    "count": MetricType.COUNT,
+    "min": MetricType.MIN,
+    "max": MetricType.MAX,
+    "percentile": MetricType.PERCENTILE,
+}
+
+PANDAS_AGGREGATIONS = {
+    MetricType.SUM: "sum",
+    MetricType.AVG: "mean",
+    MetricType.COUNT: "count",
+    MetricType.MIN: "min",
+    MetricType.MAX: "max",
+    MetricType.RAW: "last",
+}
+
+PERIOD_FREQUENCIES = {
+    AggregationType.HOURLY: "h",
+    AggregationType.DAILY: "D",
+    AggregationType.WEEKLY: "W",
+    AggregationType.MONTHLY: "M",
+}
+
+
+# Partial buckets from incremental runs combine with stored points only for these types.
+PARTIAL_MERGES: dict[MetricType, Callable[[float, float], float]] = {
+    MetricType.SUM: operator.add,
+    MetricType.COUNT: operator.add,
+    MetricType.MIN: min,
+    MetricType.MAX: max,
+    MetricType.RAW: lambda _, latest: latest,
+}
+
+
+def parse_period(value: object) -> AggregationType | None:
+    try:
+        period = AggregationType(str(value).lower())
+    except ValueError:
+        return None
+    return period if period in PERIOD_FREQUENCIES else None
+
+
+def bucket_starts(timestamps: pd.Series, period: AggregationType) -> pd.Series:
+    frequency = PERIOD_FREQUENCIES[period]
+    if period in {AggregationType.HOURLY, AggregationType.DAILY}:
+        return timestamps.dt.floor(frequency)
+    return timestamps.dt.to_period(frequency).dt.start_time
+
+
+def period_start(timestamp: datetime, period: AggregationType) -> pd.Timestamp:
+    return bucket_starts(pd.Series([pd.Timestamp(timestamp)]), period).iloc[0]
+
+
+@dataclass(frozen=True, slots=True)
+class MetricTarget:
+    widget: Widget
+    column: str
+    metric_type: MetricType
+    metric_name: str
+    period: AggregationType | None = None
+
+    @property
+    def key(self) -> tuple[str, MetricType]:
+        return self.column, self.metric_type
+
+    @property
+    def period_key(self) -> tuple[str, AggregationType | None, MetricType]:
+        return self.column, self.period, self.metric_type
+
+
+class MetricMaterializer:
+    def resolve_targets(
+        self,
+        widgets: list[Widget],
+        dataframe: pd.DataFrame,
+        time_column: str | None = None,
+        default_period: AggregationType | None = None,
+    ) -> list[MetricTarget]:
+        numeric_columns = list(dataframe.select_dtypes(include="number").columns)
+        if not numeric_columns:
+            return []
+
+        dataframe_columns = list(dataframe.columns)
+        targets: list[MetricTarget] = []
+        for widget in widgets:
+            config = widget.config if isinstance(widget.config, dict) else {}
+            column = self._resolve_metric_column(config, numeric_columns, dataframe_columns)
+            if column is None:
+                continue
+            aggregation = str(config.get("aggregation", "sum")).lower()
+            period = parse_period(config["period"]) if config.get("period") else default_period
+            targets.append(
+                MetricTarget(
+                    widget=widget,
+                    column=column,
+                    metric_type=AGGREGATION_ALIASES.get(aggregation, MetricType.RAW),
+                    metric_name=str(config.get("metric") or column),
+                    period=period if time_column and time_column in dataframe_columns else None,
+                )
+            )
+        return targets
+
+    def compute(
+        self, dataframe: pd.DataFrame, targets: list[MetricTarget]
+    ) -> dict[tuple[str, MetricType], float]:
+        requested: dict[str, set[MetricType]] = {}
+        for target in targets:
+            if target.period is not None:
+                continue
+            requested.setdefault(target.column, set()).add(target.metric_type)
+
+        values: dict[tuple[str, MetricType], float] = {}
+        for column, metric_types in requested.items():
+            # Each column is converted once and shared by every widget that reads it.
+            numeric = pd.to_numeric(dataframe[column], errors="coerce").to_numpy(
+                dtype="float64", na_value=np.nan
+            )
+            numeric = numeric[~np.isnan(numeric)]
+            if numeric.size == 0:
+                continue
+            for metric_type, value in self.aggregate_array(numeric, metric_types).items():
+                values[(column, metric_type)] = value
+        return values
+
+    def compute_periods(
+        self,
+        dataframe: pd.DataFrame,
+        targets: list[MetricTarget],
+        time_column: str,
+    ) -> dict[tuple[str, AggregationType | None, MetricType], pd.Series]:
+        requested: dict[tuple[str, AggregationType], set[MetricType]] = {}
+        for target in targets:
+            if target.period is not None:
+                requested.setdefault((target.column, target.period), set()).add(target.metric_type)
+        if not requested:
+            return {}
+
+        timestamps = pd.to_datetime(dataframe[time_column], errors="coerce")
+        buckets = {period: bucket_starts(timestamps, period) for _, period in requested}
+        numeric_columns = {
+            column: pd.to_numeric(dataframe[column], errors="coerce") for column, _ in requested
+        }
+
+        values: dict[tuple[str, AggregationType | None, MetricType], pd.Series] = {}
+        for (column, period), metric_types in requested.items():
+            frame = pd.DataFrame(
+                {"bucket": buckets[period], "value": numeric_columns[column]}
+            ).dropna()
+            if frame.empty:
+                continue
+            grouped = frame.groupby("bucket", sort=True)["value"]
+            functions = sorted(
+                {PANDAS_AGGREGATIONS[item] for item in metric_types if item in PANDAS_AGGREGATIONS}
+            )
+            aggregated = grouped.agg(functions) if functions else pd.DataFrame()
+            for metric_type in metric_types:
+                if metric_type == MetricType.PERCENTILE:
+                    values[(column, period, metric_type)] = grouped.quantile(0.95)
+                else:
+                    values[(column, period, metric_type)] = aggregated[
+                        PANDAS_AGGREGATIONS[metric_type]
+                    ]
+        return values
+
+    @staticmethod
+    def aggregate_array(
+        values: np.ndarray, metric_types: set[MetricType]
+    ) -> dict[MetricType, float]:
+        results: dict[MetricType, float] = {}
+        if metric_types & {MetricType.SUM, MetricType.AVG}:
+            total = float(values.sum())
+            if MetricType.SUM in metric_types:
+                results[MetricType.SUM] = total
+            if MetricType.AVG in metric_types:
+                results[MetricType.AVG] = total / values.size
+        if MetricType.COUNT in metric_types:
+            results[MetricType.COUNT] = float(values.size)
+        if MetricType.MIN in metric_types:
+            results[MetricType.MIN] = float(values.min())
+        if MetricType.MAX in metric_types:
+            results[MetricType.MAX] = float(values.max())
+        if MetricType.PERCENTILE in metric_types:
+            results[MetricType.PERCENTILE] = float(np.quantile(values, 0.95))
+        if MetricType.RAW in metric_types:
+            results[MetricType.RAW] = float(values[-1])
+        return results
+
+    @staticmethod
+    def build_metrics(
+        data_source_id: str,
+        targets: list[MetricTarget],
+        values: Mapping[tuple[str, MetricType], float | None],
+        timestamp: datetime,
+    ) -> list[Metric]:
+        metrics: list[Metric] = []
+        for target in targets:
+            value = values.get(target.key)
+            if value is None:
+                continue
+            metrics.append(
+                Metric(
+                    id=generate_uuid(),
+                    widget_id=target.widget.id,
+                    metric_name=target.metric_name,
+                    metric_value=MetricValue(value),
+                    metric_type=target.metric_type,
+                    timestamp=timestamp,
+                    dimensions={"data_source_id": data_source_id},
+                )
+            )
+        return metrics
+
+    @staticmethod
+    def build_period_metrics(
+        data_source_id: str,
+        targets: list[MetricTarget],
+        values: dict[tuple[str, AggregationType | None, MetricType], pd.Series],
+    ) -> list[Metric]:
+        metrics: list[Metric] = []
+        for target in targets:
+            series = values.get(target.period_key)
+            if target.period is None or series is None:
+                continue
+            dimensions = {"data_source_id": data_source_id, "period": target.period.value}
+            for bucket, value in series.items():
+                metrics.append(
+                    Metric(
+                        id=generate_uuid(),
+                        widget_id=target.widget.id,
+                        metric_name=target.metric_name,
+                        metric_value=MetricValue(float(value)),
+                        metric_type=target.metric_type,
+                        timestamp=pd.Timestamp(bucket).to_pydatetime(),
+                        dimensions=dimensions,
+                    )
+                )
+        return metrics
+
+    @staticmethod
+    def merge_period_metrics(stored: list[Metric], partial: list[Metric]) -> list[Metric]:
+        merged = {
+            (metric.widget_id, metric.metric_name, naive_utc(metric.timestamp)): metric
+            for metric in stored
+            if metric.timestamp is not None
+        }
+        for metric in partial:
+            if metric.timestamp is None:
+                continue
+            key = (metric.widget_id, metric.metric_name, naive_utc(metric.timestamp))
+            previous = merged.get(key)
+            if previous is not None and previous.metric_type == metric.metric_type:
+                combine = PARTIAL_MERGES[metric.metric_type]
+                value = combine(previous.value_as_float, metric.value_as_float)
+                metric = replace(metric, metric_value=MetricValue(value))
+            merged[key] = metric
+        return list(merged.values())
+
+    @staticmethod
+    def _resolve_metric_column(
+        config: dict, numeric_columns: list[str], dataframe_columns: list[str]
+    ) -> str | None:
+        config_metric = config.get("metric")
+        if isinstance(config_metric, str) and config_metric in dataframe_columns:
+            return config_metric
+
+        if numeric_columns:
+            return numeric_columns[0]
+
+        return None
+
+
+class MetricAccumulator:
+    def __init__(
+        self,
+        materializer: MetricMaterializer,
+        widgets: list[Widget],
+        time_column: str | None = None,
+        default_period: AggregationType | None = None,
+    ) -> None:
+        self.materializer = materializer
+        self.widgets = widgets
+        self.time_column = time_column
+        self.default_period = default_period
+        self.targets: list[MetricTarget] | None = None
+        self._aggregates: dict[str, RunningAggregate] = {}
+        self._period_aggregates: dict[tuple[str, AggregationType], RunningPeriodAggregate] = {}
+
+    def update(self, dataframe: pd.DataFrame) -> None:
+        if self.targets is None:
+            if dataframe.empty:
+                return
+            self._resolve(dataframe)
+
+        for column, aggregate in self._aggregates.items():
+            if column in dataframe.columns:
+                aggregate.update(dataframe[column])
+
+        if self._period_aggregates and self.time_column in dataframe.columns:
+            timestamps = pd.to_datetime(dataframe[self.time_column], errors="coerce")
+            buckets: dict[AggregationType, pd.Series] = {}
+            for (column, period), period_aggregate in self._period_aggregates.items():
+                if column not in dataframe.columns:
+                    continue
+                if period not in buckets:
+                    buckets[period] = bucket_starts(timestamps, period)
+                period_aggregate.update(buckets[period], dataframe[column])
+
+    def snapshot_values(self) -> dict[tuple[str, MetricType], float | None]:
+        return {
+            target.key: self._aggregates[target.column].result(target.metric_type)
+            for target in self.targets or []
+            if target.period is None
+        }
+
+    def period_values(self) -> dict[tuple[str, AggregationType | None, MetricType], pd.Series]:
+        values = {}
+        for target in self.targets or []:
+            if target.period is None:
+                continue
+            series = self._period_aggregates[(target.column, target.period)].result(
+                target.metric_type
+            )
+            if series is not None:
+                values[target.period_key] = series
+        return values
+
+    def _resolve(self, dataframe: pd.DataFrame) -> None:
+        self.targets = self.materializer.resolve_targets(
+            self.widgets, dataframe, self.time_column, self.default_period
+        )
+        for target in self.targets:
+            percentile = target.metric_type == MetricType.PERCENTILE
+            if target.period is None:
+                aggregate = self._aggregates.setdefault(target.column, RunningAggregate())
+                if percentile and aggregate.sketch is None:
+                    aggregate.sketch = QuantileSketch()
+            else:
+                period_aggregate = self._period_aggregates.setdefault(
+                    (target.column, target.period), RunningPeriodAggregate()
+                )
+                period_aggregate.track_quantiles = period_aggregate.track_quantiles or percentile
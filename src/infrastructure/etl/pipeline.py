@@ -1,19 +1,50 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from datetime import UTC, datetime
+from typing import Any
 
 import pandas as pd
 
-from src.domain.entities import Metric
-from src.domain.enums import MetricType
-from src.domain.value_objects import MetricValue
-from src.infrastructure.etl.extractors import APIExtractor, CSVExtractor, DatabaseExtractor, GoogleSheetsExtractor
+from src.domain.entities import ETLJob, Widget
+from src.domain.enums import AggregationType, MetricType
+from src.domain.exceptions import DataQualityError
+from src.infrastructure.etl.backfill import MetricBackfill
+from src.infrastructure.etl.checkpoints import StageCheckpoint
+from src.infrastructure.etl.extractors import (
+    APIExtractor,
+    BaseExtractor,
+    CSVExtractor,
+    DatabaseExtractor,
+    GoogleSheetsExtractor,
+)
+from src.infrastructure.etl.fingerprint import source_fingerprint
 from src.infrastructure.etl.loaders import CacheLoader, WarehouseLoader
-from src.infrastructure.etl.transformers import ETLTransformer
+from src.infrastructure.etl.metric_materializer import (
+    PARTIAL_MERGES,
+    MetricAccumulator,
+    MetricMaterializer,
+    MetricTarget,
+    parse_period,
+)
+from src.infrastructure.etl.quality_checks import DataQualityEngine
+from src.infrastructure.etl.schema_inference import SchemaOptimizer
+from src.infrastructure.etl.transformers import BaseTransformer, ETLTransformer, PolarsTransformer
+from src.infrastructure.etl.watermark import column_high_water_mark, encode_watermark
+from src.infrastructure.monitoring.logger import get_logger
+from src.infrastructure.monitoring.profiler import StageProfiler
 from src.infrastructure.persistence import db_session_scope
-from src.infrastructure.persistence.repositories import PostgresWidgetRepository, TimescaleMetricRepository
+from src.infrastructure.persistence.repositories import (
+    PostgresDataQualityCheckRepository,
+    PostgresETLJobRepository,
+    PostgresWidgetRepository,
+    TimescaleMetricRepository,
+)
+from src.shared.config import get_settings
 from src.shared.utils import generate_uuid
 
+logger = get_logger()
+
 
 class ETLPipeline:
     EXTRACTORS = {
@@ -23,10 +54,29 @@ class ETLPipeline:
         "google_sheets": GoogleSheetsExtractor,
     }
 
-    def __init__(self, transformer: ETLTransformer | None = None) -> None:
-        self.transformer = transformer or ETLTransformer()
+    TRANSFORM_ENGINES: dict[str, type[BaseTransformer]] = {
+        "pandas": ETLTransformer,
+        "polars": PolarsTransformer,
+    }
+
+    def __init__(
+        self,
+        transformer: BaseTransformer | None = None,
+        chunk_size: int | None = None,
+        engine: str | None = None,
+        profiler: StageProfiler | None = None,
+    ) -> None:
+        # Transformers built here are closed after each run; callers close the ones they pass in.
+        self._owns_transformer = transformer is None
+        self.engine = engine or get_settings().etl_transform_engine
+        # Without an external profiler every run is still timed per stage for its job record.
+        self._owns_profiler = profiler is None
+        self.profiler = profiler or StageProfiler(trace_allocations=False, sample_interval=0.05)
+        self.transformer = self._attach_profiler(transformer or self._build_transformer(self.engine))
         self.warehouse_loader = WarehouseLoader()
         self.cache_loader = CacheLoader()
+        self.materializer = MetricMaterializer()
+        self.chunk_size = chunk_size if chunk_size is not None else get_settings().etl_chunk_size
 
     def run(
         self,
@@ -34,102 +84,603 @@ class ETLPipeline:
         extract_config: dict,
         destination_table: str,
         data_source_id: str | None = None,
+        force: bool = False,
+        job_id: str | None = None,
     ) -> dict:
         extractor_cls = self.EXTRACTORS.get(source_type)
         if extractor_cls is None:
             raise ValueError(f"Unsupported source type: {source_type}")
+        engine = extract_config.get("engine")
+        if engine and self._owns_transformer and engine != self.engine:
+            # A source's own engine wins over the default, like its chunk_size and load options.
+            transformer = self._build_transformer(str(engine))
+            self.transformer.close()
+            self.engine = str(engine)
+            self.transformer = self._attach_profiler(transformer)
+
+        job = self._start_job(job_id, data_source_id, extract_config) if data_source_id else None
+        if self._owns_profiler:
+            self.profiler.reset()
+            self.profiler.start()
+        try:
+            # Only callers that retry with the same job id (the Celery task) can resume from checkpoints.
+            checkpoint = self._checkpoint(job) if job is not None and job_id else None
+            return self._execute(
+                extractor_cls(), source_type, extract_config, destination_table, job, force, checkpoint
+            )
+        except Exception as exc:
+            if job is not None:
+                # A retry with the same job id may resume from the checkpoint, so it is kept.
+                self.fail_job(job.id, str(exc), final=job_id is None)
+            raise
+        finally:
+            if self._owns_profiler:
+                self.profiler.stop()
+            if self._owns_transformer:
+                self.transformer.close()
+
+    def _build_transformer(self, engine: str) -> BaseTransformer:
+        transformer_cls = self.TRANSFORM_ENGINES.get(engine)
+        if transformer_cls is None:
+            raise ValueError(f"Unsupported transform engine: {engine}")
+        return transformer_cls()
+
+    def _attach_profiler(self, transformer: BaseTransformer) -> BaseTransformer:
+        if hasattr(transformer, "profiler"):
+            transformer.profiler = self.profiler
+        return transformer
+
+    def _execute(
+        self,
+        extractor: BaseExtractor,
+        source_type: str,
+        extract_config: dict,
+        destination_table: str,
+        job: ETLJob | None,
+        force: bool,
+        checkpoint: StageCheckpoint | None,
+    ) -> dict:
+        data_source_id = job.data_source_id if job is not None else None
+        fingerprint = None
+        quality = None
+        last_job = None
+        if job is not None and data_source_id:
+            last_job = self._latest_job(data_source_id)
+            if extract_config.get("incremental"):
+                extract_config = self._with_stored_watermark(extract_config, last_job)
+            if checkpoint is not None and checkpoint.resumed:
+                # The source may have moved since the failed attempt; its artifacts describe the earlier state.
+                fingerprint = checkpoint.cursor.get("fingerprint")
+                logger.info("etl_resuming_from_checkpoint", job_id=job.id, stage=checkpoint.stage)
+            else:
+                with self.profiler.stage("fingerprint"):
+                    fingerprint = self._fingerprint(extractor, source_type, extract_config)
+                last_metadata = (last_job.metadata or {}) if last_job is not None else {}
+                last_fingerprint = last_metadata.get("fingerprint")
+                if fingerprint and fingerprint == last_fingerprint and not force:
+                    result = {
+                        "rows_extracted": 0,
+                        "rows_loaded": 0,
+                        "metrics_generated": 0,
+                        "destination": destination_table,
+                        "status": "unchanged",
+                    }
+                    carried: dict[str, Any] | None = {
+                        key: last_metadata.get(key) for key in ("row_count", "schema")
+                    }
+                    self._record_job(job, extract_config, result, fingerprint, carried)
+                    return result
+                if checkpoint is not None:
+                    checkpoint.cursor["fingerprint"] = fingerprint
+            quality = self._quality_engine(data_source_id, last_job)
+        optimizer = self._schema_optimizer(extract_config, last_job)
+
+        chunk_size = int(extract_config.get("chunk_size") or self.chunk_size or 0)
+        if chunk_size > 0:
+            result = self._run_streaming(
+                extractor,
+                extract_config,
+                destination_table,
+                data_source_id,
+                chunk_size,
+                optimizer,
+                quality,
+                checkpoint,
+            )
+        else:
+            result = self._run_batch(
+                extractor, extract_config, destination_table, data_source_id, optimizer, quality, checkpoint
+            )
+
+        if optimizer is not None:
+            result["memory"] = optimizer.memory_report()
+        if quality is not None:
+            result["quality"] = quality.summary()
+            self._record_quality(quality)
+        if job is not None:
+            carried = {"schema": optimizer.schema} if optimizer is not None else None
+            self._record_job(job, extract_config, result, fingerprint, carried)
+        if checkpoint is not None:
+            checkpoint.clear()
+        return result
+
+    def fail_job(self, job_id: str, error: str, final: bool = True) -> None:
+        with db_session_scope() as session:
+            repo = PostgresETLJobRepository(session)
+            job = repo.get_by_id(job_id)
+            if job is None:
+                return
+            job.status = "failed"
+            job.completed_at = datetime.now(UTC)
+            job.error_message = error
+            job.metadata = {**(job.metadata or {}), **self._run_stats()}
+            if final:
+                # No retry will resume this job, so its cursor and checkpoint files are dropped.
+                job.stage = None
+                job.stage_cursor = None
+            repo.update(job)
+        if final:
+            StageCheckpoint(job_id, get_settings().etl_checkpoint_dir).clear()
+
+    def _run_batch(
+        self,
+        extractor: BaseExtractor,
+        extract_config: dict,
+        destination_table: str,
+        data_source_id: str | None,
+        optimizer: SchemaOptimizer | None = None,
+        quality: DataQualityEngine | None = None,
+        checkpoint: StageCheckpoint | None = None,
+    ) -> dict:
+        with self.profiler.stage("extract") as stage:
+            if checkpoint is not None and checkpoint.reached("extracted"):
+                extracted = checkpoint.read("extracted")
+            else:
+                extracted = extractor.extract(extract_config)
+            stage.output(extracted)
+        if optimizer is not None:
+            with self.profiler.stage("schema") as stage:
+                extracted = optimizer.apply(extracted)
+                stage.output(extracted)
+        if checkpoint is not None and not checkpoint.reached("extracted"):
+            checkpoint.write("extracted", extracted)
+            checkpoint.advance("extracted")
+        if quality is not None:
+            with self.profiler.stage("quality"):
+                quality.update(extracted)
+            if quality.blocking_failures():
+                return self._blocked_result(destination_table, len(extracted.index), 0)
+        high_water_mark = None
+        cursor_column = self._cursor_column(extract_config)
+        if cursor_column:
+            high_water_mark = column_high_water_mark(extracted, cursor_column) if not extracted.empty else None
 
-        extractor = extractor_cls()
-        extracted = extractor.extract(extract_config)
-        transformed = self.transformer.transform(extracted)
-        loaded_rows = self.warehouse_loader.load(transformed, destination_table)
-        self.cache_loader.load(transformed, f"etl:{destination_table}:latest")
+        with self.profiler.stage("transform") as stage:
+            if checkpoint is not None and checkpoint.reached("transformed"):
+                transformed = checkpoint.read("transformed")
+            else:
+                transformed = self.transformer.transform(extracted)
+                if checkpoint is not None:
+                    checkpoint.write("transformed", transformed)
+                    checkpoint.advance("transformed")
+            stage.output(transformed)
+        with self.profiler.stage("load"):
+            if checkpoint is not None and checkpoint.reached("loaded"):
+                loaded_rows = int(checkpoint.cursor["rows_loaded"])
+            else:
+                with self.warehouse_loader.open(destination_table, **self._load_options(extract_config)) as writer:
+                    loaded_rows = writer.write(transformed)
+                if checkpoint is not None:
+                    checkpoint.advance("loaded", rows_loaded=loaded_rows)
+        with self.profiler.stage("cache"):
+            self.cache_loader.load(transformed, f"etl:{destination_table}:latest")
         metrics_generated = 0
         if data_source_id:
-            metrics_generated = self._materialize_metrics_from_dataframe(data_source_id, transformed)
+            with self.profiler.stage("materialize"):
+                metrics_generated = self._materialize_metrics_from_dataframe(
+                    data_source_id, transformed, extract_config, destination_table
+                )
 
-        return {
+        result = {
             "rows_extracted": len(extracted.index) if isinstance(extracted, pd.DataFrame) else 0,
             "rows_loaded": loaded_rows,
             "metrics_generated": metrics_generated,
             "destination": destination_table,
             "status": "completed",
         }
+        if cursor_column:
+            result["watermark"] = encode_watermark(high_water_mark)
+        return result
 
-    def _materialize_metrics_from_dataframe(self, data_source_id: str, dataframe: pd.DataFrame) -> int:
-        if dataframe.empty:
-            return 0
+    def _run_streaming(
+        self,
+        extractor: BaseExtractor,
+        extract_config: dict,
+        destination_table: str,
+        data_source_id: str | None,
+        chunk_size: int,
+        optimizer: SchemaOptimizer | None = None,
+        quality: DataQualityEngine | None = None,
+        checkpoint: StageCheckpoint | None = None,
+    ) -> dict:
+        if getattr(self.transformer, "aggregator", None):
+            raise ValueError("Chunked ETL runs do not support the aggregation stage")
 
-        numeric_columns = list(dataframe.select_dtypes(include="number").columns)
-        if not numeric_columns:
-            return 0
+        widgets = self._list_widgets(data_source_id) if data_source_id else []
+        accumulator = MetricAccumulator(self.materializer, widgets, *self._materialization_options(extract_config))
+        cursor_column = self._cursor_column(extract_config)
+        high_water_mark = None
+        rows_extracted = 0
+        loaded_rows = 0
+        snapshot = self.cache_loader.begin(f"etl:{destination_table}:latest")
+        completed_chunks = int(checkpoint.cursor.get("chunks", 0)) if checkpoint is not None else 0
+
+        chunks: Iterator[pd.DataFrame]
+        if checkpoint is not None:
+            chunks = self._resumed_chunks(extractor, extract_config, chunk_size, checkpoint, completed_chunks)
+        else:
+            chunks = extractor.extract_chunks(extract_config, chunk_size)
+
+        # With blocking checks every chunk waits in staging, so a blocked run can be discarded.
+        # Checkpointed runs stage too: a chunk written before its checkpoint advanced would
+        # otherwise be appended twice by the retry.
+        writer = self.warehouse_loader.open(
+            destination_table,
+            deferred=(quality is not None and quality.has_blocking_checks)
+            or (checkpoint is not None and not checkpoint.reached("loaded")),
+            **self._load_options(extract_config),
+        )
+        try:
+            with writer:
+                for index, chunk in enumerate(self._profiled_chunks(chunks)):
+                    rows_extracted += len(chunk.index)
+                    if optimizer is not None:
+                        with self.profiler.stage("schema") as stage:
+                            chunk = optimizer.apply(chunk)
+                            stage.output(chunk)
+                    if quality is not None:
+                        with self.profiler.stage("quality"):
+                            quality.update(chunk)
+                    if cursor_column and not chunk.empty:
+                        chunk_mark = column_high_water_mark(chunk, cursor_column)
+                        if chunk_mark is not None and (high_water_mark is None or chunk_mark > high_water_mark):
+                            high_water_mark = chunk_mark
+
+                    if checkpoint is not None and index < completed_chunks:
+                        # Chunks before the cursor were transformed already; they are staged again
+                        # unless the failed attempt finished loading them.
+                        transformed = checkpoint.read(checkpoint.chunk_name("transformed", index))
+                        if writer.discards_on_failure and not checkpoint.reached("loaded"):
+                            with self.profiler.stage("load"):
+                                loaded_rows += writer.write(transformed)
+                        else:
+                            loaded_rows += len(transformed.index)
+                    else:
+                        with self.profiler.stage("transform") as stage:
+                            transformed = self.transformer.transform(chunk)
+                            stage.output(transformed)
+                        with self.profiler.stage("load"):
+                            loaded_rows += writer.write(transformed)
+                        if checkpoint is not None:
+                            checkpoint.write(checkpoint.chunk_name("extracted", index), chunk)
+                            checkpoint.write(checkpoint.chunk_name("transformed", index), transformed)
+                            checkpoint.advance(chunks=index + 1)
+                    with self.profiler.stage("cache"):
+                        self.cache_loader.append(snapshot, transformed)
+
+                    if widgets:
+                        with self.profiler.stage("materialize"):
+                            accumulator.update(transformed)
+
+                # Raising inside the writer discards the staged table before it reaches the destination.
+                if quality is not None and quality.blocking_failures():
+                    raise DataQualityError("Blocking data quality checks failed")
+        except DataQualityError:
+            return self._blocked_result(
+                destination_table, rows_extracted, 0 if writer.discards_on_failure else loaded_rows
+            )
+        if checkpoint is not None and not checkpoint.reached("loaded"):
+            checkpoint.advance("loaded")
 
+        with self.profiler.stage("cache"):
+            self.cache_loader.publish(snapshot)
+
+        metrics_generated = 0
+        if data_source_id and accumulator.targets:
+            with self.profiler.stage("materialize"):
+                metrics_generated = self._persist_metrics(
+                    data_source_id,
+                    accumulator.targets,
+                    accumulator.snapshot_values(),
+                    accumulator.period_values(),
+                    extract_config,
+                    destination_table,
+                )
+
+        result = {
+            "rows_extracted": rows_extracted,
+            "rows_loaded": loaded_rows,
+            "metrics_generated": metrics_generated,
+            "destination": destination_table,
+            "status": "completed",
+        }
+        if cursor_column:
+            result["watermark"] = encode_watermark(high_water_mark)
+        return result
+
+    @staticmethod
+    def _resumed_chunks(
+        extractor: BaseExtractor,
+        extract_config: dict,
+        chunk_size: int,
+        checkpoint: StageCheckpoint,
+        completed_chunks: int,
+    ) -> Iterator[pd.DataFrame]:
+        # Chunks extracted by the failed attempt are replayed from disk, so quality checks, the
+        # watermark and the load all see the same rows; only the rest is read from the source.
+        replayed_rows = 0
+        for index in range(completed_chunks):
+            chunk = checkpoint.read(checkpoint.chunk_name("extracted", index))
+            replayed_rows += len(chunk.index)
+            yield chunk
+        if not checkpoint.reached("loaded"):
+            yield from extractor.resume_chunks(extract_config, chunk_size, replayed_rows)
+
+    def _profiled_chunks(self, chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        # Extractors read lazily, so extraction time is what each next() call spends.
+        while True:
+            with self.profiler.stage("extract") as stage:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    stage.output(chunk)
+            if chunk is None:
+                return
+            yield chunk
+
+    @staticmethod
+    def _blocked_result(destination_table: str, rows_extracted: int, rows_loaded: int) -> dict:
+        return {
+            "rows_extracted": rows_extracted,
+            "rows_loaded": rows_loaded,
+            "metrics_generated": 0,
+            "destination": destination_table,
+            "status": "blocked",
+        }
+
+    def _schema_optimizer(self, extract_config: dict, last_job: ETLJob | None) -> SchemaOptimizer | None:
+        settings = get_settings()
+        if not extract_config.get("schema_inference", settings.etl_schema_inference):
+            return None
+        cached_schema = last_job.metadata.get("schema") if last_job and last_job.metadata else None
+        cursor_column = self._cursor_column(extract_config)
+        # The cursor column keeps its type so its high-water mark can still be compared.
+        return SchemaOptimizer(
+            cached_schema,
+            category_ratio=settings.etl_category_max_ratio,
+            exclude={cursor_column} if cursor_column else None,
+        )
+
+    @staticmethod
+    def _quality_engine(data_source_id: str, last_job: ETLJob | None) -> DataQualityEngine | None:
+        with db_session_scope() as session:
+            checks = PostgresDataQualityCheckRepository(session).list_active_by_data_source(data_source_id)
+        if not checks:
+            return None
+        previous_row_count = last_job.metadata.get("row_count") if last_job and last_job.metadata else None
+        return DataQualityEngine(checks, previous_row_count)
+
+    @staticmethod
+    def _record_quality(quality: DataQualityEngine) -> None:
+        checks = quality.finish()
         with db_session_scope() as session:
-            widget_repo = PostgresWidgetRepository(session)
-            metric_repo = TimescaleMetricRepository(session)
-            widgets = widget_repo.list_by_data_source(data_source_id)
-
-            if not widgets:
-                return 0
-
-            metrics: list[Metric] = []
-            timestamp = datetime.now(UTC)
-
-            for widget in widgets:
-                config = widget.config if isinstance(widget.config, dict) else {}
-                metric_column = self._resolve_metric_column(config, numeric_columns, list(dataframe.columns))
-                if metric_column is None:
-                    continue
-
-                series = pd.to_numeric(dataframe[metric_column], errors="coerce").dropna()
-                if series.empty:
-                    continue
-
-                aggregation = str(config.get("aggregation", "sum")).lower()
-                value, metric_type = self._aggregate_series(series, aggregation)
-                metric_name = str(config.get("metric") or metric_column)
-
-                metrics.append(
-                    Metric(
-                        id=generate_uuid(),
-                        widget_id=widget.id,
-                        metric_name=metric_name,
-                        metric_value=MetricValue(value),
-                        metric_type=metric_type,
-                        timestamp=timestamp,
-                        dimensions={"data_source_id": data_source_id},
+            PostgresDataQualityCheckRepository(session).update_results(checks)
+
+    @staticmethod
+    def _load_options(extract_config: dict) -> dict:
+        load_config = extract_config.get("load")
+        if not isinstance(load_config, dict):
+            return {}
+        return {"mode": str(load_config.get("mode", "append")), "key_columns": load_config.get("key_columns")}
+
+    @staticmethod
+    def _cursor_column(extract_config: dict) -> str | None:
+        incremental = extract_config.get("incremental")
+        if not isinstance(incremental, dict):
+            return None
+        cursor_column = incremental.get("cursor_column")
+        return str(cursor_column) if cursor_column else None
+
+    def _start_job(self, job_id: str | None, data_source_id: str, extract_config: dict) -> ETLJob:
+        started_at = datetime.now(UTC)
+        with db_session_scope() as session:
+            repo = PostgresETLJobRepository(session)
+            job = repo.get_by_id(job_id) if job_id else None
+            if job is None:
+                return repo.create(
+                    ETLJob(
+                        id=job_id or generate_uuid(),
+                        data_source_id=data_source_id,
+                        job_type=self._job_type(extract_config),
+                        status="running",
+                        started_at=started_at,
                     )
                 )
+            # A retry times its own attempt and keeps the stage cursor of the failed one.
+            job.status = "running"
+            job.started_at = started_at
+            job.completed_at = None
+            job.error_message = None
+            return repo.update(job)
 
-            if not metrics:
-                return 0
+    @staticmethod
+    def _checkpoint(job: ETLJob) -> StageCheckpoint | None:
+        settings = get_settings()
+        if not settings.etl_checkpoints:
+            return None
+        return StageCheckpoint(job.id, settings.etl_checkpoint_dir, job.stage, job.stage_cursor)
+
+    @staticmethod
+    def _job_type(extract_config: dict) -> str:
+        return "incremental_sync" if extract_config.get("incremental") else "sync"
 
-            return metric_repo.create_many(metrics)
+    @staticmethod
+    def _latest_job(data_source_id: str) -> ETLJob | None:
+        with db_session_scope() as session:
+            return PostgresETLJobRepository(session).get_latest_completed(data_source_id)
 
     @staticmethod
-    def _resolve_metric_column(config: dict, numeric_columns: list[str], dataframe_columns: list[str]) -> str | None:
-        config_metric = config.get("metric")
-        if isinstance(config_metric, str) and config_metric in dataframe_columns:
-            return config_metric
+    def _fingerprint(extractor: BaseExtractor, source_type: str, extract_config: dict) -> str | None:
+        try:
+            content_fingerprint = extractor.fingerprint(extract_config)
+        except Exception as exc:
+            logger.warning("etl_source_fingerprint_failed", source_type=source_type, error=str(exc))
+            return None
+        if content_fingerprint is None:
+            return None
+        return source_fingerprint(source_type, extract_config, content_fingerprint)
 
-        if numeric_columns:
-            return numeric_columns[0]
+    @staticmethod
+    def _with_stored_watermark(extract_config: dict, last_job: ETLJob | None) -> dict:
+        incremental = dict(extract_config["incremental"])
+        metadata = last_job.metadata if last_job and isinstance(last_job.metadata, dict) else {}
+        if metadata.get("cursor_column") == incremental.get("cursor_column") and metadata.get("watermark"):
+            incremental["watermark"] = metadata["watermark"]
+        return {**extract_config, "incremental": incremental}
 
-        return None
+    def _record_job(
+        self,
+        job: ETLJob,
+        extract_config: dict,
+        result: dict,
+        fingerprint: str | None,
+        carried: dict | None = None,
+    ) -> None:
+        metadata: dict = {"fingerprint": fingerprint, "row_count": int(result.get("rows_extracted", 0))}
+        for key in ("memory", "quality"):
+            if result.get(key):
+                metadata[key] = result[key]
+        metadata.update({key: value for key, value in (carried or {}).items() if value is not None})
+        metadata.update(self._run_stats())
+        incremental = extract_config.get("incremental")
+        if incremental:
+            # An empty increment keeps the previous high-water mark.
+            metadata["cursor_column"] = self._cursor_column(extract_config)
+            metadata["watermark"] = result.get("watermark") or incremental.get("watermark")
+        rows_extracted = int(result.get("rows_extracted", 0))
+        rows_loaded = int(result.get("rows_loaded", 0))
+        job.status = result["status"]
+        job.completed_at = datetime.now(UTC)
+        job.rows_processed = rows_loaded
+        job.rows_failed = max(rows_extracted - rows_loaded, 0) if result["status"] == "blocked" else 0
+        job.metadata = metadata
+        job.stage = None
+        job.stage_cursor = None
+        with db_session_scope() as session:
+            PostgresETLJobRepository(session).update(job)
+
+    def _run_stats(self) -> dict:
+        stages = self.profiler.stages
+        extract = stages.get(("extract",))
+        return {
+            "stages": {";".join(path): round(stats.seconds, 6) for path, stats in stages.items()},
+            "bytes_read": extract.bytes if extract else 0,
+            "peak_rss_bytes": max((stats.peak_rss_bytes for stats in stages.values()), default=0),
+        }
+
+    def _materialize_metrics_from_dataframe(
+        self,
+        data_source_id: str,
+        dataframe: pd.DataFrame,
+        extract_config: dict | None = None,
+        destination_table: str | None = None,
+    ) -> int:
+        if dataframe.empty:
+            return 0
+
+        widgets = self._list_widgets(data_source_id)
+        if not widgets:
+            return 0
+
+        time_column, default_period = self._materialization_options(extract_config or {})
+        targets = self.materializer.resolve_targets(widgets, dataframe, time_column, default_period)
+        values = self.materializer.compute(dataframe, targets)
+        period_values = self.materializer.compute_periods(dataframe, targets, time_column)
+        return self._persist_metrics(
+            data_source_id, targets, values, period_values, extract_config, destination_table
+        )
+
+    @staticmethod
+    def _materialization_options(extract_config: dict) -> tuple[str, AggregationType | None]:
+        options = extract_config.get("materialization")
+        options = options if isinstance(options, dict) else {}
+        period = parse_period(options["period"]) if options.get("period") else None
+        return str(options.get("time_column", "date")), period
+
+    @staticmethod
+    def _list_widgets(data_source_id: str) -> list[Widget]:
+        with db_session_scope() as session:
+            return PostgresWidgetRepository(session).list_by_data_source(data_source_id)
+
+    def _persist_metrics(
+        self,
+        data_source_id: str,
+        targets: list[MetricTarget],
+        values: Mapping[tuple[str, MetricType], float | None],
+        period_values: dict[tuple[str, AggregationType | None, MetricType], pd.Series] | None = None,
+        extract_config: dict | None = None,
+        destination_table: str | None = None,
+    ) -> int:
+        extract_config = extract_config or {}
+        period_values = period_values or {}
+        # Runs that resume from a watermark only see new rows, so the buckets they touch are partial.
+        partial = destination_table is not None and self._continues_watermark(extract_config)
+        merged_targets = [
+            target
+            for target in targets
+            if not partial or target.period is None or target.metric_type in PARTIAL_MERGES
+        ]
+        recomputed_targets = [target for target in targets if target not in merged_targets]
+
+        metrics = self.materializer.build_metrics(data_source_id, targets, values, datetime.now(UTC))
+        period_metrics = self.materializer.build_period_metrics(data_source_id, merged_targets, period_values)
+        generated = len(metrics) + len(period_metrics)
+        if metrics or period_metrics:
+            with db_session_scope() as session:
+                metric_repo = TimescaleMetricRepository(session)
+                timestamps = [metric.timestamp for metric in period_metrics if metric.timestamp is not None]
+                if timestamps:
+                    widget_ids = sorted({metric.widget_id for metric in period_metrics if metric.widget_id})
+                    metric_names = sorted({metric.metric_name for metric in period_metrics})
+                    start, end = min(timestamps), max(timestamps)
+                    if partial:
+                        stored = metric_repo.get_by_widgets(widget_ids, start, end, metric_names)
+                        period_metrics = self.materializer.merge_period_metrics(stored, period_metrics)
+                    # Every point in the covered range is rewritten, so earlier ones are replaced.
+                    metric_repo.delete_by_widgets(widget_ids, start, end, metric_names)
+                metric_repo.create_many(metrics + period_metrics)
+
+        if recomputed_targets and destination_table is not None:
+            # Averages and percentiles cannot be combined from stored points, so their buckets are re-read.
+            buckets = [
+                pd.Timestamp(bucket)
+                for target in recomputed_targets
+                for bucket in period_values.get(target.period_key, pd.Series(dtype="float64")).index
+            ]
+            if buckets:
+                time_column, _ = self._materialization_options(extract_config)
+                backfill = MetricBackfill(bind=self.warehouse_loader.bind, materializer=self.materializer)
+                summary = backfill.materialize(
+                    data_source_id,
+                    destination_table,
+                    time_column,
+                    recomputed_targets,
+                    min(buckets).to_pydatetime(),
+                    max(buckets).to_pydatetime(),
+                )
+                generated += summary["metrics_generated"]
+        return generated
 
     @staticmethod
-    def _aggregate_series(series: pd.Series, aggregation: str) -> tuple[float, MetricType]:
-        if aggregation in {"sum", "total"}:
-            return float(series.sum()), MetricType.SUM
-        if aggregation in {"avg", "average", "mean"}:
-            return float(series.mean()), MetricType.AVG
-        if aggregation == "count":
-            return float(series.count()), MetricType.COUNT
-        if aggregation == "min":
-            return float(series.min()), MetricType.MIN
-        if aggregation == "max":
-            return float(series.max()), MetricType.MAX
-        if aggregation == "percentile":
-            return float(series.quantile(0.95)), MetricType.PERCENTILE
-
-        return float(series.iloc[-1]), MetricType.RAW
+    def _continues_watermark(extract_config: dict) -> bool:
+        incremental = extract_config.get("incremental")
+        return isinstance(incremental, dict) and bool(incremental.get("watermark"))
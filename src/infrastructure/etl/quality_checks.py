@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import numpy as np
+import pandas as pd
+
+from src.domain.entities import DataQualityCheck
+
+CHECK_TYPES = {"null_rate", "range", "unique", "regex", "row_count_delta"}
+
+
+@dataclass(slots=True)
+class CheckState:
+    check: DataQualityCheck
+    rows: int = 0
+    failures: int = 0
+    error: str | None = None
+    seen_hashes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint64))
+
+    @property
+    def blocking(self) -> bool:
+        return bool(self.check.expectation.get("block"))
+
+
+class DataQualityEngine:
+    def __init__(
+        self, checks: list[DataQualityCheck], previous_row_count: int | None = None
+    ) -> None:
+        self.states = [CheckState(check) for check in checks]
+        self.previous_row_count = previous_row_count
+        self.rows = 0
+        self._patterns = {
+            state.check.id: re.compile(str(state.check.expectation.get("pattern", "")))
+            for state in self.states
+            if state.check.check_type == "regex"
+        }
+
+    def update(self, dataframe: pd.DataFrame) -> None:
+        self.rows += len(dataframe.index)
+        by_column: dict[str, list[CheckState]] = {}
+        for state in self.states:
+            check_type = state.check.check_type
+            if check_type not in CHECK_TYPES:
+                state.error = f"Unsupported check type: {check_type}"
+            elif check_type != "row_count_delta":
+                column = state.check.column_name
+                if column is None or column not in dataframe.columns:
+                    state.error = f"Column not found: {column}"
+                else:
+                    by_column.setdefault(column, []).append(state)
+
+        # Null masks and non-null values are computed once per column and shared by its checks.
+        for column, states in by_column.items():
+            series = dataframe[column]
+            null_mask = series.isna()
+            present = series[~null_mask]
+            for state in states:
+                state.rows += len(series.index)
+                state.failures += self._count_failures(state, null_mask, present)
+
+    def outcomes(self) -> list[dict]:
+        return [self._outcome(state) for state in self.states]
+
+    def finish(self, run_at: datetime | None = None) -> list[DataQualityCheck]:
+        run_at = run_at or datetime.now(UTC)
+        checks = []
+        for outcome, state in zip(self.outcomes(), self.states):
+            check = state.check
+            check.last_run_at = run_at
+            check.last_status = outcome["status"]
+            check.failure_count = check.failure_count + 1 if outcome["status"] != "passed" else 0
+            checks.append(check)
+        return checks
+
+    @property
+    def has_blocking_checks(self) -> bool:
+        return any(state.blocking for state in self.states)
+
+    def blocking_failures(self) -> list[dict]:
+        return [
+            outcome
+            for outcome, state in zip(self.outcomes(), self.states)
+            if state.blocking and outcome["status"] != "passed"
+        ]
+
+    def summary(self) -> dict:
+        outcomes = self.outcomes()
+        return {
+            "checks": len(outcomes),
+            "failed": sum(1 for outcome in outcomes if outcome["status"] != "passed"),
+            "results": outcomes,
+        }
+
+    def _count_failures(self, state: CheckState, null_mask: pd.Series, present: pd.Series) -> int:
+        check_type = state.check.check_type
+        expectation = state.check.expectation
+        if check_type == "null_rate":
+            return int(null_mask.sum())
+        if check_type == "range":
+            numeric = pd.to_numeric(present, errors="coerce")
+            outside = numeric.isna()
+            if expectation.get("min") is not None:
+                outside |= numeric < float(expectation["min"])
+            if expectation.get("max") is not None:
+                outside |= numeric > float(expectation["max"])
+            return int(outside.sum())
+        if check_type == "regex":
+            pattern = self._patterns[state.check.id]
+            return int((~present.astype(str).str.fullmatch(pattern).fillna(False)).sum())
+
+        hashes = pd.util.hash_pandas_object(present, index=False).to_numpy(dtype=np.uint64)
+        unique_hashes = np.unique(hashes)
+        # Hashes seen so far stay in one sorted uint64 array (8 bytes per distinct value), which
+        # each chunk is looked up in and merged into by binary search.
+        seen = state.seen_hashes
+        positions = np.searchsorted(seen, unique_hashes)
+        found = positions < len(seen)
+        found[found] = seen[positions[found]] == unique_hashes[found]
+        state.seen_hashes = np.insert(seen, positions[~found], unique_hashes[~found])
+        return len(hashes) - len(unique_hashes) + int(found.sum())
+
+    def _outcome(self, state: CheckState) -> dict:
+        check = state.check
+        outcome = {"id": check.id, "check_type": check.check_type, "column": check.column_name}
+        if state.error:
+            return {**outcome, "status": "error", "error": state.error}
+
+        expectation = check.expectation
+        if check.check_type == "row_count_delta":
+            if not self.previous_row_count:
+                return {**outcome, "status": "passed", "rows": self.rows}
+            change_pct = abs(self.rows - self.previous_row_count) / self.previous_row_count * 100
+            passed = change_pct <= float(expectation.get("max_change_pct", 50))
+            return {
+                **outcome,
+                "status": "passed" if passed else "failed",
+                "rows": self.rows,
+                "previous_rows": self.previous_row_count,
+                "change_pct": round(change_pct, 4),
+            }
+
+        if check.check_type == "null_rate":
+            null_rate = state.failures / state.rows if state.rows else 0.0
+            passed = null_rate <= float(expectation.get("max_null_rate", 0.0))
+            return {
+                **outcome,
+                "status": "passed" if passed else "failed",
+                "failures": state.failures,
+                "null_rate": round(null_rate, 6),
+            }
+
+        passed = state.failures <= int(expectation.get("max_failures", 0))
+        return {**outcome, "status": "passed" if passed else "failed", "failures": state.failures}
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from src.domain.enums import MetricType
+from src.infrastructure.persistence.rollups import QuantileSketch
+
+PERCENTILE = 0.95
+
+
+@dataclass(slots=True)
+class RunningAggregate:
+    # Percentiles come from a mergeable sketch (1% relative error), so memory stays bounded.
+    sketch: QuantileSketch | None = None
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    last: float | None = None
+
+    def update(self, series: pd.Series) -> None:
+        numeric = pd.to_numeric(series, errors="coerce").dropna()
+        if numeric.empty:
+            return
+
+        self.count += int(numeric.count())
+        self.total += float(numeric.sum())
+        self.minimum = min(self.minimum, float(numeric.min()))
+        self.maximum = max(self.maximum, float(numeric.max()))
+        self.last = float(numeric.iloc[-1])
+        if self.sketch is not None:
+            self.sketch.add_many(numeric.to_numpy(dtype="float64"))
+
+    def result(self, metric_type: MetricType) -> float | None:
+        if self.count == 0:
+            return None
+        if metric_type == MetricType.SUM:
+            return self.total
+        if metric_type == MetricType.AVG:
+            return self.total / self.count
+        if metric_type == MetricType.COUNT:
+            return float(self.count)
+        if metric_type == MetricType.MIN:
+            return self.minimum
+        if metric_type == MetricType.MAX:
+            return self.maximum
+        if metric_type == MetricType.PERCENTILE:
+            return self.sketch.quantile(PERCENTILE) if self.sketch is not None else None
+        return self.last
+
+
+@dataclass(slots=True)
+class RunningPeriodAggregate:
+    track_quantiles: bool = False
+    partials: pd.DataFrame | None = None
+    sketches: dict[pd.Timestamp, QuantileSketch] = field(default_factory=dict)
+
+    def update(self, buckets: pd.Series, series: pd.Series) -> None:
+        frame = pd.DataFrame(
+            {"bucket": buckets, "value": pd.to_numeric(series, errors="coerce")}
+        ).dropna()
+        if frame.empty:
+            return
+
+        partial = frame.groupby("bucket")["value"].agg(["sum", "count", "min", "max", "last"])
+        if self.partials is not None:
+            # Later chunks come second so "last" keeps the most recent value of each bucket.
+            partial = (
+                pd.concat([self.partials, partial])
+                .groupby(level=0)
+                .agg({"sum": "sum", "count": "sum", "min": "min", "max": "max", "last": "last"})
+            )
+        self.partials = partial
+        if self.track_quantiles:
+            for bucket, values in frame.groupby("bucket")["value"]:
+                self.sketches.setdefault(bucket, QuantileSketch()).add_many(
+                    values.to_numpy(dtype="float64")
+                )
+
+    def result(self, metric_type: MetricType) -> pd.Series | None:
+        if self.partials is None:
+            return None
+        if metric_type == MetricType.SUM:
+            return self.partials["sum"]
+        if metric_type == MetricType.AVG:
+            return self.partials["sum"] / self.partials["count"]
+        if metric_type == MetricType.COUNT:
+            return self.partials["count"].astype("float64")
+        if metric_type == MetricType.MIN:
+            return self.partials["min"]
+        if metric_type == MetricType.MAX:
+            return self.partials["max"]
+        if metric_type == MetricType.PERCENTILE:
+            if not self.sketches:
+                return None
+            return pd.Series(
+                {bucket: sketch.quantile(PERCENTILE) for bucket, sketch in self.sketches.items()},
+                dtype="float64",
+            ).rename_axis("bucket")
+        return self.partials["last"]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+INTEGER_DTYPES = ("int8", "int16", "int32", "int64")
+# Arrow-backed strings keep nulls as pd.NA on pandas 2 and 3; astype("str") writes 'None'/'nan'.
+STRING_DTYPE = "string[pyarrow]"
+
+
+def frame_memory(dataframe: pd.DataFrame) -> int:
+    return int(dataframe.memory_usage(deep=True, index=False).sum())
+
+
+class SchemaOptimizer:
+    def __init__(
+        self,
+        schema: dict[str, str] | None = None,
+        category_ratio: float = 0.5,
+        exclude: set[str] | None = None,
+    ) -> None:
+        # Schemas cached by earlier runs may still name the plain "str" dtype.
+        self.schema = {
+            column: STRING_DTYPE if dtype == "str" else dtype
+            for column, dtype in (schema or {}).items()
+        }
+        self.category_ratio = category_ratio
+        self.exclude = exclude or set()
+        self.memory_before = 0
+        self.memory_after = 0
+
+    def apply(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        self.memory_before += frame_memory(dataframe)
+        pending = [
+            column
+            for column in dataframe.columns
+            if column not in self.schema and column not in self.exclude
+        ]
+        conversions: dict[str, str] = {}
+        for column, dtype in self.schema.items():
+            if column not in dataframe.columns:
+                continue
+            if self._fits(dataframe[column], dtype):
+                conversions[column] = dtype
+            else:
+                # The cached type no longer holds (wider ints, lossy floats), so re-infer it.
+                pending.append(column)
+
+        for column in pending:
+            dtype = self.infer(dataframe[column])
+            self.schema[column] = dtype
+            conversions[column] = dtype
+
+        conversions = {
+            column: dtype
+            for column, dtype in conversions.items()
+            if dataframe[column].dtype != dtype
+        }
+        optimized = dataframe.astype(conversions) if conversions else dataframe
+        self.memory_after += frame_memory(optimized)
+        return optimized
+
+    def infer(self, series: pd.Series) -> str:
+        kind = series.dtype.kind
+        current = str(series.dtype.name)
+        if kind in {"i", "u"}:
+            if series.empty:
+                return current
+            low, high = series.min(), series.max()
+            for dtype in INTEGER_DTYPES:
+                bounds = np.iinfo(dtype)
+                if bounds.min <= low and high <= bounds.max:
+                    return dtype
+            return current
+        if kind == "f":
+            return "float32" if self._fits(series, "float32") else series.dtype.name
+        if pd.api.types.infer_dtype(series, skipna=True) != "string":
+            return current
+
+        non_null = int(series.count())
+        if non_null and series.nunique(dropna=True) / non_null <= self.category_ratio:
+            return "category"
+        return STRING_DTYPE
+
+    def memory_report(self) -> dict:
+        return {"before_bytes": self.memory_before, "after_bytes": self.memory_after}
+
+    @staticmethod
+    def _fits(series: pd.Series, dtype: str) -> bool:
+        kind = series.dtype.kind
+        if dtype in INTEGER_DTYPES:
+            if kind not in {"i", "u"}:
+                return False
+            if series.empty:
+                return True
+            bounds = np.iinfo(dtype)
+            return bool(bounds.min <= series.min() and series.max() <= bounds.max)
+        if dtype == "float32":
+            if kind != "f":
+                return False
+            values = series.to_numpy(dtype="float64")
+            return bool(
+                np.array_equal(values.astype("float32").astype("float64"), values, equal_nan=True)
+            )
+        if dtype in {"category", STRING_DTYPE}:
+            return kind in {"O", "T"} or isinstance(
+                series.dtype, (pd.CategoricalDtype, pd.StringDtype)
+            )
+        return str(series.dtype.name) == dtype
@@ -3,5 +3,13 @@ from src.infrastructure.etl.transformers.base_transformer import BaseTransformer
 from src.infrastructure.etl.transformers.cleaner import DataCleaner
 from src.infrastructure.etl.transformers.enricher import DataEnricher
 from src.infrastructure.etl.transformers.pipeline_transformer import ETLTransformer
+from src.infrastructure.etl.transformers.polars_transformer import PolarsTransformer
 
-__all__ = ["Aggregator", "BaseTransformer", "DataCleaner", "DataEnricher", "ETLTransformer"]
+__all__ = [
+    "Aggregator",
+    "BaseTransformer",
+    "DataCleaner",
+    "DataEnricher",
+    "ETLTransformer",
+    "PolarsTransformer",
+]
@@ -4,6 +4,25 @@ import pandas as pd
 
 from src.infrastructure.etl.transformers.base_transformer import BaseTransformer
 
+PARTIAL_FUNCTIONS = {
+    "sum": ("sum",),
+    "count": ("count",),
+    "min": ("min",),
+    "max": ("max",),
+    "first": ("first",),
+    "last": ("last",),
+    "mean": ("sum", "count"),
+}
+
+COMBINE_FUNCTIONS = {
+    "sum": "sum",
+    "count": "sum",
+    "min": "min",
+    "max": "max",
+    "first": "first",
+    "last": "last",
+}
+
 
 class Aggregator(BaseTransformer):
     def __init__(self, group_by: list[str] | None = None, aggregations: dict | None = None) -> None:
@@ -13,4 +32,45 @@ class Aggregator(BaseTransformer):
     def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         if not self.group_by or not self.aggregations:
             return dataframe
-        return dataframe.groupby(self.group_by, dropna=False).agg(self.aggregations).reset_index()
+        return (
+            dataframe.groupby(self.group_by, dropna=False, observed=True)
+            .agg(self.aggregations)
+            .reset_index()
+        )
+
+    @property
+    def is_decomposable(self) -> bool:
+        return bool(self.group_by and self.aggregations) and all(
+            isinstance(function, str) and function in PARTIAL_FUNCTIONS
+            for function in self.aggregations.values()
+        )
+
+    def partial(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        named = {
+            self._partial_name(position, part): (column, part)
+            for position, (column, function) in enumerate(self.aggregations.items())
+            for part in PARTIAL_FUNCTIONS[function]
+        }
+        return (
+            dataframe.groupby(self.group_by, dropna=False, observed=True).agg(**named).reset_index()
+        )
+
+    def combine(self, partials: list[pd.DataFrame]) -> pd.DataFrame:
+        merged = pd.concat(partials, ignore_index=True)
+        partial_columns = [column for column in merged.columns if column not in self.group_by]
+        combined = merged.groupby(self.group_by, dropna=False, observed=True).agg(
+            {column: COMBINE_FUNCTIONS[column.rsplit("_", 1)[1]] for column in partial_columns}
+        )
+
+        result = pd.DataFrame(index=combined.index)
+        for position, (column, function) in enumerate(self.aggregations.items()):
+            if function == "mean":
+                total = combined[self._partial_name(position, "sum")]
+                result[column] = total / combined[self._partial_name(position, "count")]
+            else:
+                result[column] = combined[self._partial_name(position, function)]
+        return result.reset_index()
+
+    @staticmethod
+    def _partial_name(position: int, part: str) -> str:
+        return f"__partial_{position}_{part}"
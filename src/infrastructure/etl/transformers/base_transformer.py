@@ -9,3 +9,6 @@ class BaseTransformer(ABC):
     @abstractmethod
     def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         raise NotImplementedError
+
+    def close(self) -> None:
+        return None
@@ -10,8 +10,14 @@ class DataCleaner(BaseTransformer):
         cleaned = dataframe.copy()
         cleaned = cleaned.drop_duplicates()
         for column in cleaned.columns:
-            if cleaned[column].dtype.kind in {"i", "f"}:
+            if cleaned[column].dtype.kind in {"i", "u", "f"}:
                 cleaned[column] = cleaned[column].fillna(0)
+            elif isinstance(cleaned[column].dtype, pd.CategoricalDtype):
+                categories = cleaned[column].cat.categories
+                filled = (
+                    cleaned[column] if "" in categories else cleaned[column].cat.add_categories("")
+                )
+                cleaned[column] = filled.fillna("")
             else:
                 cleaned[column] = cleaned[column].fillna("")
         return cleaned
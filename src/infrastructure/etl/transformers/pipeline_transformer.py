@@ -1,22 +1,112 @@
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import pandas as pd
 
 from src.infrastructure.etl.transformers.aggregator import Aggregator
 from src.infrastructure.etl.transformers.base_transformer import BaseTransformer
 from src.infrastructure.etl.transformers.cleaner import DataCleaner
 from src.infrastructure.etl.transformers.enricher import DataEnricher
+from src.infrastructure.monitoring.logger import get_logger
+from src.infrastructure.monitoring.profiler import NullProfiler, StageProfiler
+from src.shared.config import get_settings
+
+logger = get_logger()
+
+
+def _transform_partition(
+    cleaner: DataCleaner,
+    enricher: DataEnricher,
+    aggregator: Aggregator | None,
+    partition: pd.DataFrame,
+) -> pd.DataFrame:
+    enriched = enricher.transform(cleaner.transform(partition))
+    if aggregator is None:
+        return enriched
+    return aggregator.partial(enriched)
 
 
 class ETLTransformer(BaseTransformer):
-    def __init__(self, cleaner: DataCleaner | None = None, enricher: DataEnricher | None = None, aggregator: Aggregator | None = None) -> None:
+    def __init__(
+        self,
+        cleaner: DataCleaner | None = None,
+        enricher: DataEnricher | None = None,
+        aggregator: Aggregator | None = None,
+        workers: int | None = None,
+        partition_rows: int | None = None,
+    ) -> None:
+        settings = get_settings()
         self.cleaner = cleaner or DataCleaner()
         self.enricher = enricher or DataEnricher()
         self.aggregator = aggregator
+        self.workers = max(1, workers if workers is not None else settings.etl_transform_workers)
+        self.partition_rows = max(
+            1,
+            partition_rows if partition_rows is not None else settings.etl_transform_partition_rows,
+        )
+        self.profiler: NullProfiler | StageProfiler = NullProfiler()
+        self._executor: ProcessPoolExecutor | None = None
 
     def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        cleaned = self.cleaner.transform(dataframe)
-        enriched = self.enricher.transform(cleaned)
+        partition_count = min(self.workers, len(dataframe.index) // self.partition_rows)
+        if partition_count >= 2:
+            try:
+                with self.profiler.stage("partitions") as stage:
+                    transformed = self._transform_partitioned(dataframe, partition_count)
+                    stage.output(transformed)
+                return transformed
+            except Exception as exc:
+                logger.warning("etl_partitioned_transform_failed", error=str(exc))
+                self.close()
+                self.workers = 1
+
+        with self.profiler.stage("clean") as stage:
+            cleaned = self.cleaner.transform(dataframe)
+            stage.output(cleaned)
+        with self.profiler.stage("enrich") as stage:
+            enriched = self.enricher.transform(cleaned)
+            stage.output(enriched)
+        if not self.aggregator:
+            return enriched
+        with self.profiler.stage("aggregate") as stage:
+            aggregated = self.aggregator.transform(enriched)
+            stage.output(aggregated)
+        return aggregated
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _transform_partitioned(self, dataframe: pd.DataFrame, partition_count: int) -> pd.DataFrame:
+        # Duplicates can span partitions, so they are removed once before the frame is split.
+        deduplicated = dataframe.drop_duplicates()
+        bounds = [
+            len(deduplicated.index) * index // partition_count
+            for index in range(partition_count + 1)
+        ]
+        partitions = [deduplicated.iloc[start:end] for start, end in zip(bounds, bounds[1:])]
+
+        aggregator = (
+            self.aggregator if self.aggregator and self.aggregator.is_decomposable else None
+        )
+        if self._executor is None:
+            # forkserver avoids forking a parent that already runs threads (Celery, HTTP clients).
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        results = list(
+            self._executor.map(
+                partial(_transform_partition, self.cleaner, self.enricher, aggregator), partitions
+            )
+        )
+
+        if aggregator is not None:
+            return aggregator.combine(results)
+        enriched = pd.concat(results)
         if self.aggregator:
             return self.aggregator.transform(enriched)
         return enriched
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pandas as pd
+import polars as pl
+
+from src.infrastructure.etl.transformers.aggregator import Aggregator
+from src.infrastructure.etl.transformers.base_transformer import BaseTransformer
+from src.infrastructure.monitoring.profiler import NullProfiler, StageProfiler
+
+POLARS_AGGREGATIONS = {
+    "sum": lambda column: pl.col(column).sum(),
+    "mean": lambda column: pl.col(column).mean(),
+    "median": lambda column: pl.col(column).median(),
+    "min": lambda column: pl.col(column).min(),
+    "max": lambda column: pl.col(column).max(),
+    "count": lambda column: pl.col(column).count(),
+    "first": lambda column: pl.col(column).first(),
+    "last": lambda column: pl.col(column).last(),
+    "std": lambda column: pl.col(column).std(),
+    "var": lambda column: pl.col(column).var(),
+    "nunique": lambda column: pl.col(column).n_unique(),
+    "size": lambda column: pl.col(column).len(),
+}
+
+
+class PolarsTransformer(BaseTransformer):
+    def __init__(self, aggregator: Aggregator | None = None) -> None:
+        self.aggregator = aggregator
+        self.profiler: NullProfiler | StageProfiler = NullProfiler()
+
+    def transform(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        if dataframe.empty:
+            return dataframe
+        # The lazy plan runs as one query, so only the conversions around it can be split out.
+        with self.profiler.stage("to_polars"):
+            lazy = pl.from_pandas(dataframe, nan_to_null=True).lazy()
+        with self.profiler.stage("collect") as stage:
+            collected = self.plan(lazy).collect()
+            stage.output(collected)
+        with self.profiler.stage("to_pandas"):
+            return collected.to_pandas()
+
+    def plan(self, lazy: pl.LazyFrame) -> pl.LazyFrame:
+        return self._aggregate(self._enrich(self._clean(lazy)))
+
+    @staticmethod
+    def _clean(lazy: pl.LazyFrame) -> pl.LazyFrame:
+        schema = lazy.collect_schema()
+        fills = []
+        for column, dtype in schema.items():
+            if dtype.is_numeric():
+                fills.append(pl.col(column).fill_null(0))
+            elif dtype == pl.String:
+                fills.append(pl.col(column).fill_null(""))
+            elif dtype == pl.Categorical:
+                fills.append(pl.col(column).cast(pl.String).fill_null("").cast(pl.Categorical))
+        lazy = lazy.unique(keep="first", maintain_order=True)
+        return lazy.with_columns(fills) if fills else lazy
+
+    @staticmethod
+    def _enrich(lazy: pl.LazyFrame) -> pl.LazyFrame:
+        schema = lazy.collect_schema()
+        columns = []
+        if "revenue" in schema and "customers" in schema:
+            customers = pl.when(pl.col("customers") == 0).then(1).otherwise(pl.col("customers"))
+            columns.append((pl.col("revenue") / customers).alias("avg_ticket"))
+        if "date" in schema:
+            if schema["date"] in (pl.String, pl.Categorical):
+                date = pl.col("date").cast(pl.String).str.to_datetime(strict=False)
+            else:
+                date = pl.col("date").cast(pl.Datetime, strict=False)
+            lazy = lazy.with_columns(columns + [date.alias("date")])
+            return lazy.with_columns(
+                pl.col("date").dt.year().alias("year"), pl.col("date").dt.month().alias("month")
+            )
+        return lazy.with_columns(columns) if columns else lazy
+
+    def _aggregate(self, lazy: pl.LazyFrame) -> pl.LazyFrame:
+        if not self.aggregator or not self.aggregator.group_by or not self.aggregator.aggregations:
+            return lazy
+        expressions = []
+        for column, function in self.aggregator.aggregations.items():
+            if not isinstance(function, str) or function not in POLARS_AGGREGATIONS:
+                raise ValueError(f"Unsupported aggregation for the polars engine: {function!r}")
+            expressions.append(POLARS_AGGREGATIONS[function](column).alias(column))
+        group_by = self.aggregator.group_by
+        return lazy.group_by(group_by).agg(expressions).sort(group_by, nulls_last=True)
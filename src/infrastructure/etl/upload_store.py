@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import pandas as pd
+
+UPLOAD_BLOCK_SIZE = 1024 * 1024
+SNIFF_BYTES = 64 * 1024
+SNIFF_DELIMITERS = ",;\t|"
+
+
+@dataclass(slots=True)
+class StoredUpload:
+    path: Path
+    sha256: str
+    size: int
+    deduplicated: bool
+    schema: dict
+
+
+def sniff_csv(sample: bytes, complete: bool = False, has_header: bool = True) -> dict:
+    try:
+        text = sample.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        if complete or exc.start < len(sample) - 3:
+            raise ValueError("CSV upload must be UTF-8 encoded text") from exc
+        # The sample may end inside a multi-byte character.
+        text = sample[: exc.start].decode("utf-8-sig")
+    if not complete:
+        # Only whole lines are parsed; the last one may be cut off by the block boundary.
+        text = text[: text.rfind("\n") + 1] or text
+    if not text.strip():
+        raise ValueError("CSV upload is empty")
+    if "\x00" in text:
+        raise ValueError("CSV upload looks like a binary file")
+
+    try:
+        delimiter = csv.Sniffer().sniff(text, delimiters=SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = ","
+
+    try:
+        frame = pd.read_csv(io.StringIO(text), sep=delimiter, header=0 if has_header else None)
+    except (pd.errors.ParserError, pd.errors.EmptyDataError) as exc:
+        raise ValueError(f"CSV upload could not be parsed: {exc}") from exc
+    if not has_header:
+        frame.columns = [f"column_{index + 1}" for index in range(len(frame.columns))]
+
+    return {
+        "delimiter": delimiter,
+        "has_header": has_header,
+        "columns": [
+            {"name": str(column), "type": _column_type(frame[column])} for column in frame.columns
+        ],
+        "sample_rows": len(frame.index),
+    }
+
+
+def _column_type(series: pd.Series) -> str:
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred == "integer":
+        return "integer"
+    if inferred in {"floating", "mixed-integer-float", "decimal"}:
+        return "float"
+    if inferred == "boolean":
+        return "boolean"
+    if inferred == "empty":
+        return "unknown"
+    if inferred == "string":
+        try:
+            pd.to_datetime(series.dropna(), format="ISO8601")
+        except (ValueError, TypeError):
+            return "string"
+        return "datetime"
+    return str(inferred)
+
+
+class CSVUploadStore:
+    def __init__(
+        self,
+        root: str | Path,
+        block_size: int = UPLOAD_BLOCK_SIZE,
+        sniff_bytes: int = SNIFF_BYTES,
+    ) -> None:
+        self.root = Path(root)
+        self.block_size = block_size
+        self.sniff_bytes = sniff_bytes
+
+    def save(self, stream: BinaryIO, owner: str, has_header: bool = True) -> StoredUpload:
+        directory = self.root / owner
+        directory.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        head = bytearray()
+        schema: dict | None = None
+        size = 0
+        handle = tempfile.NamedTemporaryFile(dir=directory, suffix=".partial", delete=False)
+        temp_path = Path(handle.name)
+        try:
+            with handle:
+                # Hashing, sniffing and writing share one pass over the upload.
+                for block in iter(lambda: stream.read(self.block_size), b""):
+                    digest.update(block)
+                    handle.write(block)
+                    size += len(block)
+                    if schema is None:
+                        head += block[: self.sniff_bytes - len(head)]
+                        if len(head) >= self.sniff_bytes:
+                            schema = sniff_csv(bytes(head), has_header=has_header)
+            if schema is None:
+                schema = sniff_csv(bytes(head), complete=True, has_header=has_header)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        sha256 = digest.hexdigest()
+        target_path = directory / f"{sha256}.csv"
+        deduplicated = target_path.exists()
+        if deduplicated:
+            temp_path.unlink()
+        else:
+            os.replace(temp_path, target_path)
+        return StoredUpload(target_path, sha256, size, deduplicated, schema)
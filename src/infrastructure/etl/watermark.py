@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any
+
+import pandas as pd
+
+
+def encode_watermark(value: Any) -> dict | None:
+    if value is None:
+        return None
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    if isinstance(value, datetime):
+        return {"type": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"type": "date", "value": value.isoformat()}
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, (int, float)):
+        return {"type": "number", "value": value}
+    return {"type": "string", "value": str(value)}
+
+
+def decode_watermark(payload: dict | None) -> Any:
+    if not payload:
+        return None
+    value = payload.get("value")
+    if value is None:
+        return None
+    watermark_type = payload.get("type")
+    if watermark_type == "datetime":
+        return datetime.fromisoformat(value)
+    if watermark_type == "date":
+        return date.fromisoformat(value)
+    return value
+
+
+def column_high_water_mark(dataframe: pd.DataFrame, column: str) -> Any:
+    if column not in dataframe.columns:
+        raise ValueError(f"Incremental cursor column not found in extracted data: {column}")
+    series = dataframe[column].dropna()
+    if series.empty:
+        return None
+    return series.max()
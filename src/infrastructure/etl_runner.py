@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import json
+from pathlib import Path
 
 from src.infrastructure.etl import ETLPipeline
+from src.infrastructure.etl.transformers import ETLTransformer
+from src.infrastructure.monitoring.profiler import StageProfiler, summarize_profiles
 
 
 def main() -> None:
@@ -10,11 +14,61 @@ def main() -> None:
     parser.add_argument("source_type", help="api|database|csv|google_sheets")
     parser.add_argument("destination_table", help="destination table name")
     parser.add_argument("--config", default="{}", help="JSON config")
+    parser.add_argument(
+        "--chunk-size", type=int, default=None, help="stream the source in chunks of N rows"
+    )
+    parser.add_argument("--engine", default=None, help="pandas|polars transform engine")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="transform partitions in N processes"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="time stages and sample memory per run"
+    )
+    parser.add_argument(
+        "--profile-output", default="etl_profile.json", help="JSON profile report path"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="run the pipeline N times")
     args = parser.parse_args()
 
-    config = __import__("json").loads(args.config)
-    result = ETLPipeline().run(args.source_type, config, args.destination_table)
-    print(result)
+    config = json.loads(args.config)
+    transformer = ETLTransformer(workers=args.workers) if args.workers else None
+    reports = []
+    folded = []
+    try:
+        for _ in range(max(1, args.repeat)):
+            profiler = StageProfiler() if args.profile else None
+            pipeline = ETLPipeline(
+                transformer=transformer,
+                chunk_size=args.chunk_size,
+                engine=args.engine,
+                profiler=profiler,
+            )
+            if profiler is not None:
+                profiler.start()
+            try:
+                result = pipeline.run(args.source_type, config, args.destination_table)
+            finally:
+                if profiler is not None:
+                    profiler.stop()
+            if profiler is not None:
+                reports.append({**profiler.report(), "result": result})
+                folded.append(profiler.folded())
+            print(result)
+    finally:
+        if transformer is not None:
+            transformer.close()
+
+    if reports:
+        output = Path(args.profile_output)
+        report = {
+            "source_type": args.source_type,
+            "summary": summarize_profiles(reports),
+            "runs": reports,
+        }
+        output.write_text(json.dumps(report, indent=2, default=str))
+        # Collapsed stacks from every run; flamegraph tools sum identical stacks.
+        output.with_suffix(".folded").write_text("".join(folded))
+        print(f"Profile written to {output} and {output.with_suffix('.folded')}")
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ def run_etl_job(
     extract_config: dict,
     destination_table: str,
     data_source_id: str | None = None,
+    force: bool = False,
 ):
     pipeline = ETLPipeline()
     try:
@@ -20,11 +21,16 @@ def run_etl_job(
             extract_config=extract_config,
             destination_table=destination_table,
             data_source_id=data_source_id,
+            force=force,
+            # Retries keep the task id, so they pick up the checkpoints of the failed attempt.
+            job_id=self.request.id if data_source_id else None,
         )
         etl_jobs_total.labels(data_source_type=source_type, status="success").inc()
         return result
     except Exception as exc:
         etl_jobs_total.labels(data_source_type=source_type, status="failed").inc()
+        if data_source_id and self.request.retries >= self.max_retries:
+            pipeline.fail_job(self.request.id, str(exc))
         raise self.retry(exc=exc, countdown=2**self.request.retries)
 
 
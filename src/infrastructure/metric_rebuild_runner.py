@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+
+from src.infrastructure.persistence import db_session_scope
+from src.infrastructure.persistence.repositories import TimescaleMetricRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild metric_latest and the metric rollups from the metrics table"
+    )
+    parser.add_argument("--widget", action="append", default=None, help="widget id (repeatable)")
+    parser.add_argument(
+        "--start", type=datetime.fromisoformat, default=None, help="first rollup bucket (ISO 8601)"
+    )
+    parser.add_argument(
+        "--end", type=datetime.fromisoformat, default=None, help="last rollup bucket (ISO 8601)"
+    )
+    args = parser.parse_args()
+    if (args.start is None) != (args.end is None):
+        parser.error("--start and --end go together")
+
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        result = {"latest": repo.rebuild_latest(args.widget)}
+        if args.start is not None:
+            result["rollups"] = repo.rebuild_rollups(args.start, args.end, args.widget)
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
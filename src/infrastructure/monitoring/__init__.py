@@ -4,10 +4,13 @@ from src.infrastructure.monitoring.metrics import (
     cache_hit_rate,
     dashboards_created_total,
     etl_jobs_total,
+    external_db_connections_checked_out,
+    external_db_engines_active,
     metric_calculation_duration,
     metrics_response,
     query_execution_duration,
 )
+from src.infrastructure.monitoring.profiler import NullProfiler, StageProfiler, summarize_profiles
 
 __all__ = [
     "active_widgets",
@@ -15,10 +18,15 @@ __all__ = [
     "configure_logging",
     "dashboards_created_total",
     "etl_jobs_total",
+    "external_db_connections_checked_out",
+    "external_db_engines_active",
     "get_logger",
     "metric_calculation_duration",
     "metrics_response",
+    "NullProfiler",
     "query_execution_duration",
     "request_id_var",
+    "StageProfiler",
+    "summarize_profiles",
     "user_id_var",
 ]
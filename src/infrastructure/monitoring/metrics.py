@@ -30,6 +30,11 @@ query_execution_duration = Histogram(
 )
 
 active_widgets = Gauge("active_widgets", "Active widgets count")
+external_db_engines_active = Gauge("external_db_engines_active", "Pooled engines held for external SQL data sources")
+external_db_connections_checked_out = Gauge(
+    "external_db_connections_checked_out",
+    "Connections currently checked out from external SQL data source pools",
+)
 cache_hit_rate = Gauge("cache_hit_rate", "Cache hit rate")
 
 
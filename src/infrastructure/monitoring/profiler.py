@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import resource
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+PAGE_SIZE = resource.getpagesize()
+
+
+def current_rss() -> int | None:
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * PAGE_SIZE
+    return None
+
+
+def peak_rss() -> int:
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass(slots=True)
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    child_seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    peak_rss_bytes: int = 0
+    peak_traced_bytes: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "self_seconds": round(max(self.seconds - self.child_seconds, 0.0), 6),
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "peak_traced_bytes": self.peak_traced_bytes,
+        }
+
+
+@dataclass(slots=True)
+class StageHandle:
+    stats: StageStats | None = None
+    started: float = 0.0
+    peak_traced: int = 0
+    children: float = 0.0
+
+    def output(self, dataframe: pd.DataFrame | pl.DataFrame) -> None:
+        if self.stats is None:
+            return
+        self.stats.rows += len(dataframe)
+        if isinstance(dataframe, pd.DataFrame):
+            self.stats.bytes += int(dataframe.memory_usage(index=False).sum())
+        else:
+            self.stats.bytes += int(dataframe.estimated_size())
+
+
+class NullProfiler:
+    enabled = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageHandle]:
+        yield StageHandle()
+
+
+class StageProfiler:
+    enabled = True
+
+    def __init__(
+        self,
+        trace_allocations: bool = True,
+        top_allocators: int = 15,
+        sample_interval: float = 0.005,
+    ) -> None:
+        self.trace_allocations = trace_allocations
+        self.top_allocators = top_allocators
+        self.sample_interval = sample_interval
+        self.stages: dict[tuple[str, ...], StageStats] = {}
+        self._stack: list[tuple[tuple[str, ...], StageHandle]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._started = 0.0
+        self.seconds = 0.0
+        self.allocators: list[dict] = []
+
+    def reset(self) -> None:
+        self.stages = {}
+        self.allocators = []
+        self.seconds = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if current_rss() is not None:
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample_rss, daemon=True)
+            self._sampler.start()
+
+    def stop(self) -> None:
+        self.seconds = time.perf_counter() - self._started
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        if self.trace_allocations and tracemalloc.is_tracing():
+            # Module imports stay allocated for the life of the process and would crowd the list.
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                ]
+            )
+            self.allocators = [
+                {
+                    "location": str(statistic.traceback[0]),
+                    "bytes": statistic.size,
+                    "blocks": statistic.count,
+                }
+                for statistic in snapshot.statistics("lineno")[: self.top_allocators]
+            ]
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageHandle]:
+        with self._lock:
+            path = (self._stack[-1][0] if self._stack else ()) + (name,)
+            stats = self.stages.setdefault(path, StageStats())
+            handle = StageHandle(stats=stats)
+            self._enter_traced(handle)
+            self._stack.append((path, handle))
+        handle.started = time.perf_counter()
+        try:
+            yield handle
+        finally:
+            elapsed = time.perf_counter() - handle.started
+            with self._lock:
+                self._stack.pop()
+                stats.calls += 1
+                stats.seconds += elapsed
+                stats.child_seconds += handle.children
+                self._exit_traced(handle)
+                if self._stack:
+                    self._stack[-1][1].children += elapsed
+                rss = current_rss()
+                if rss is not None:
+                    stats.peak_rss_bytes = max(stats.peak_rss_bytes, rss)
+
+    def report(self) -> dict:
+        return {
+            "seconds": round(self.seconds, 6),
+            "peak_rss_bytes": peak_rss(),
+            "stages": {";".join(path): stats.to_dict() for path, stats in self.stages.items()},
+            "top_allocators": self.allocators,
+        }
+
+    def folded(self, root: str = "etl") -> str:
+        # Collapsed stacks ("a;b;c <microseconds>") are what flamegraph.pl, speedscope and inferno read.
+        lines = []
+        for path, stats in self.stages.items():
+            self_micros = int(max(stats.seconds - stats.child_seconds, 0.0) * 1_000_000)
+            if self_micros:
+                lines.append(f"{';'.join((root, *path))} {self_micros}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def _enter_traced(self, handle: StageHandle) -> None:
+        if not tracemalloc.is_tracing():
+            return
+        # The interpreter keeps a single peak, so the parent's peak so far is saved before resetting it.
+        if self._stack:
+            parent = self._stack[-1][1]
+            parent.peak_traced = max(parent.peak_traced, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    def _exit_traced(self, handle: StageHandle) -> None:
+        if not tracemalloc.is_tracing():
+            return
+        peak = max(handle.peak_traced, tracemalloc.get_traced_memory()[1])
+        if handle.stats is not None:
+            handle.stats.peak_traced_bytes = max(handle.stats.peak_traced_bytes, peak)
+        if self._stack:
+            parent = self._stack[-1][1]
+            parent.peak_traced = max(parent.peak_traced, peak)
+        tracemalloc.reset_peak()
+
+    def _sample_rss(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            rss = current_rss()
+            if rss is None:
+                continue
+            with self._lock:
+                for _, handle in self._stack:
+                    if handle.stats is not None:
+                        handle.stats.peak_rss_bytes = max(handle.stats.peak_rss_bytes, rss)
+
+
+def summarize_profiles(reports: list[dict]) -> dict:
+    def spread(values: list[float]) -> dict:
+        return {
+            "min": min(values),
+            "median": statistics.median(values),
+            "max": max(values),
+        }
+
+    stages: dict[str, dict] = {}
+    for name in dict.fromkeys(name for report in reports for name in report["stages"]):
+        runs = [report["stages"][name] for report in reports if name in report["stages"]]
+        stages[name] = {
+            "seconds": spread([run["seconds"] for run in runs]),
+            "self_seconds": spread([run["self_seconds"] for run in runs]),
+            "rows": spread([run["rows"] for run in runs]),
+            "bytes": spread([run["bytes"] for run in runs]),
+            "peak_rss_bytes": max(run["peak_rss_bytes"] for run in runs),
+            "peak_traced_bytes": max(run["peak_traced_bytes"] for run in runs),
+        }
+    return {
+        "runs": len(reports),
+        "seconds": spread([report["seconds"] for report in reports]),
+        "peak_rss_bytes": max(report["peak_rss_bytes"] for report in reports),
+        "stages": stages,
+    }
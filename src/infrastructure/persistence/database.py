@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from datetime import timedelta
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
@@ -48,3 +49,13 @@ def init_db() -> None:
     from src.infrastructure.persistence import models  # noqa: F401
 
     Base.metadata.create_all(bind=engine)
+    settings = get_settings()
+    if settings.timescale_enabled:
+        from src.infrastructure.persistence.timescale import enable_timescale
+
+        with engine.begin() as connection:
+            enable_timescale(
+                connection,
+                timedelta(days=settings.timescale_chunk_interval_days),
+                timedelta(days=settings.timescale_compress_after_days),
+            )
@@ -5,7 +5,9 @@ from src.infrastructure.persistence.models.dashboard_model import DashboardModel
 from src.infrastructure.persistence.models.data_quality_check_model import DataQualityCheckModel
 from src.infrastructure.persistence.models.data_source_model import DataSourceModel
 from src.infrastructure.persistence.models.etl_job_model import ETLJobModel
+from src.infrastructure.persistence.models.metric_latest_model import MetricLatestModel
 from src.infrastructure.persistence.models.metric_model import MetricModel
+from src.infrastructure.persistence.models.metric_rollup_model import MetricRollupModel
 from src.infrastructure.persistence.models.report_model import ReportModel
 from src.infrastructure.persistence.models.user_model import UserModel
 from src.infrastructure.persistence.models.widget_model import WidgetModel
@@ -18,7 +20,9 @@ __all__ = [
     "DataQualityCheckModel",
     "DataSourceModel",
     "ETLJobModel",
+    "MetricLatestModel",
     "MetricModel",
+    "MetricRollupModel",
     "ReportModel",
     "UserModel",
     "WidgetModel",
@@ -19,4 +19,6 @@ class ETLJobModel(Base):
     rows_failed: Mapped[int] = mapped_column(Integer, default=0)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     job_metadata: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
+    stage: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    stage_cursor: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.database import Base
+
+
+class MetricLatestModel(Base):
+    __tablename__ = "metric_latest"
+
+    widget_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    metric_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    metric_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    metric_value: Mapped[float] = mapped_column(Float, nullable=False)
+    metric_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    dimensions: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
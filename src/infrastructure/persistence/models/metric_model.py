@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, String
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.persistence.database import Base
@@ -10,8 +10,8 @@ class MetricModel(Base):
     __tablename__ = "metrics"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    widget_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("widgets.id", ondelete="CASCADE"), index=True)
-    metric_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    widget_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("widgets.id", ondelete="CASCADE"))
+    metric_name: Mapped[str] = mapped_column(String(255), nullable=False)
     metric_value: Mapped[float] = mapped_column(Float, nullable=False)
     metric_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
     dimensions: Mapped[dict | None] = mapped_column(JSON, nullable=True)
@@ -19,3 +19,19 @@ class MetricModel(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     widget = relationship("WidgetModel", back_populates="metrics")
+
+
+# Composite indexes matching get_history (name, widget, time range) and the per-widget
+# latest/delete paths; they replace the single-column widget_id and metric_name indexes.
+Index(
+    "ix_metrics_name_widget_timestamp",
+    MetricModel.metric_name,
+    MetricModel.widget_id,
+    MetricModel.timestamp,
+)
+Index(
+    "ix_metrics_widget_timestamp",
+    MetricModel.widget_id,
+    MetricModel.timestamp.desc(),
+    postgresql_include=["metric_value"],
+)
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.database import Base
+
+
+class MetricRollupModel(Base):
+    __tablename__ = "metric_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "resolution", "metric_name", "widget_id", "bucket", name="uq_metric_rollups_bucket"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    resolution: Mapped[str] = mapped_column(String(10), nullable=False)
+    metric_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    widget_id: Mapped[str] = mapped_column(
+        String(36), nullable=False, default="", server_default="", index=True
+    )
+    bucket: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    min: Mapped[float] = mapped_column(Float, nullable=False)
+    max: Mapped[float] = mapped_column(Float, nullable=False)
+    sketch: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
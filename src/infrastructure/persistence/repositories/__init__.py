@@ -1,7 +1,11 @@
 from src.infrastructure.persistence.repositories.alert_history_repository import AlertHistoryRepository
 from src.infrastructure.persistence.repositories.postgres_alert_repository import PostgresAlertRepository
 from src.infrastructure.persistence.repositories.postgres_dashboard_repository import PostgresDashboardRepository
+from src.infrastructure.persistence.repositories.postgres_data_quality_check_repository import (
+    PostgresDataQualityCheckRepository,
+)
 from src.infrastructure.persistence.repositories.postgres_data_source_repository import PostgresDataSourceRepository
+from src.infrastructure.persistence.repositories.postgres_etl_job_repository import PostgresETLJobRepository
 from src.infrastructure.persistence.repositories.postgres_report_repository import PostgresReportRepository
 from src.infrastructure.persistence.repositories.postgres_user_repository import PostgresUserRepository
 from src.infrastructure.persistence.repositories.postgres_widget_repository import PostgresWidgetRepository
@@ -12,7 +16,9 @@ __all__ = [
     "AlertHistoryRepository",
     "PostgresAlertRepository",
     "PostgresDashboardRepository",
+    "PostgresDataQualityCheckRepository",
     "PostgresDataSourceRepository",
+    "PostgresETLJobRepository",
     "PostgresReportRepository",
     "PostgresUserRepository",
     "PostgresWidgetRepository",
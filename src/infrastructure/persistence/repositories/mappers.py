@@ -1,12 +1,27 @@
 from __future__ import annotations
 
-from src.domain.entities import Alert, Dashboard, DataSource, Metric, Report, User, Widget
+from datetime import datetime
+
+from src.domain.entities import (
+    Alert,
+    Dashboard,
+    DataQualityCheck,
+    DataSource,
+    ETLJob,
+    Metric,
+    Report,
+    User,
+    Widget,
+)
 from src.domain.enums import AlertSeverity, DataSourceType, MetricType, UserRole, WidgetType
 from src.domain.value_objects import MetricValue, Threshold
 from src.infrastructure.persistence.models import (
     AlertModel,
     DashboardModel,
+    DataQualityCheckModel,
     DataSourceModel,
+    ETLJobModel,
+    MetricLatestModel,
     MetricModel,
     ReportModel,
     UserModel,
@@ -92,6 +107,42 @@ def metric_to_model(entity: Metric) -> MetricModel:
     )
 
 
+def metric_to_row(entity: Metric) -> dict:
+    return {
+        "id": entity.id,
+        "widget_id": entity.widget_id,
+        "metric_name": entity.metric_name,
+        "metric_value": entity.value_as_float,
+        "metric_type": entity.metric_type.value,
+        "dimensions": entity.dimensions,
+        "timestamp": entity.timestamp or datetime.utcnow(),
+    }
+
+
+def model_to_latest_metric(model: MetricLatestModel) -> Metric:
+    return Metric(
+        id=model.metric_id,
+        widget_id=model.widget_id,
+        metric_name=model.metric_name,
+        metric_value=MetricValue(model.metric_value),
+        metric_type=MetricType(model.metric_type) if model.metric_type else MetricType.RAW,
+        dimensions=model.dimensions,
+        timestamp=model.timestamp,
+    )
+
+
+def metric_row_to_latest_row(row: dict) -> dict:
+    return {
+        "widget_id": row["widget_id"],
+        "metric_name": row["metric_name"],
+        "metric_id": row["id"],
+        "metric_value": row["metric_value"],
+        "metric_type": row["metric_type"],
+        "dimensions": row["dimensions"],
+        "timestamp": row["timestamp"],
+    }
+
+
 def model_to_data_source(model: DataSourceModel) -> DataSource:
     return DataSource(
         id=model.id,
@@ -122,6 +173,68 @@ def data_source_to_model(entity: DataSource) -> DataSourceModel:
     )
 
 
+def model_to_etl_job(model: ETLJobModel) -> ETLJob:
+    return ETLJob(
+        id=model.id,
+        data_source_id=model.data_source_id,
+        job_type=model.job_type,
+        status=model.status,
+        started_at=model.started_at,
+        completed_at=model.completed_at,
+        rows_processed=model.rows_processed,
+        rows_failed=model.rows_failed,
+        error_message=model.error_message,
+        metadata=model.job_metadata,
+        stage=model.stage,
+        stage_cursor=model.stage_cursor,
+    )
+
+
+def etl_job_to_model(entity: ETLJob) -> ETLJobModel:
+    return ETLJobModel(
+        id=entity.id,
+        data_source_id=entity.data_source_id,
+        job_type=entity.job_type,
+        status=entity.status,
+        started_at=entity.started_at,
+        completed_at=entity.completed_at,
+        rows_processed=entity.rows_processed,
+        rows_failed=entity.rows_failed,
+        error_message=entity.error_message,
+        job_metadata=entity.metadata,
+        stage=entity.stage,
+        stage_cursor=entity.stage_cursor,
+    )
+
+
+def model_to_data_quality_check(model: DataQualityCheckModel) -> DataQualityCheck:
+    return DataQualityCheck(
+        id=model.id,
+        data_source_id=model.data_source_id,
+        check_type=model.check_type,
+        column_name=model.column_name,
+        expectation=model.expectation or {},
+        last_run_at=model.last_run_at,
+        last_status=model.last_status,
+        failure_count=model.failure_count or 0,
+        is_active=model.is_active,
+    )
+
+
+def data_quality_check_to_model(entity: DataQualityCheck) -> DataQualityCheckModel:
+    return DataQualityCheckModel(
+        id=entity.id,
+        data_source_id=entity.data_source_id,
+        check_type=entity.check_type,
+        column_name=entity.column_name,
+        expectation=entity.expectation,
+        last_run_at=entity.last_run_at,
+        last_status=entity.last_status,
+        failure_count=entity.failure_count,
+        is_active=entity.is_active,
+    )
+
+
 def model_to_alert(model: AlertModel) -> Alert:
     condition = model.condition or {"operator": "gt", "threshold": 0}
     return Alert(
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.domain.entities import DataQualityCheck
+from src.domain.repositories import DataQualityCheckRepository
+from src.infrastructure.persistence.models import DataQualityCheckModel
+from src.infrastructure.persistence.repositories.mappers import (
+    data_quality_check_to_model,
+    model_to_data_quality_check,
+)
+
+
+class PostgresDataQualityCheckRepository(DataQualityCheckRepository):
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def create(self, check: DataQualityCheck) -> DataQualityCheck:
+        model = data_quality_check_to_model(check)
+        self.session.add(model)
+        self.session.flush()
+        return model_to_data_quality_check(model)
+
+    def list_active_by_data_source(self, data_source_id: str) -> list[DataQualityCheck]:
+        stmt = (
+            select(DataQualityCheckModel)
+            .where(
+                DataQualityCheckModel.data_source_id == data_source_id,
+                DataQualityCheckModel.is_active.is_(True),
+            )
+            .order_by(DataQualityCheckModel.created_at)
+        )
+        return [model_to_data_quality_check(model) for model in self.session.scalars(stmt).all()]
+
+    def update_results(self, checks: list[DataQualityCheck]) -> int:
+        if not checks:
+            return 0
+        rows = [
+            {
+                "id": check.id,
+                "last_run_at": check.last_run_at,
+                "last_status": check.last_status,
+                "failure_count": check.failure_count,
+            }
+            for check in checks
+        ]
+        # Bulk UPDATE by primary key: one executemany instead of a load and flush per check.
+        self.session.execute(update(DataQualityCheckModel), rows)
+        return len(rows)
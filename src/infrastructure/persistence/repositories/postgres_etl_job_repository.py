@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.domain.entities import ETLJob
+from src.domain.repositories import ETLJobRepository
+from src.infrastructure.persistence.models import ETLJobModel
+from src.infrastructure.persistence.repositories.mappers import etl_job_to_model, model_to_etl_job
+
+
+class PostgresETLJobRepository(ETLJobRepository):
+    # "unchanged" runs skipped extraction but still confirm the source state of the last load.
+    SUCCESSFUL_STATUSES = ("completed", "unchanged")
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def create(self, job: ETLJob) -> ETLJob:
+        model = etl_job_to_model(job)
+        self.session.add(model)
+        self.session.flush()
+        return model_to_etl_job(model)
+
+    def update(self, job: ETLJob) -> ETLJob:
+        model = self.session.get(ETLJobModel, job.id)
+        if model is None:
+            return job
+        model.status = job.status
+        model.started_at = job.started_at
+        model.completed_at = job.completed_at
+        model.rows_processed = job.rows_processed
+        model.rows_failed = job.rows_failed
+        model.error_message = job.error_message
+        model.job_metadata = job.metadata
+        model.stage = job.stage
+        model.stage_cursor = job.stage_cursor
+        self.session.flush()
+        return model_to_etl_job(model)
+
+    def update_stage(self, job_id: str, stage: str | None, cursor: dict | None) -> None:
+        self.session.execute(
+            update(ETLJobModel)
+            .where(ETLJobModel.id == job_id)
+            .values(stage=stage, stage_cursor=cursor)
+        )
+
+    def get_by_id(self, job_id: str) -> ETLJob | None:
+        model = self.session.get(ETLJobModel, job_id)
+        return model_to_etl_job(model) if model else None
+
+    def get_latest_completed(self, data_source_id: str) -> ETLJob | None:
+        stmt = (
+            select(ETLJobModel)
+            .where(
+                ETLJobModel.data_source_id == data_source_id,
+                ETLJobModel.status.in_(self.SUCCESSFUL_STATUSES),
+            )
+            .order_by(ETLJobModel.completed_at.desc())
+            .limit(1)
+        )
+        model = self.session.scalars(stmt).first()
+        return model_to_etl_job(model) if model else None
+
+    def list_finished(self, data_source_id: str, start: datetime, end: datetime) -> list[ETLJob]:
+        stmt = (
+            select(ETLJobModel)
+            .where(
+                ETLJobModel.data_source_id == data_source_id,
+                ETLJobModel.started_at >= start,
+                ETLJobModel.started_at <= end,
+                ETLJobModel.completed_at.is_not(None),
+            )
+            .order_by(ETLJobModel.started_at)
+        )
+        return [model_to_etl_job(model) for model in self.session.scalars(stmt).all()]
@@ -1,33 +1,82 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import cast
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import CursorResult, Select, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, aliased
 
 from src.domain.entities import Metric
+from src.domain.enums import MetricType
 from src.domain.repositories import MetricRepository
-from src.infrastructure.persistence.models import MetricModel
-from src.infrastructure.persistence.repositories.mappers import metric_to_model, model_to_metric
+from src.domain.value_objects import MetricValue
+from src.infrastructure.persistence.models import MetricLatestModel, MetricModel, MetricRollupModel
+from src.infrastructure.persistence.repositories.mappers import (
+    metric_row_to_latest_row,
+    metric_to_model,
+    metric_to_row,
+    model_to_latest_metric,
+    model_to_metric,
+)
+from src.infrastructure.persistence.rollups import (
+    EPOCH,
+    NO_WIDGET,
+    ROLLUP_AGGREGATIONS,
+    ROLLUP_RESOLUTIONS,
+    QuantileSketch,
+    RollupKey,
+    RollupState,
+    floor_timestamp,
+    naive_utc,
+    plan_rollup,
+    rollup_states,
+)
+from src.infrastructure.persistence.timescale import continuous_aggregate
+from src.shared.config import get_settings
+
+ROLLUP_METRIC_TYPES = {
+    "avg": MetricType.AVG,
+    "sum": MetricType.SUM,
+    "count": MetricType.COUNT,
+    "min": MetricType.MIN,
+    "max": MetricType.MAX,
+}
+ROLLUP_LOOKUP_BATCH = 500
+LATEST_UPDATE_COLUMNS = ("metric_id", "metric_value", "metric_type", "dimensions", "timestamp")
+ROLLUP_KEY_COLUMNS = ("resolution", "metric_name", "widget_id", "bucket")
 
 
 class TimescaleMetricRepository(MetricRepository):
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, timescale: bool | None = None) -> None:
         self.session = session
+        if timescale is None:
+            timescale = (
+                get_settings().timescale_enabled and session.get_bind().dialect.name == "postgresql"
+            )
+        # Continuous aggregates replace the metric_rollups tables when Timescale is enabled.
+        self.timescale = timescale
 
     def create(self, metric: Metric) -> Metric:
         model = metric_to_model(metric)
         self.session.add(model)
         self.session.flush()
+        row = metric_to_row(metric)
+        self._upsert_latest([row])
+        if not self.timescale:
+            self._merge_rollups(rollup_states([self._point(row)]))
         return model_to_metric(model)
 
     def create_many(self, metrics: list[Metric]) -> int:
         if not metrics:
             return 0
-        models = [metric_to_model(item) for item in metrics]
-        self.session.add_all(models)
-        self.session.flush()
-        return len(models)
+        rows = [metric_to_row(item) for item in metrics]
+        self.session.execute(insert(MetricModel), rows)
+        self._upsert_latest(rows)
+        if not self.timescale:
+            self._merge_rollups(rollup_states(self._point(row) for row in rows))
+        return len(rows)
 
     def get_history(
         self,
@@ -35,7 +84,18 @@ class TimescaleMetricRepository(MetricRepository):
         start_date: datetime,
         end_date: datetime,
         widget_id: str | None = None,
+        resolution: timedelta | None = None,
+        aggregation: str = "avg",
     ) -> list[Metric]:
+        rollup = plan_rollup(resolution)
+        if rollup is not None and resolution is not None:
+            if aggregation not in ROLLUP_AGGREGATIONS:
+                raise ValueError(f"Unsupported rollup aggregation: {aggregation}")
+            read = self._history_from_aggregates if self.timescale else self._history_from_rollups
+            return read(
+                rollup, metric_name, start_date, end_date, widget_id, resolution, aggregation
+            )
+
         stmt = select(MetricModel).where(
             MetricModel.metric_name == metric_name,
             MetricModel.timestamp >= start_date,
@@ -50,10 +110,390 @@ class TimescaleMetricRepository(MetricRepository):
 
     def get_latest_by_widget(self, widget_id: str) -> Metric | None:
         stmt = (
-            select(MetricModel)
-            .where(MetricModel.widget_id == widget_id)
-            .order_by(MetricModel.timestamp.desc())
+            select(MetricLatestModel)
+            .where(MetricLatestModel.widget_id == widget_id)
+            .order_by(MetricLatestModel.timestamp.desc())
             .limit(1)
         )
         row = self.session.scalars(stmt).first()
-        return model_to_metric(row) if row else None
+        return model_to_latest_metric(row) if row else None
+
+    def get_latest_by_widgets(self, widget_ids: list[str]) -> dict[str, Metric]:
+        if not widget_ids:
+            return {}
+        # metric_latest holds one row per (widget, metric name), so this never touches history.
+        stmt = self._latest_query(
+            MetricLatestModel,
+            (MetricLatestModel.widget_id,),
+            MetricLatestModel.widget_id.in_(widget_ids),
+        )
+        return {row.widget_id: model_to_latest_metric(row) for row in self.session.scalars(stmt)}
+
+    def rebuild_latest(self, widget_ids: list[str] | None = None) -> int:
+        stmt = delete(MetricLatestModel)
+        criteria = MetricModel.widget_id.is_not(None)
+        if widget_ids is not None:
+            stmt = stmt.where(MetricLatestModel.widget_id.in_(widget_ids))
+            criteria = MetricModel.widget_id.in_(widget_ids)
+        self.session.execute(stmt)
+        latest = self._latest_query(
+            MetricModel, (MetricModel.widget_id, MetricModel.metric_name), criteria
+        )
+        rows = [
+            {
+                "widget_id": model.widget_id,
+                "metric_name": model.metric_name,
+                "metric_id": model.id,
+                "metric_value": model.metric_value,
+                "metric_type": model.metric_type,
+                "dimensions": model.dimensions,
+                "timestamp": model.timestamp,
+            }
+            for model in self.session.scalars(latest)
+        ]
+        if rows:
+            self.session.execute(insert(MetricLatestModel), rows)
+        return len(rows)
+
+    def get_by_widgets(
+        self,
+        widget_ids: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        metric_names: list[str] | None = None,
+    ) -> list[Metric]:
+        if not widget_ids:
+            return []
+        stmt = select(MetricModel).where(
+            MetricModel.widget_id.in_(widget_ids),
+            MetricModel.timestamp >= start_date,
+            MetricModel.timestamp <= end_date,
+        )
+        if metric_names is not None:
+            stmt = stmt.where(MetricModel.metric_name.in_(metric_names))
+        stmt = stmt.order_by(MetricModel.timestamp.asc())
+        return [model_to_metric(row) for row in self.session.scalars(stmt)]
+
+    def delete_by_widgets(
+        self,
+        widget_ids: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        metric_names: list[str] | None = None,
+    ) -> int:
+        if not widget_ids:
+            return 0
+        stmt = delete(MetricModel).where(
+            MetricModel.widget_id.in_(widget_ids),
+            MetricModel.timestamp >= start_date,
+            MetricModel.timestamp <= end_date,
+        )
+        stale = delete(MetricLatestModel).where(
+            MetricLatestModel.widget_id.in_(widget_ids),
+            MetricLatestModel.timestamp >= start_date,
+            MetricLatestModel.timestamp <= end_date,
+        )
+        if metric_names is not None:
+            stmt = stmt.where(MetricModel.metric_name.in_(metric_names))
+            stale = stale.where(MetricLatestModel.metric_name.in_(metric_names))
+        deleted = cast(CursorResult, self.session.execute(stmt)).rowcount or 0
+        if cast(CursorResult, self.session.execute(stale)).rowcount:
+            self.rebuild_latest(widget_ids)
+        if self.timescale:
+            return deleted
+        # min and max cannot be subtracted, so touched buckets are rebuilt from the remaining rows.
+        self.rebuild_rollups(start_date, end_date, widget_ids)
+        return deleted
+
+    def rebuild_rollups(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        widget_ids: list[str] | None = None,
+    ) -> int:
+        if self.timescale:
+            return 0
+        rebuilt = 0
+        for resolution, width in ROLLUP_RESOLUTIONS.items():
+            first_bucket = floor_timestamp(start_date, width)
+            end_bucket = floor_timestamp(end_date, width) + width
+            stmt = delete(MetricRollupModel).where(
+                MetricRollupModel.resolution == resolution,
+                MetricRollupModel.bucket >= first_bucket,
+                MetricRollupModel.bucket < end_bucket,
+            )
+            points = select(
+                MetricModel.widget_id,
+                MetricModel.metric_name,
+                MetricModel.timestamp,
+                MetricModel.metric_value,
+            ).where(MetricModel.timestamp >= first_bucket, MetricModel.timestamp < end_bucket)
+            if widget_ids is not None:
+                stmt = stmt.where(MetricRollupModel.widget_id.in_(widget_ids))
+                points = points.where(MetricModel.widget_id.in_(widget_ids))
+            self.session.execute(stmt)
+            states = rollup_states(
+                self.session.execute(points.execution_options(yield_per=10_000)),
+                {resolution: width},
+            )
+            self._insert_rollups(states)
+            rebuilt += len(states)
+        return rebuilt
+
+    def _history_from_rollups(
+        self,
+        rollup: str,
+        metric_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        widget_id: str | None,
+        resolution: timedelta,
+        aggregation: str,
+    ) -> list[Metric]:
+        stmt = select(MetricRollupModel).where(
+            MetricRollupModel.resolution == rollup,
+            MetricRollupModel.metric_name == metric_name,
+            MetricRollupModel.bucket >= floor_timestamp(start_date, ROLLUP_RESOLUTIONS[rollup]),
+            MetricRollupModel.bucket <= end_date,
+        )
+        if widget_id:
+            stmt = stmt.where(MetricRollupModel.widget_id == widget_id)
+
+        # Rollup buckets are merged into buckets of the requested resolution.
+        buckets: dict[tuple[str | None, datetime], RollupState] = {}
+        for model in self.session.scalars(stmt.order_by(MetricRollupModel.bucket.asc())):
+            key = (model.widget_id or None, floor_timestamp(model.bucket, resolution))
+            state = buckets.get(key)
+            if state is None:
+                state = buckets[key] = RollupState()
+            state.merge(self._state(model))
+
+        history = []
+        for (widget, bucket), state in sorted(buckets.items(), key=lambda item: item[0][1]):
+            value = state.value(aggregation)
+            if value is not None:
+                history.append(
+                    self._bucket_metric(
+                        rollup, metric_name, widget, bucket, aggregation, value, state.count
+                    )
+                )
+        return history
+
+    def _history_from_aggregates(
+        self,
+        rollup: str,
+        metric_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        widget_id: str | None,
+        resolution: timedelta,
+        aggregation: str,
+    ) -> list[Metric]:
+        stmt = self.aggregate_query(
+            rollup, metric_name, start_date, end_date, widget_id, resolution, aggregation
+        )
+        history = []
+        for row in self.session.execute(stmt):
+            # Row.count is the tuple method, so the labelled column is read from the mapping.
+            count = int(row._mapping["count"])
+            if aggregation in ROLLUP_METRIC_TYPES:
+                state = RollupState(count, float(row.sum), row.min, row.max)
+                value = state.value(aggregation)
+            else:
+                value = row.value
+            if value is None:
+                continue
+            history.append(
+                self._bucket_metric(
+                    rollup, metric_name, row.widget_id, row.bucket, aggregation, value, count
+                )
+            )
+        return history
+
+    @staticmethod
+    def aggregate_query(
+        rollup: str,
+        metric_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        widget_id: str | None,
+        resolution: timedelta,
+        aggregation: str,
+    ) -> Select:
+        if aggregation in ROLLUP_METRIC_TYPES:
+            view = continuous_aggregate(rollup)
+            bucket = func.time_bucket(resolution, view.c.bucket, EPOCH).label("bucket")
+            widget = view.c.widget_id
+            stmt = select(
+                bucket,
+                widget,
+                func.sum(view.c.count).label("count"),
+                func.sum(view.c.sum).label("sum"),
+                func.min(view.c.min).label("min"),
+                func.max(view.c.max).label("max"),
+            ).where(
+                view.c.metric_name == metric_name,
+                view.c.bucket >= floor_timestamp(start_date, ROLLUP_RESOLUTIONS[rollup]),
+                view.c.bucket <= end_date,
+            )
+            if widget_id:
+                stmt = stmt.where(view.c.widget_id == widget_id)
+        else:
+            # Continuous aggregates only keep count, sum, min and max, so percentiles are
+            # computed from the hypertable, whose chunks are pruned by the time range.
+            bucket = func.time_bucket(resolution, MetricModel.timestamp, EPOCH).label("bucket")
+            widget = MetricModel.widget_id
+            percentile = int(aggregation[1:]) / 100
+            stmt = select(
+                bucket,
+                widget,
+                func.count().label("count"),
+                func.percentile_cont(percentile)
+                .within_group(MetricModel.metric_value)
+                .label("value"),
+            ).where(
+                MetricModel.metric_name == metric_name,
+                MetricModel.timestamp >= floor_timestamp(start_date, resolution),
+                MetricModel.timestamp <= end_date,
+            )
+            if widget_id:
+                stmt = stmt.where(MetricModel.widget_id == widget_id)
+
+        return stmt.group_by(bucket, widget).order_by(bucket)
+
+    def _latest_query(self, model, partition: tuple, criteria) -> Select:
+        if self.session.get_bind().dialect.name == "postgresql":
+            return (
+                select(model)
+                .where(criteria)
+                .distinct(*partition)
+                .order_by(*partition, model.timestamp.desc())
+            )
+        ranked = (
+            select(
+                model,
+                func.row_number()
+                .over(partition_by=partition, order_by=model.timestamp.desc())
+                .label("rank"),
+            )
+            .where(criteria)
+            .subquery()
+        )
+        latest = aliased(model, ranked)
+        return select(latest).where(ranked.c.rank == 1)
+
+    def _upsert_latest(self, rows: list[dict]) -> None:
+        latest: dict[tuple[str, str], dict] = {}
+        for row in rows:
+            if row["widget_id"] is None:
+                continue
+            key = (row["widget_id"], row["metric_name"])
+            current = latest.get(key)
+            # A key may only appear once per upsert statement on PostgreSQL.
+            if current is None or naive_utc(row["timestamp"]) >= naive_utc(current["timestamp"]):
+                latest[key] = row
+        if not latest:
+            return
+        dialect = self.session.get_bind().dialect.name
+        stmt = (postgresql_insert if dialect == "postgresql" else sqlite_insert)(MetricLatestModel)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MetricLatestModel.widget_id, MetricLatestModel.metric_name],
+            set_={column: stmt.excluded[column] for column in LATEST_UPDATE_COLUMNS},
+            where=stmt.excluded.timestamp >= MetricLatestModel.timestamp,
+        )
+        self.session.execute(stmt, [metric_row_to_latest_row(row) for row in latest.values()])
+
+    @staticmethod
+    def _bucket_metric(
+        rollup: str,
+        metric_name: str,
+        widget_id: str | None,
+        bucket: datetime,
+        aggregation: str,
+        value: float,
+        count: int,
+    ) -> Metric:
+        return Metric(
+            id=f"{rollup}:{widget_id or '-'}:{bucket.isoformat()}",
+            widget_id=widget_id,
+            metric_name=metric_name,
+            metric_value=MetricValue(value),
+            metric_type=ROLLUP_METRIC_TYPES.get(aggregation, MetricType.PERCENTILE),
+            timestamp=bucket,
+            dimensions={"rollup": rollup, "aggregation": aggregation, "count": count},
+        )
+
+    def _merge_rollups(self, states: dict[RollupKey, RollupState]) -> None:
+        if not states:
+            return
+        # A missing bucket cannot be locked, so new buckets are inserted first. Buckets another
+        # writer already holds are skipped by ON CONFLICT and then merged under a row lock.
+        pending = dict(states)
+        for key in self._insert_missing_rollups(states):
+            pending.pop(key, None)
+        keys = sorted(pending)
+        for offset in range(0, len(keys), ROLLUP_LOOKUP_BATCH):
+            batch = keys[offset : offset + ROLLUP_LOOKUP_BATCH]
+            stmt = (
+                select(MetricRollupModel)
+                .where(
+                    MetricRollupModel.resolution.in_({key[0] for key in batch}),
+                    MetricRollupModel.metric_name.in_({key[1] for key in batch}),
+                    MetricRollupModel.widget_id.in_({key[2] for key in batch}),
+                    MetricRollupModel.bucket.in_({key[3] for key in batch}),
+                )
+                .order_by(*(getattr(MetricRollupModel, column) for column in ROLLUP_KEY_COLUMNS))
+                .with_for_update()
+            )
+            for model in self.session.scalars(stmt):
+                key = (model.resolution, model.metric_name, model.widget_id, model.bucket)
+                state = pending.pop(key, None)
+                if state is None:
+                    continue
+                merged = self._state(model)
+                merged.merge(state)
+                model.count = merged.count
+                model.sum = merged.sum
+                model.min = merged.min
+                model.max = merged.max
+                model.sketch = merged.sketch.to_dict()
+        self.session.flush()
+
+    def _insert_missing_rollups(self, states: dict[RollupKey, RollupState]) -> set[RollupKey]:
+        dialect = self.session.get_bind().dialect.name
+        stmt = (postgresql_insert if dialect == "postgresql" else sqlite_insert)(MetricRollupModel)
+        returning = stmt.on_conflict_do_nothing(index_elements=list(ROLLUP_KEY_COLUMNS)).returning(
+            *(getattr(MetricRollupModel, column) for column in ROLLUP_KEY_COLUMNS)
+        )
+        inserted = self.session.execute(returning, self._rollup_rows(states))
+        return {(row.resolution, row.metric_name, row.widget_id, row.bucket) for row in inserted}
+
+    def _insert_rollups(self, states: dict[RollupKey, RollupState]) -> None:
+        if states:
+            self.session.execute(insert(MetricRollupModel), self._rollup_rows(states))
+
+    @staticmethod
+    def _rollup_rows(states: dict[RollupKey, RollupState]) -> list[dict]:
+        return [
+            {
+                "resolution": resolution,
+                "metric_name": metric_name,
+                "widget_id": widget_id,
+                "bucket": bucket,
+                "count": state.count,
+                "sum": state.sum,
+                "min": state.min,
+                "max": state.max,
+                "sketch": state.sketch.to_dict(),
+            }
+            for (resolution, metric_name, widget_id, bucket), state in states.items()
+        ]
+
+    @staticmethod
+    def _state(model: MetricRollupModel) -> RollupState:
+        sketch = QuantileSketch(model.sketch)
+        return RollupState(model.count, model.sum, model.min, model.max, sketch)
+
+    @staticmethod
+    def _point(row: dict) -> tuple[str | None, str, datetime, float]:
+        return row["widget_id"], row["metric_name"], row["timestamp"], row["metric_value"]
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+ROLLUP_RESOLUTIONS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+ROLLUP_AGGREGATIONS = {"avg", "sum", "count", "min", "max", "p50", "p90", "p95", "p99"}
+EPOCH = datetime(1970, 1, 1)
+# Unique constraints treat NULLs as distinct, so rollup rows without a widget store "".
+NO_WIDGET = ""
+
+
+def naive_utc(timestamp: datetime) -> datetime:
+    # Timestamp columns are stored without a zone, so keys are compared as naive UTC.
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(UTC).replace(tzinfo=None)
+
+
+def floor_timestamp(timestamp: datetime, width: timedelta) -> datetime:
+    timestamp = naive_utc(timestamp)
+    return EPOCH + ((timestamp - EPOCH) // width) * width
+
+
+def auto_resolution(start: datetime, end: datetime, max_points: int) -> timedelta:
+    resolution = (end - start) / max(max_points, 1)
+    widths = [width for width in ROLLUP_RESOLUTIONS.values() if width <= resolution]
+    if not widths:
+        return resolution
+    # Whole multiples of the rollup width keep every output bucket made of complete rollup buckets.
+    return widths[-1] * math.ceil(resolution / widths[-1])
+
+
+def plan_rollup(resolution: timedelta | None) -> str | None:
+    # The coarsest rollup that still divides the requested resolution; other requests read raw
+    # rows, because rollup buckets straddling an output bucket would skew its quantiles.
+    if resolution is None:
+        return None
+    candidates = [
+        name
+        for name, width in ROLLUP_RESOLUTIONS.items()
+        if width <= resolution and resolution % width == timedelta(0)
+    ]
+    return candidates[-1] if candidates else None
+
+
+class QuantileSketch:
+    # Log-spaced bins in the style of DDSketch: quantiles carry a bounded relative error and
+    # two sketches merge by adding bin counts, so bucket states can be combined in any order.
+    RELATIVE_ACCURACY = 0.01
+
+    def __init__(self, state: dict | None = None) -> None:
+        state = state or {}
+        self.gamma = (1 + self.RELATIVE_ACCURACY) / (1 - self.RELATIVE_ACCURACY)
+        self.positive: dict[int, int] = {
+            int(key): count for key, count in state.get("p", {}).items()
+        }
+        self.negative: dict[int, int] = {
+            int(key): count for key, count in state.get("n", {}).items()
+        }
+        self.zero = int(state.get("z", 0))
+
+    @property
+    def count(self) -> int:
+        return self.zero + sum(self.positive.values()) + sum(self.negative.values())
+
+    def add(self, value: float) -> None:
+        if value == 0:
+            self.zero += 1
+            return
+        bins = self.positive if value > 0 else self.negative
+        key = math.ceil(math.log(abs(value), self.gamma))
+        bins[key] = bins.get(key, 0) + 1
+
+    def add_many(self, values: np.ndarray) -> None:
+        values = values[np.isfinite(values)]
+        self.zero += int(np.count_nonzero(values == 0))
+        for bins, selected in (
+            (self.positive, values[values > 0]),
+            (self.negative, -values[values < 0]),
+        ):
+            if not selected.size:
+                continue
+            keys, counts = np.unique(
+                np.ceil(np.log(selected) / math.log(self.gamma)).astype("int64"), return_counts=True
+            )
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                bins[key] = bins.get(key, 0) + count
+
+    def merge(self, other: QuantileSketch) -> None:
+        self.zero += other.zero
+        for bins, other_bins in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_bins.items():
+                bins[key] = bins.get(key, 0) + count
+
+    def quantile(self, q: float) -> float | None:
+        total = self.count
+        if not total:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+    def to_dict(self) -> dict:
+        return {
+            "p": {str(key): count for key, count in self.positive.items()},
+            "n": {str(key): count for key, count in self.negative.items()},
+            "z": self.zero,
+        }
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma**key / (self.gamma + 1)
+
+
+@dataclass(slots=True)
+class RollupState:
+    count: int = 0
+    sum: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sketch.add(value)
+
+    def merge(self, other: RollupState) -> None:
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def value(self, aggregation: str) -> float | None:
+        if not self.count:
+            return None
+        if aggregation == "avg":
+            return self.sum / self.count
+        if aggregation == "sum":
+            return self.sum
+        if aggregation == "count":
+            return float(self.count)
+        if aggregation == "min":
+            return self.min
+        if aggregation == "max":
+            return self.max
+        return self.sketch.quantile(int(aggregation[1:]) / 100)
+
+
+RollupKey = tuple[str, str, str, datetime]
+
+
+def rollup_states(
+    points: Iterable[tuple[str | None, str, datetime, float]],
+    resolutions: dict[str, timedelta] = ROLLUP_RESOLUTIONS,
+) -> dict[RollupKey, RollupState]:
+    states: dict[RollupKey, RollupState] = {}
+    for widget_id, metric_name, timestamp, value in points:
+        for resolution, width in resolutions.items():
+            key = (
+                resolution,
+                metric_name,
+                widget_id or NO_WIDGET,
+                floor_timestamp(timestamp, width),
+            )
+            state = states.get(key)
+            if state is None:
+                state = states[key] = RollupState()
+            state.add(value)
+    return states
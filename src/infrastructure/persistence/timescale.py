@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from sqlalchemy import Connection, column, table, text
+
+from src.infrastructure.persistence.rollups import ROLLUP_RESOLUTIONS
+
+CONTINUOUS_AGGREGATES = {resolution: f"metrics_{resolution}" for resolution in ROLLUP_RESOLUTIONS}
+
+# start_offset, end_offset and schedule_interval of each refresh policy; recent buckets are
+# served by real-time aggregation until the policy materializes them.
+REFRESH_POLICIES = {
+    "minute": (timedelta(hours=2), timedelta(minutes=1), timedelta(minutes=1)),
+    "hour": (timedelta(days=3), timedelta(hours=1), timedelta(minutes=30)),
+    "day": (timedelta(days=7), timedelta(days=1), timedelta(hours=1)),
+}
+
+
+def continuous_aggregate(resolution: str):
+    return table(
+        CONTINUOUS_AGGREGATES[resolution],
+        column("bucket"),
+        column("metric_name"),
+        column("widget_id"),
+        column("count"),
+        column("sum"),
+        column("min"),
+        column("max"),
+    )
+
+
+def timescale_available(connection: Connection) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.execute(
+            text("SELECT 1 FROM pg_available_extensions WHERE name = 'timescaledb'")
+        ).scalar()
+    )
+
+
+def timescale_installed(connection: Connection) -> bool:
+    return bool(
+        connection.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+        ).scalar()
+    )
+
+
+def is_hypertable(connection: Connection, table_name: str = "metrics") -> bool:
+    return bool(
+        connection.execute(
+            text(
+                "SELECT 1 FROM timescaledb_information.hypertables "
+                "WHERE hypertable_name = :table_name"
+            ),
+            {"table_name": table_name},
+        ).scalar()
+    )
+
+
+def _interval(value: timedelta) -> str:
+    return f"INTERVAL '{int(value.total_seconds())} seconds'"
+
+
+def hypertable_statements(chunk_interval: timedelta, compress_after: timedelta) -> list[str]:
+    return [
+        # Unique constraints on a hypertable must include the partitioning column.
+        "ALTER TABLE metrics DROP CONSTRAINT IF EXISTS metrics_pkey",
+        'ALTER TABLE metrics ADD PRIMARY KEY (id, "timestamp")',
+        "SELECT create_hypertable('metrics', 'timestamp', "
+        f"chunk_time_interval => {_interval(chunk_interval)}, "
+        "migrate_data => true, if_not_exists => true)",
+        "ALTER TABLE metrics SET (timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'widget_id, metric_name', "
+        "timescaledb.compress_orderby = 'timestamp DESC')",
+        f"SELECT add_compression_policy('metrics', {_interval(compress_after)}, "
+        "if_not_exists => true)",
+    ]
+
+
+def continuous_aggregate_statements() -> list[str]:
+    statements = []
+    for resolution, width in ROLLUP_RESOLUTIONS.items():
+        view = CONTINUOUS_AGGREGATES[resolution]
+        start_offset, end_offset, schedule = REFRESH_POLICIES[resolution]
+        statements += [
+            f"CREATE MATERIALIZED VIEW IF NOT EXISTS {view} WITH (timescaledb.continuous) AS "
+            f'SELECT time_bucket({_interval(width)}, "timestamp") AS bucket, metric_name, '
+            "widget_id, count(*) AS count, sum(metric_value) AS sum, "
+            "min(metric_value) AS min, max(metric_value) AS max "
+            "FROM metrics GROUP BY bucket, metric_name, widget_id WITH NO DATA",
+            f"ALTER MATERIALIZED VIEW {view} SET (timescaledb.materialized_only = false)",
+            f"SELECT add_continuous_aggregate_policy('{view}', "
+            f"start_offset => {_interval(start_offset)}, "
+            f"end_offset => {_interval(end_offset)}, "
+            f"schedule_interval => {_interval(schedule)}, if_not_exists => true)",
+        ]
+    return statements
+
+
+def enable_timescale(
+    connection: Connection, chunk_interval: timedelta, compress_after: timedelta
+) -> bool:
+    if not timescale_available(connection):
+        return False
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+    statements = (
+        [] if is_hypertable(connection) else hypertable_statements(chunk_interval, compress_after)
+    )
+    for statement in statements + continuous_aggregate_statements():
+        connection.execute(text(statement))
+    return True
+
+
+def disable_timescale(connection: Connection) -> None:
+    if not timescale_installed(connection):
+        return
+    for view in reversed(CONTINUOUS_AGGREGATES.values()):
+        connection.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {view}"))
+    if is_hypertable(connection):
+        connection.execute(text("SELECT remove_compression_policy('metrics', if_exists => true)"))
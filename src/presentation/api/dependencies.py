@@ -14,6 +14,7 @@ from src.infrastructure.persistence.repositories import (
     PostgresAlertRepository,
     PostgresDashboardRepository,
     PostgresDataSourceRepository,
+    PostgresETLJobRepository,
     PostgresReportRepository,
     PostgresUserRepository,
     PostgresWidgetRepository,
@@ -52,6 +53,10 @@ def get_data_source_repository(db: Session = Depends(get_db)) -> PostgresDataSou
     return PostgresDataSourceRepository(db)
 
 
+def get_etl_job_repository(db: Session = Depends(get_db)) -> PostgresETLJobRepository:
+    return PostgresETLJobRepository(db)
+
+
 def get_alert_repository(db: Session = Depends(get_db)) -> PostgresAlertRepository:
     return PostgresAlertRepository(db)
 
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-import shutil
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
+from src.application.services import ETLJobStatsService
 from src.domain.entities import DataSource
 from src.domain.enums import DataSourceType
 from src.infrastructure.etl import ETLPipeline
+from src.infrastructure.etl.columnar_staging import stage_csv_as_parquet, staged_parquet_path
+from src.infrastructure.etl.upload_store import CSVUploadStore
 from src.infrastructure.messaging.tasks import run_etl_job
-from src.presentation.api.dependencies import TokenData, get_current_user, get_data_source_repository, get_db
-from src.presentation.api.schemas import DataSourceCreateRequest, DataSourceResponse, DataSourceUpdateRequest
+from src.presentation.api.dependencies import (
+    TokenData,
+    get_current_user,
+    get_data_source_repository,
+    get_db,
+    get_etl_job_repository,
+)
+from src.presentation.api.schemas import (
+    DataSourceCreateRequest,
+    DataSourceResponse,
+    DataSourceUpdateRequest,
+    ETLJobStatsResponse,
+)
 from src.shared.utils import generate_uuid
 
 router = APIRouter(prefix="/data-sources", tags=["data-sources"])
@@ -72,18 +85,6 @@ def _validate_config_for_type(data_source_type: DataSourceType, config: dict) ->
     )
 
 
-def _build_csv_storage_path(user_id: str, original_filename: str | None) -> Path:
-    user_dir = UPLOAD_ROOT / user_id
-    user_dir.mkdir(parents=True, exist_ok=True)
-
-    sanitized_name = (original_filename or "data.csv").replace("\\", "_").replace("/", "_")
-    if not sanitized_name.lower().endswith(".csv"):
-        sanitized_name = f"{sanitized_name}.csv"
-
-    final_name = f"{generate_uuid()}_{sanitized_name}"
-    return user_dir / final_name
-
-
 @router.post("", response_model=DataSourceResponse, status_code=status.HTTP_201_CREATED)
 def create_data_source(
     payload: DataSourceCreateRequest,
@@ -107,8 +108,10 @@ def create_data_source(
 
 @router.post("/upload-csv", response_model=DataSourceResponse, status_code=status.HTTP_201_CREATED)
 def upload_csv_data_source(
+    response: Response,
     name: str = Form(...),
     description: str | None = Form(default=None),
+    has_header: bool = Form(default=True),
     file: UploadFile = File(...),
     current_user: TokenData = Depends(get_current_user),
     repo=Depends(get_data_source_repository),
@@ -120,9 +123,47 @@ def upload_csv_data_source(
     if not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only .csv files are supported")
 
-    target_path = _build_csv_storage_path(current_user.user_id, file.filename)
-    with target_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    try:
+        upload = CSVUploadStore(UPLOAD_ROOT).save(file.file, current_user.user_id, has_header)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if upload.deduplicated:
+        existing = next(
+            (
+                source
+                for source in repo.list_by_user(current_user.user_id)
+                if source.type == DataSourceType.CSV
+                and source.config.get("content_sha256") == upload.sha256
+                and source.config.get("schema", {}).get("has_header", True) == has_header
+            ),
+            None,
+        )
+        if existing is not None:
+            # The same content already backs a data source, so it is returned instead of syncing a copy.
+            response.status_code = status.HTTP_200_OK
+            return DataSourceResponse.model_validate(existing)
+
+    schema = upload.schema
+    stat = upload.path.stat()
+    config = {
+        "filepath": str(upload.path.resolve()),
+        "content_sha256": upload.sha256,
+        "content_size": stat.st_size,
+        "content_mtime_ns": stat.st_mtime_ns,
+        "schema": schema,
+    }
+    if schema["delimiter"] != ",":
+        config["delimiter"] = schema["delimiter"]
+    column_names = None if schema["has_header"] else [column["name"] for column in schema["columns"]]
+    if column_names:
+        config["column_names"] = column_names
+
+    parquet_path: Path | None = staged_parquet_path(upload.path)
+    if not upload.deduplicated or parquet_path is None or not parquet_path.exists():
+        parquet_path = stage_csv_as_parquet(upload.path, schema["delimiter"], column_names)
+    if parquet_path is not None:
+        config["parquet_path"] = str(parquet_path.resolve())
 
     data_source = DataSource(
         id=generate_uuid(),
@@ -130,7 +171,7 @@ def upload_csv_data_source(
         name=name,
         type=DataSourceType.CSV,
         description=description,
-        config={"filepath": str(target_path.resolve())},
+        config=config,
         credentials=None,
     )
     created = repo.create(data_source)
@@ -201,6 +242,7 @@ def test_data_source(
 @router.post("/{data_source_id}/sync", status_code=status.HTTP_202_ACCEPTED)
 def sync_data_source(
     data_source_id: str,
+    force: bool = False,
     current_user: TokenData = Depends(get_current_user),
     repo=Depends(get_data_source_repository),
     db: Session = Depends(get_db),
@@ -217,20 +259,28 @@ def sync_data_source(
 
     try:
         run_etl_job.apply_async(
-            args=[data_source.type.value, data_source.config, destination_table, data_source.id],
+            args=[data_source.type.value, data_source.config, destination_table, data_source.id, force],
             ignore_result=True,
         )
     except Exception:
         # Fallback for environments without Celery/Redis broker.
         try:
-            ETLPipeline().run(
+            result = ETLPipeline().run(
                 data_source.type.value,
                 data_source.config,
                 destination_table,
                 data_source_id=data_source.id,
+                force=force,
             )
-            sync_status = "success"
-            sync_message = "Sync completed locally (queue unavailable)"
+            if result["status"] == "unchanged":
+                sync_status = "unchanged"
+                sync_message = "Source unchanged since the last sync (queue unavailable)"
+            elif result["status"] == "blocked":
+                sync_status = "blocked"
+                sync_message = "Sync blocked by failing data quality checks (queue unavailable)"
+            else:
+                sync_status = "success"
+                sync_message = "Sync completed locally (queue unavailable)"
         except (KeyError, ValueError, FileNotFoundError) as exc:
             raise HTTPException(status_code=400, detail=f"Invalid data source config: {exc}") from exc
 
@@ -240,3 +290,22 @@ def sync_data_source(
     db.commit()
 
     return {"message": sync_message, "data_source_id": data_source_id, "destination_table": destination_table}
+
+
+@router.get("/{data_source_id}/jobs/stats", response_model=ETLJobStatsResponse)
+def get_data_source_job_stats(
+    data_source_id: str,
+    days: int = Query(default=30, ge=1, le=365),
+    period: str = Query(default="day", pattern="^(hour|day|week)$"),
+    current_user: TokenData = Depends(get_current_user),
+    repo=Depends(get_data_source_repository),
+    job_repo=Depends(get_etl_job_repository),
+):
+    data_source = repo.get_by_id(data_source_id)
+    if data_source is None or data_source.user_id != current_user.user_id:
+        raise HTTPException(status_code=404, detail="Data source not found")
+
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=days)
+    buckets = ETLJobStatsService(job_repo).performance(data_source_id, start_date, end_date, period)
+    return {"data_source_id": data_source_id, "period": period, "buckets": buckets}
@@ -14,6 +14,7 @@ from src.application.use_cases.metrics import (
     GetMetricTrendUseCase,
 )
 from src.infrastructure.monitoring import metric_calculation_duration
+from src.infrastructure.persistence.rollups import ROLLUP_RESOLUTIONS, auto_resolution
 from src.presentation.api.dependencies import get_db, get_metric_repository
 from src.presentation.api.schemas import (
     CalculateMetricRequest,
@@ -24,6 +25,8 @@ from src.presentation.api.schemas import (
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
+HISTORY_MAX_POINTS = 1000
+
 
 @router.get("")
 def list_metrics(
@@ -82,12 +85,19 @@ def get_metric_history(
     metric_name: str,
     days: int = Query(default=30, ge=1, le=365),
     widget_id: str | None = Query(default=None),
+    resolution: str | None = Query(default=None, pattern="^(minute|hour|day|auto)$"),
+    aggregation: str = Query(default="avg", pattern="^(avg|sum|count|min|max|p50|p90|p95|p99)$"),
     metric_repo=Depends(get_metric_repository),
 ):
     end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=days)
+    bucket: timedelta | None = None
+    if resolution == "auto":
+        bucket = auto_resolution(start_date, end_date, HISTORY_MAX_POINTS)
+    elif resolution is not None:
+        bucket = ROLLUP_RESOLUTIONS[resolution]
     use_case = GetMetricHistoryUseCase(metric_repo)
-    history = use_case.execute(metric_name, start_date, end_date, widget_id)
+    history = use_case.execute(metric_name, start_date, end_date, widget_id, bucket, aggregation)
     return [
         MetricHistoryResponse(
             id=item.id,
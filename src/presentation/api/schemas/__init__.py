@@ -10,6 +10,8 @@ from src.presentation.api.schemas.data_source_schemas import (
     DataSourceCreateRequest,
     DataSourceResponse,
     DataSourceUpdateRequest,
+    ETLJobStatsBucket,
+    ETLJobStatsResponse,
 )
 from src.presentation.api.schemas.metric_schemas import (
     CalculateMetricRequest,
@@ -33,6 +35,8 @@ __all__ = [
     "DataSourceCreateRequest",
     "DataSourceResponse",
     "DataSourceUpdateRequest",
+    "ETLJobStatsBucket",
+    "ETLJobStatsResponse",
     "GenerateReportRequest",
     "LoginRequest",
     "MetricHistoryResponse",
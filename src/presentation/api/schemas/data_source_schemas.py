@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.domain.enums import DataSourceType
@@ -32,3 +34,23 @@ class DataSourceResponse(BaseModel):
     config: dict
     is_active: bool
     last_sync_status: str | None
+
+
+class ETLJobStatsBucket(BaseModel):
+    period_start: datetime
+    runs: int
+    statuses: dict[str, int]
+    rows_processed: int
+    rows_failed: int
+    p50_seconds: float | None
+    p95_seconds: float | None
+    p50_rows_per_second: float | None
+    p95_rows_per_second: float | None
+    p95_stage_seconds: dict[str, float | None]
+    peak_rss_bytes: int
+
+
+class ETLJobStatsResponse(BaseModel):
+    data_source_id: str
+    period: str
+    buckets: list[ETLJobStatsBucket]
@@ -21,9 +21,14 @@ class Settings(BaseSettings):
 
     database_url: str = Field(default="sqlite:///./kpi_dashboard.db", alias="DATABASE_URL")
     test_database_url: str = Field(default="sqlite:///./kpi_dashboard_test.db", alias="TEST_DATABASE_URL")
+    timescale_enabled: bool = Field(default=False, alias="TIMESCALE_ENABLED")
+    timescale_chunk_interval_days: int = Field(default=7, alias="TIMESCALE_CHUNK_INTERVAL_DAYS")
+    timescale_compress_after_days: int = Field(default=30, alias="TIMESCALE_COMPRESS_AFTER_DAYS")
 
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
     cache_enabled: bool = Field(default=True, alias="CACHE_ENABLED")
+    cache_snapshot_chunk_rows: int = Field(default=50_000, alias="CACHE_SNAPSHOT_CHUNK_ROWS")
+    cache_snapshot_max_bytes: int = Field(default=64 * 1024 * 1024, alias="CACHE_SNAPSHOT_MAX_BYTES")
 
     minio_endpoint: str = Field(default="localhost:9000", alias="MINIO_ENDPOINT")
     minio_access_key: str = Field(default="minioadmin", alias="MINIO_ACCESS_KEY")
@@ -34,6 +39,20 @@ class Settings(BaseSettings):
     celery_broker_url: str = Field(default="redis://localhost:6379/1", alias="CELERY_BROKER_URL")
     celery_result_backend: str = Field(default="redis://localhost:6379/2", alias="CELERY_RESULT_BACKEND")
 
+    etl_chunk_size: int = Field(default=0, alias="ETL_CHUNK_SIZE")
+    etl_schema_inference: bool = Field(default=False, alias="ETL_SCHEMA_INFERENCE")
+    etl_category_max_ratio: float = Field(default=0.5, alias="ETL_CATEGORY_MAX_RATIO")
+    etl_checkpoints: bool = Field(default=False, alias="ETL_CHECKPOINTS")
+    etl_checkpoint_dir: str = Field(default="storage/etl_checkpoints", alias="ETL_CHECKPOINT_DIR")
+    etl_transform_engine: str = Field(default="pandas", alias="ETL_TRANSFORM_ENGINE")
+    etl_transform_workers: int = Field(default=1, alias="ETL_TRANSFORM_WORKERS")
+    etl_transform_partition_rows: int = Field(default=250_000, alias="ETL_TRANSFORM_PARTITION_ROWS")
+    metric_backfill_workers: int = Field(default=4, alias="METRIC_BACKFILL_WORKERS")
+    external_db_pool_size: int = Field(default=5, alias="EXTERNAL_DB_POOL_SIZE")
+    external_db_max_overflow: int = Field(default=5, alias="EXTERNAL_DB_MAX_OVERFLOW")
+    external_db_pool_idle_seconds: float = Field(default=900.0, alias="EXTERNAL_DB_POOL_IDLE_SECONDS")
+    external_db_max_engines: int = Field(default=200, alias="EXTERNAL_DB_MAX_ENGINES")
+
     cors_origins: str = Field(default="http://localhost:3000,http://localhost:5173", alias="CORS_ORIGINS")
 
     admin_email: str = Field(default="admin@example.com", alias="ADMIN_EMAIL")
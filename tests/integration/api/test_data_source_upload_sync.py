@@ -1,15 +1,25 @@
 ﻿from pathlib import Path
 
+import pytest
+
+from src.infrastructure.etl.extractors import CSVExtractor, csv_extractor
 from src.presentation.api.routers import data_sources as data_sources_router
 
 
+@pytest.fixture(autouse=True)
+def upload_root(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_sources_router, "UPLOAD_ROOT", tmp_path / "data_sources")
+
+
 def test_upload_csv_and_sync_generates_metrics(client, auth_headers, monkeypatch):
     def _force_queue_failure(*args, **kwargs):
         raise RuntimeError("queue unavailable")
 
     monkeypatch.setattr(data_sources_router.run_etl_job, "apply_async", _force_queue_failure)
 
-    csv_content = "date,revenue,customers\n2026-01-01,100,10\n2026-01-02,150,15\n2026-01-03,200,20\n"
+    csv_content = (
+        "date,revenue,customers\n2026-01-01,100,10\n2026-01-02,150,15\n2026-01-03,200,20\n"
+    )
     upload_response = client.post(
         "/api/v1/data-sources/upload-csv",
         data={"name": "Uploaded Sales CSV", "description": "CSV upload integration test"},
@@ -24,6 +34,7 @@ def test_upload_csv_and_sync_generates_metrics(client, auth_headers, monkeypatch
     stored_path = uploaded_source["config"].get("filepath")
     assert stored_path is not None
     assert Path(stored_path).exists()
+    assert Path(uploaded_source["config"]["parquet_path"]).exists()
 
     dashboard_response = client.post(
         "/api/v1/dashboards",
@@ -54,7 +65,9 @@ def test_upload_csv_and_sync_generates_metrics(client, auth_headers, monkeypatch
     sync_response = client.post(f"/api/v1/data-sources/{data_source_id}/sync", headers=auth_headers)
     assert sync_response.status_code == 202
 
-    dashboard_data_response = client.get(f"/api/v1/dashboards/{dashboard_id}/data", headers=auth_headers)
+    dashboard_data_response = client.get(
+        f"/api/v1/dashboards/{dashboard_id}/data", headers=auth_headers
+    )
     assert dashboard_data_response.status_code == 200
     dashboard_data = dashboard_data_response.json()
 
@@ -62,3 +75,100 @@ def test_upload_csv_and_sync_generates_metrics(client, auth_headers, monkeypatch
     metric_value = dashboard_data["widgets"][0]["data"]["metric_value"]
     assert metric_value is not None
     assert abs(metric_value - 450.0) < 0.0001
+
+    resync_response = client.post(
+        f"/api/v1/data-sources/{data_source_id}/sync", headers=auth_headers
+    )
+    assert resync_response.status_code == 202
+    assert resync_response.json()["message"].startswith("Source unchanged")
+
+    forced_response = client.post(
+        f"/api/v1/data-sources/{data_source_id}/sync?force=true", headers=auth_headers
+    )
+    assert forced_response.json()["message"] == "Sync completed locally (queue unavailable)"
+
+    Path(stored_path).write_text(csv_content + "2026-01-04,50,5\n")
+    changed_response = client.post(
+        f"/api/v1/data-sources/{data_source_id}/sync", headers=auth_headers
+    )
+    assert changed_response.json()["message"] == "Sync completed locally (queue unavailable)"
+
+    stats_response = client.get(
+        f"/api/v1/data-sources/{data_source_id}/jobs/stats", headers=auth_headers
+    )
+    assert stats_response.status_code == 200
+    [bucket] = stats_response.json()["buckets"]
+    assert bucket["runs"] == 4
+    assert bucket["statuses"] == {"completed": 3, "unchanged": 1}
+    assert bucket["rows_processed"] == 10
+    assert 0 < bucket["p50_seconds"] <= bucket["p95_seconds"]
+    assert bucket["p50_rows_per_second"] > 0
+    assert {"extract", "transform", "load", "materialize"} <= set(bucket["p95_stage_seconds"])
+
+
+def test_identical_csv_upload_returns_the_existing_data_source(client, auth_headers):
+    csv_content = b"day;region;amount\n2026-02-01;north;1.5\n2026-02-02;south;2.5\n"
+
+    def upload(name):
+        return client.post(
+            "/api/v1/data-sources/upload-csv",
+            data={"name": name},
+            files={"file": ("semicolons.csv", csv_content, "text/csv")},
+            headers=auth_headers,
+        )
+
+    first = upload("Semicolon Sales")
+    assert first.status_code == 201
+    config = first.json()["config"]
+    assert config["delimiter"] == ";"
+    assert config["schema"]["columns"] == [
+        {"name": "day", "type": "datetime"},
+        {"name": "region", "type": "string"},
+        {"name": "amount", "type": "float"},
+    ]
+
+    second = upload("Semicolon Sales again")
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+    assert len(list(Path(config["filepath"]).parent.glob(f"{config['content_sha256']}*"))) == 2
+
+    sync_response = client.post(
+        f"/api/v1/data-sources/{first.json()['id']}/sync", headers=auth_headers
+    )
+    assert sync_response.status_code == 202
+
+
+def test_csv_fingerprint_reuses_the_upload_digest_until_the_file_changes(
+    client, auth_headers, monkeypatch
+):
+    response = client.post(
+        "/api/v1/data-sources/upload-csv",
+        data={"name": "Digest Sales"},
+        files={"file": ("sales.csv", b"day,amount\n2026-02-01,1.5\n", "text/csv")},
+        headers=auth_headers,
+    )
+    config = response.json()["config"]
+    extractor = CSVExtractor()
+
+    def _unexpected_hash(path):
+        raise AssertionError("the upload digest should be reused")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(csv_extractor, "hash_file", _unexpected_hash)
+        assert extractor.fingerprint(config) == config["content_sha256"]
+
+    file_path = Path(config["filepath"])
+    file_path.write_bytes(b"day,amount\n2026-02-01,9.5\n")
+    assert extractor.fingerprint(config) == csv_extractor.hash_file(file_path)
+    assert extractor.fingerprint(config) != config["content_sha256"]
+
+
+def test_csv_upload_rejects_binary_content(client, auth_headers):
+    response = client.post(
+        "/api/v1/data-sources/upload-csv",
+        data={"name": "Not a CSV"},
+        files={"file": ("image.csv", b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "text/csv")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,196 @@
+import sqlite3
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+
+from src.domain.entities import DataQualityCheck
+from src.infrastructure.etl import ETLPipeline
+from src.infrastructure.etl.extractors import DatabaseExtractor
+from src.infrastructure.persistence import db_session_scope
+from src.infrastructure.persistence.repositories import (
+    PostgresDataQualityCheckRepository,
+    TimescaleMetricRepository,
+)
+from src.shared.utils import generate_uuid
+
+
+def _write_orders(db_path, rows):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS orders (id INTEGER PRIMARY KEY, amount REAL)")
+        conn.executemany("INSERT INTO orders (id, amount) VALUES (?, ?)", rows)
+
+
+def test_incremental_sync_only_fetches_rows_past_watermark(
+    client, auth_headers, db_session, tmp_path
+):
+    source_db = tmp_path / "orders.db"
+    _write_orders(source_db, [(1, 10.0), (2, 20.0)])
+    config = {
+        "connection_string": f"sqlite:///{source_db}",
+        "query": "SELECT id, amount FROM orders",
+        "incremental": {"cursor_column": "id"},
+        "schema_inference": True,
+    }
+    response = client.post(
+        "/api/v1/data-sources",
+        json={"name": "Orders DB", "type": "database", "config": config},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    data_source_id = response.json()["id"]
+    destination = f"data_source_{data_source_id.replace('-', '_')}"
+
+    first = ETLPipeline().run("database", config, destination, data_source_id=data_source_id)
+    _write_orders(source_db, [(3, 30.0)])
+    second = ETLPipeline().run("database", config, destination, data_source_id=data_source_id)
+    third = ETLPipeline().run("database", config, destination, data_source_id=data_source_id)
+
+    assert first["rows_extracted"] == 2
+    assert first["memory"]["after_bytes"] <= first["memory"]["before_bytes"]
+    assert second["rows_extracted"] == 1
+    assert third["rows_extracted"] == 0
+    assert third["status"] == "unchanged"
+    assert db_session.execute(text(f"SELECT COUNT(*) FROM {destination}")).scalar() == 3
+
+
+def test_database_extractor_streams_batches(tmp_path):
+    source_db = tmp_path / "orders.db"
+    _write_orders(source_db, [(index, float(index)) for index in range(1, 6)])
+    config = {
+        "connection_string": f"sqlite:///{source_db}",
+        "query": "SELECT id, amount FROM orders",
+    }
+
+    chunks = list(DatabaseExtractor().extract_chunks(config, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[0].columns) == ["id", "amount"]
+    assert DatabaseExtractor().extract(config)["amount"].sum() == 15.0
+
+
+def test_blocking_quality_check_stops_the_load(client, auth_headers, db_session, tmp_path):
+    source_db = tmp_path / "payments.db"
+    _write_orders(source_db, [(1, 10.0), (2, -20.0)])
+    config = {
+        "connection_string": f"sqlite:///{source_db}",
+        "query": "SELECT id, amount FROM orders",
+    }
+    response = client.post(
+        "/api/v1/data-sources",
+        json={"name": "Payments DB", "type": "database", "config": config},
+        headers=auth_headers,
+    )
+    data_source_id = response.json()["id"]
+    destination = f"data_source_{data_source_id.replace('-', '_')}"
+    with db_session_scope() as session:
+        PostgresDataQualityCheckRepository(session).create(
+            DataQualityCheck(
+                id=generate_uuid(),
+                data_source_id=data_source_id,
+                check_type="range",
+                column_name="amount",
+                expectation={"min": 0, "block": True},
+            )
+        )
+
+    result = ETLPipeline().run("database", config, destination, data_source_id=data_source_id)
+
+    assert result["status"] == "blocked"
+    assert result["quality"]["failed"] == 1
+    assert not inspect(db_session.get_bind()).has_table(destination)
+    with db_session_scope() as session:
+        [check] = PostgresDataQualityCheckRepository(session).list_active_by_data_source(
+            data_source_id
+        )
+    assert check.last_status == "failed"
+    assert check.failure_count == 1
+
+
+def test_incremental_sync_merges_partial_period_buckets(client, auth_headers, tmp_path):
+    source_db = tmp_path / "daily_orders.db"
+    with sqlite3.connect(source_db) as conn:
+        conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, date TEXT, amount REAL)")
+        conn.executemany(
+            "INSERT INTO orders VALUES (?, ?, ?)",
+            [(1, "2024-01-01", 10.0), (2, "2024-01-01", 20.0)],
+        )
+    config = {
+        "connection_string": f"sqlite:///{source_db}",
+        "query": "SELECT id, date, amount FROM orders",
+        "incremental": {"cursor_column": "id"},
+        "materialization": {"time_column": "date", "period": "daily"},
+    }
+    data_source_id = client.post(
+        "/api/v1/data-sources",
+        json={"name": "Daily Orders DB", "type": "database", "config": config},
+        headers=auth_headers,
+    ).json()["id"]
+    dashboard_id = client.post(
+        "/api/v1/dashboards",
+        json={"name": "Daily Orders", "layout": {"widgets": []}, "refresh_interval": 300},
+        headers=auth_headers,
+    ).json()["id"]
+    widget_ids = {}
+    for aggregation in ("sum", "max", "avg"):
+        widget_ids[aggregation] = client.post(
+            f"/api/v1/dashboards/{dashboard_id}/widgets",
+            json={
+                "name": f"Amount {aggregation}",
+                "type": "number",
+                "position": {"x": 0, "y": 0, "width": 4, "height": 2},
+                "config": {"metric": "amount", "aggregation": aggregation},
+                "data_source_id": data_source_id,
+            },
+            headers=auth_headers,
+        ).json()["id"]
+    destination = f"data_source_{data_source_id.replace('-', '_')}"
+
+    ETLPipeline().run("database", config, destination, data_source_id=data_source_id)
+    with sqlite3.connect(source_db) as conn:
+        conn.execute("INSERT INTO orders VALUES (3, '2024-01-01', 60.0)")
+    ETLPipeline().run("database", config, destination, data_source_id=data_source_id)
+
+    with db_session_scope() as session:
+        metrics = TimescaleMetricRepository(session).get_by_widgets(
+            list(widget_ids.values()), datetime(2024, 1, 1), datetime(2024, 1, 2)
+        )
+    values = {metric.widget_id: metric.value_as_float for metric in metrics}
+    assert len(metrics) == 3
+    assert values[widget_ids["sum"]] == 90.0
+    assert values[widget_ids["max"]] == 60.0
+    assert values[widget_ids["avg"]] == 30.0
+
+
+def test_blocking_check_discards_every_chunk_of_an_append_run(
+    client, auth_headers, db_session, tmp_path
+):
+    source_db = tmp_path / "chunked_payments.db"
+    _write_orders(source_db, [(1, 10.0), (2, 20.0), (3, -30.0)])
+    config = {
+        "connection_string": f"sqlite:///{source_db}",
+        "query": "SELECT id, amount FROM orders",
+        "chunk_size": 2,
+    }
+    response = client.post(
+        "/api/v1/data-sources",
+        json={"name": "Chunked Payments DB", "type": "database", "config": config},
+        headers=auth_headers,
+    )
+    data_source_id = response.json()["id"]
+    destination = f"data_source_{data_source_id.replace('-', '_')}"
+    with db_session_scope() as session:
+        PostgresDataQualityCheckRepository(session).create(
+            DataQualityCheck(
+                id=generate_uuid(),
+                data_source_id=data_source_id,
+                check_type="range",
+                column_name="amount",
+                expectation={"min": 0, "block": True},
+            )
+        )
+
+    result = ETLPipeline().run("database", config, destination, data_source_id=data_source_id)
+
+    assert result["status"] == "blocked"
+    assert result["rows_loaded"] == 0
+    assert not inspect(db_session.get_bind()).has_table(destination)
@@ -1,6 +1,10 @@
+from pathlib import Path
+
 import pytest
 from sqlalchemy import text
 
+from src.infrastructure.etl import ETLPipeline
+from src.infrastructure.etl.columnar_staging import stage_csv_as_parquet
 from src.infrastructure.etl.extractors.csv_extractor import CSVExtractor
 from src.infrastructure.etl.loaders.warehouse_loader import WarehouseLoader
 from src.infrastructure.etl.transformers.cleaner import DataCleaner
@@ -40,3 +44,45 @@ class TestETLPipeline:
         result = db_session.execute(text("SELECT COUNT(*) FROM test_metrics"))
         count = result.scalar()
         assert count == 4
+
+    def test_csv_extractor_yields_chunks(self, sample_csv_file):
+        chunks = list(CSVExtractor().extract_chunks({"filepath": sample_csv_file}, chunk_size=3))
+
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+
+    def test_chunked_pipeline_loads_every_chunk(self, sample_csv_file, db_session):
+        result = ETLPipeline(chunk_size=2).run(
+            "csv", {"filepath": sample_csv_file}, "test_chunked_metrics"
+        )
+
+        assert result["rows_extracted"] == 4
+        assert result["rows_loaded"] == 4
+
+        count = db_session.execute(text("SELECT COUNT(*) FROM test_chunked_metrics")).scalar()
+        assert count == 4
+
+    def test_csv_extractor_reads_staged_parquet_with_column_pruning(self, sample_csv_file):
+        parquet_path = stage_csv_as_parquet(Path(sample_csv_file))
+        assert parquet_path is not None
+
+        config = {
+            "filepath": sample_csv_file,
+            "parquet_path": str(parquet_path),
+            "columns": ["revenue"],
+        }
+        extracted = CSVExtractor().extract(config)
+
+        assert list(extracted.columns) == ["revenue"]
+        assert len(extracted) == 4
+        assert sum(len(chunk) for chunk in CSVExtractor().extract_chunks(config, chunk_size=3)) == 4
+
+    def test_pipeline_closes_the_transformer_it_builds(self, sample_csv_file, monkeypatch):
+        pipeline = ETLPipeline()
+        closed = []
+        monkeypatch.setattr(pipeline.transformer, "close", lambda: closed.append(True))
+
+        with pytest.raises(ValueError):
+            pipeline.run("csv", {"filepath": sample_csv_file}, "bad-table-name")
+        pipeline.run("csv", {"filepath": sample_csv_file}, "test_closed_transformer")
+
+        assert closed == [True, True]
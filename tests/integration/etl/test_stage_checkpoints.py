@@ -0,0 +1,194 @@
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.etl import ETLPipeline
+from src.infrastructure.etl.checkpoints import StageCheckpoint
+from src.infrastructure.etl.extractors import CSVExtractor
+from src.infrastructure.etl.loaders.warehouse_loader import WarehouseTableWriter
+from src.infrastructure.persistence import db_session_scope
+from src.infrastructure.persistence.repositories import PostgresETLJobRepository
+from src.shared.config import get_settings
+from src.shared.utils import generate_uuid
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ETL_CHECKPOINTS", "true")
+    monkeypatch.setenv("ETL_CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    get_settings.cache_clear()
+    yield tmp_path / "checkpoints"
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def csv_source(client, auth_headers, tmp_path):
+    csv_path = tmp_path / "sales.csv"
+    csv_path.write_text(
+        "date,revenue\n2024-01-01,10\n2024-01-02,20\n2024-01-03,30\n2024-01-04,40\n"
+    )
+    response = client.post(
+        "/api/v1/data-sources",
+        json={"name": "Sales CSV", "type": "csv", "config": {"filepath": str(csv_path)}},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    return response.json()["id"], {"filepath": str(csv_path)}
+
+
+def _count_extractions(monkeypatch):
+    calls = []
+    extract = CSVExtractor.extract
+    extract_chunks = CSVExtractor.extract_chunks
+
+    def counted(self, config):
+        calls.append("extract")
+        return extract(self, config)
+
+    def counted_chunks(self, config, chunk_size):
+        calls.append("extract_chunks")
+        return extract_chunks(self, config, chunk_size)
+
+    monkeypatch.setattr(CSVExtractor, "extract", counted)
+    monkeypatch.setattr(CSVExtractor, "extract_chunks", counted_chunks)
+    return calls
+
+
+def _job(job_id):
+    with db_session_scope() as session:
+        return PostgresETLJobRepository(session).get_by_id(job_id)
+
+
+def _fail(*args, **kwargs):
+    raise RuntimeError("transient failure")
+
+
+@pytest.mark.parametrize("chunk_size", [0, 3])
+def test_retry_after_load_does_not_extract_or_load_again(
+    csv_source, checkpoint_dir, monkeypatch, db_session, chunk_size
+):
+    data_source_id, config = csv_source
+    destination = f"checkpointed_sales_{chunk_size}"
+    job_id = generate_uuid()
+    failing = ETLPipeline(chunk_size=chunk_size)
+    failing.cache_loader.load = _fail
+    failing.cache_loader.publish = _fail
+    with pytest.raises(RuntimeError):
+        failing.run("csv", config, destination, data_source_id=data_source_id, job_id=job_id)
+
+    job = _job(job_id)
+    assert job.status == "failed"
+    assert job.error_message == "transient failure"
+    assert job.stage == "loaded"
+    assert checkpoint_dir.joinpath(job_id).exists()
+
+    calls = _count_extractions(monkeypatch)
+    result = ETLPipeline(chunk_size=chunk_size).run(
+        "csv", config, destination, data_source_id=data_source_id, job_id=job_id
+    )
+
+    assert result["status"] == "completed"
+    assert result["rows_extracted"] == 4
+    assert result["rows_loaded"] == 4
+    assert calls == []
+    assert db_session.execute(text(f"SELECT COUNT(*) FROM {destination}")).scalar() == 4
+    job = _job(job_id)
+    assert job.status == "completed"
+    assert job.stage is None
+    assert not checkpoint_dir.joinpath(job_id).exists()
+
+
+def test_streaming_retry_resumes_after_the_last_loaded_chunk(
+    csv_source, checkpoint_dir, monkeypatch, db_session
+):
+    data_source_id, config = csv_source
+    destination = "checkpointed_sales_chunks"
+    job_id = generate_uuid()
+    written = []
+    write = WarehouseTableWriter.write
+
+    def fail_second_chunk(self, dataframe):
+        if written:
+            raise RuntimeError("transient failure")
+        written.append(len(dataframe.index))
+        return write(self, dataframe)
+
+    monkeypatch.setattr(WarehouseTableWriter, "write", fail_second_chunk)
+    with pytest.raises(RuntimeError):
+        ETLPipeline(chunk_size=3).run(
+            "csv", config, destination, data_source_id=data_source_id, job_id=job_id
+        )
+    assert _job(job_id).stage_cursor["chunks"] == 1
+
+    monkeypatch.setattr(WarehouseTableWriter, "write", write)
+    result = ETLPipeline(chunk_size=3).run(
+        "csv", config, destination, data_source_id=data_source_id, job_id=job_id
+    )
+
+    assert result["rows_loaded"] == 4
+    assert db_session.execute(text(f"SELECT COUNT(*) FROM {destination}")).scalar() == 4
+    assert _job(job_id).status == "completed"
+
+
+def test_streaming_retry_replays_extracted_chunks_instead_of_the_changed_source(
+    csv_source, checkpoint_dir, monkeypatch, db_session
+):
+    data_source_id, config = csv_source
+    destination = "checkpointed_sales_replayed"
+    job_id = generate_uuid()
+    write = WarehouseTableWriter.write
+    written = []
+
+    def fail_second_chunk(self, dataframe):
+        if written:
+            raise RuntimeError("transient failure")
+        written.append(len(dataframe.index))
+        return write(self, dataframe)
+
+    monkeypatch.setattr(WarehouseTableWriter, "write", fail_second_chunk)
+    with pytest.raises(RuntimeError):
+        ETLPipeline(chunk_size=3).run(
+            "csv", config, destination, data_source_id=data_source_id, job_id=job_id
+        )
+    monkeypatch.setattr(WarehouseTableWriter, "write", write)
+
+    # The first chunk changes at the source, but the retry must load what the attempt extracted.
+    with open(config["filepath"], "w") as handle:
+        handle.write("date,revenue\n2024-01-01,99\n2024-01-02,99\n2024-01-03,99\n")
+        handle.write("2024-01-04,40\n2024-01-05,50\n")
+    calls = _count_extractions(monkeypatch)
+    result = ETLPipeline(chunk_size=3).run(
+        "csv", config, destination, data_source_id=data_source_id, job_id=job_id
+    )
+
+    assert calls == []
+    assert result["rows_extracted"] == 5
+    revenue = db_session.execute(text(f"SELECT revenue FROM {destination} ORDER BY date"))
+    assert [row[0] for row in revenue] == [10, 20, 30, 40, 50]
+
+
+def test_streaming_retry_does_not_append_a_chunk_twice(
+    csv_source, checkpoint_dir, monkeypatch, db_session
+):
+    data_source_id, config = csv_source
+    destination = "checkpointed_sales_unrecorded"
+    job_id = generate_uuid()
+    advance = StageCheckpoint.advance
+
+    def fail_after_first_write(self, stage=None, **cursor):
+        if cursor.get("chunks") == 1:
+            raise RuntimeError("transient failure")
+        return advance(self, stage, **cursor)
+
+    monkeypatch.setattr(StageCheckpoint, "advance", fail_after_first_write)
+    with pytest.raises(RuntimeError):
+        ETLPipeline(chunk_size=3).run(
+            "csv", config, destination, data_source_id=data_source_id, job_id=job_id
+        )
+    monkeypatch.setattr(StageCheckpoint, "advance", advance)
+
+    result = ETLPipeline(chunk_size=3).run(
+        "csv", config, destination, data_source_id=data_source_id, job_id=job_id
+    )
+
+    assert result["rows_loaded"] == 4
+    assert db_session.execute(text(f"SELECT COUNT(*) FROM {destination}")).scalar() == 4
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+from sqlalchemy import inspect, text
+
+from src.infrastructure.etl.loaders import WarehouseLoader
+
+
+def _rows(db_session, table):
+    return db_session.execute(text(f"SELECT id, amount FROM {table} ORDER BY id")).all()
+
+
+def test_replace_mode_swaps_in_a_fresh_table(db_session):
+    loader = WarehouseLoader()
+    for amount in (10.0, 20.0):
+        with loader.open("test_replace_orders", mode="replace") as writer:
+            writer.write(pd.DataFrame({"id": [1, 2], "amount": [amount, amount]}))
+
+    assert _rows(db_session, "test_replace_orders") == [(1, 20.0), (2, 20.0)]
+
+
+def test_merge_mode_upserts_on_key_columns(db_session):
+    loader = WarehouseLoader()
+    with loader.open("test_merge_orders", mode="merge", key_columns=["id"]) as writer:
+        writer.write(pd.DataFrame({"id": [1, 2], "amount": [10.0, 20.0]}))
+    with loader.open("test_merge_orders", mode="merge", key_columns=["id"]) as writer:
+        writer.write(pd.DataFrame({"id": [2, 3, 3], "amount": [25.0, 30.0, 35.0]}))
+
+    assert _rows(db_session, "test_merge_orders") == [(1, 10.0), (2, 25.0), (3, 35.0)]
+
+
+def test_failed_replace_keeps_the_previous_table(db_session):
+    loader = WarehouseLoader()
+    with loader.open("test_replace_rollback", mode="replace") as writer:
+        writer.write(pd.DataFrame({"id": [1], "amount": [10.0]}))
+
+    with pytest.raises(RuntimeError):
+        with loader.open("test_replace_rollback", mode="replace") as writer:
+            writer.write(pd.DataFrame({"id": [2], "amount": [20.0]}))
+            raise RuntimeError("extract failed mid-stream")
+
+    assert _rows(db_session, "test_replace_rollback") == [(1, 10.0)]
+
+
+def test_replace_mode_with_no_rows_clears_the_table(db_session):
+    loader = WarehouseLoader()
+    with loader.open("test_replace_empty", mode="replace") as writer:
+        writer.write(pd.DataFrame({"id": [1], "amount": [10.0]}))
+    with loader.open("test_replace_empty", mode="replace"):
+        pass
+
+    assert _rows(db_session, "test_replace_empty") == []
+
+
+def test_merge_mode_rejects_tables_with_duplicate_keys(db_session):
+    loader = WarehouseLoader()
+    with loader.open("test_merge_duplicates", mode="append") as writer:
+        writer.write(pd.DataFrame({"id": [1, 1], "amount": [10.0, 11.0]}))
+
+    with pytest.raises(ValueError, match="repeat the key columns"):
+        with loader.open("test_merge_duplicates", mode="merge", key_columns=["id"]) as writer:
+            writer.write(pd.DataFrame({"id": [2], "amount": [20.0]}))
+
+    assert _rows(db_session, "test_merge_duplicates") == [(1, 10.0), (1, 11.0)]
+    assert not [name for name in inspect(db_session.bind).get_table_names() if "__staging" in name]
+
+
+def test_deferred_writers_only_touch_the_table_on_finish(db_session):
+    loader = WarehouseLoader()
+    with pytest.raises(RuntimeError):
+        with loader.open("test_deferred_append", deferred=True) as writer:
+            writer.write(pd.DataFrame({"id": [1], "amount": [10.0]}))
+            raise RuntimeError("blocked")
+    assert not inspect(db_session.bind).has_table("test_deferred_append")
+
+    with loader.open(
+        "test_deferred_merge", mode="merge", key_columns=["id"], deferred=True
+    ) as writer:
+        writer.write(pd.DataFrame({"id": [1, 2], "amount": [10.0, 20.0]}))
+        writer.write(pd.DataFrame({"id": [2, 3], "amount": [25.0, 30.0]}))
+        assert not inspect(db_session.bind).has_table("test_deferred_merge")
+
+    assert _rows(db_session, "test_deferred_merge") == [(1, 10.0), (2, 25.0), (3, 30.0)]
+
+
+def test_merge_mode_requires_key_columns():
+    with pytest.raises(ValueError):
+        WarehouseLoader().open("test_merge_orders", mode="merge")
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, event
+
+from src.domain.entities import Metric
+from src.domain.value_objects import MetricValue
+from src.infrastructure.persistence import db_session_scope
+from src.infrastructure.persistence.models import MetricLatestModel
+from src.infrastructure.persistence.repositories import TimescaleMetricRepository
+from src.shared.utils import generate_uuid
+
+
+def _metric(widget_id: str, value: float, timestamp: datetime) -> Metric:
+    return Metric(
+        id=generate_uuid(),
+        widget_id=widget_id,
+        metric_name="revenue",
+        metric_value=MetricValue(value),
+        timestamp=timestamp,
+    )
+
+
+def test_latest_values_for_many_widgets_come_from_one_query(client):
+    widget_ids = [generate_uuid() for _ in range(3)]
+    start = datetime(2024, 5, 1)
+    with db_session_scope() as session:
+        TimescaleMetricRepository(session).create_many(
+            [
+                _metric(widget_id, float(index * 10 + hour), start + timedelta(hours=hour))
+                for index, widget_id in enumerate(widget_ids[:2])
+                for hour in (2, 0, 1)
+            ]
+        )
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with db_session_scope() as session:
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            latest = TimescaleMetricRepository(session).get_latest_by_widgets(widget_ids)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert "FROM metric_latest" in statements[0]
+    assert set(latest) == set(widget_ids[:2])
+    assert [latest[widget_id].value_as_float for widget_id in widget_ids[:2]] == [2.0, 12.0]
+    assert latest[widget_ids[0]].timestamp == start + timedelta(hours=2)
+
+
+def test_latest_table_ignores_late_points_and_follows_deletes(client):
+    widget_id = generate_uuid()
+    start = datetime(2024, 6, 1)
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        repo.create_many(
+            [_metric(widget_id, 1.0, start), _metric(widget_id, 2.0, start + timedelta(days=1))]
+        )
+        repo.create(_metric(widget_id, 0.5, start - timedelta(days=1)))
+        assert repo.get_latest_by_widget(widget_id).value_as_float == 2.0
+
+        repo.delete_by_widgets([widget_id], start + timedelta(hours=12), start + timedelta(days=2))
+        assert repo.get_latest_by_widget(widget_id).value_as_float == 1.0
+
+        session.execute(delete(MetricLatestModel).where(MetricLatestModel.widget_id == widget_id))
+        assert repo.get_latest_by_widget(widget_id) is None
+        assert repo.rebuild_latest([widget_id]) == 1
+        assert repo.get_latest_by_widgets([widget_id])[widget_id].timestamp == start
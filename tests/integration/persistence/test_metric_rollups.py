@@ -0,0 +1,109 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.entities import Metric
+from src.domain.value_objects import MetricValue
+from src.infrastructure.persistence import db_session_scope
+from src.infrastructure.persistence.repositories import TimescaleMetricRepository
+from src.infrastructure.persistence.rollups import QuantileSketch, auto_resolution, plan_rollup
+from src.shared.utils import generate_uuid
+
+START = datetime(2024, 3, 1)
+
+
+def _metrics(
+    metric_name: str, widget_id: str, values: list[float], step: timedelta, offset: int = 0
+) -> list[Metric]:
+    return [
+        Metric(
+            id=generate_uuid(),
+            widget_id=widget_id,
+            metric_name=metric_name,
+            metric_value=MetricValue(value),
+            timestamp=START + step * (offset + index),
+        )
+        for index, value in enumerate(values)
+    ]
+
+
+def test_sketches_merge_within_relative_accuracy():
+    values = [random.Random(7).lognormvariate(3, 1) for _ in range(5000)]
+    left, right = QuantileSketch(), QuantileSketch()
+    for index, value in enumerate(values):
+        (left if index % 2 else right).add(value)
+    left.merge(QuantileSketch(right.to_dict()))
+
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert left.quantile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_planner_picks_the_coarsest_rollup_dividing_the_resolution():
+    assert plan_rollup(None) is None
+    assert plan_rollup(timedelta(seconds=30)) is None
+    assert plan_rollup(timedelta(minutes=5)) == "minute"
+    assert plan_rollup(timedelta(hours=6)) == "hour"
+    assert plan_rollup(timedelta(days=7)) == "day"
+    assert plan_rollup(timedelta(minutes=90)) == "minute"
+    assert plan_rollup(timedelta(seconds=90)) is None
+    assert auto_resolution(START, START + timedelta(days=90), 1000) == timedelta(hours=3)
+
+
+def test_history_reads_incremental_rollups_and_deletes_rebuild_them(client):
+    metric_name = f"rollup_{generate_uuid().replace('-', '')[:8]}"
+    widget_id = generate_uuid()
+    step = timedelta(minutes=10)
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        # Two batches landing in the same hour buckets are merged into the existing rollup rows.
+        repo.create_many(_metrics(metric_name, widget_id, [float(i) for i in range(9)], step))
+        repo.create(_metrics(metric_name, widget_id, [100.0], step, offset=9)[0])
+
+    end = START + timedelta(hours=2)
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        raw = repo.get_history(metric_name, START, end, widget_id)
+        hourly = repo.get_history(metric_name, START, end, widget_id, timedelta(hours=1))
+        maxima = repo.get_history(metric_name, START, end, widget_id, timedelta(hours=1), "max")
+        with pytest.raises(ValueError):
+            repo.get_history(metric_name, START, end, widget_id, timedelta(hours=1), "median")
+
+    assert len(raw) == 10
+    assert [item.timestamp for item in hourly] == [START, START + timedelta(hours=1)]
+    assert [item.value_as_float for item in hourly] == [2.5, (6 + 7 + 8 + 100) / 4]
+    assert [item.dimensions["count"] for item in hourly] == [6, 4]
+    assert [item.value_as_float for item in maxima] == [5.0, 100.0]
+
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        deleted = repo.delete_by_widgets([widget_id], START + step * 9, START + step * 9)
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        maxima = repo.get_history(metric_name, START, end, widget_id, timedelta(hours=1), "max")
+        daily = repo.get_history(metric_name, START, end, widget_id, timedelta(days=1), "count")
+
+    assert deleted == 1
+    assert [item.value_as_float for item in maxima] == [5.0, 8.0]
+    assert [item.value_as_float for item in daily] == [9.0]
+
+
+def test_metrics_without_a_widget_merge_into_one_rollup_row(client):
+    metric_name = f"rollup_{generate_uuid().replace('-', '')[:8]}"
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        for value in (1.0, 3.0):
+            metric = _metrics(metric_name, "", [value], timedelta(minutes=1))[0]
+            metric.widget_id = None
+            repo.create_many([metric])
+
+    with db_session_scope() as session:
+        repo = TimescaleMetricRepository(session)
+        hourly = repo.get_history(
+            metric_name, START, START + timedelta(hours=1), resolution=timedelta(hours=1)
+        )
+
+    assert [(item.widget_id, item.value_as_float) for item in hourly] == [(None, 2.0)]
+    assert hourly[0].dimensions["count"] == 2
@@ -0,0 +1,82 @@
+from datetime import datetime
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+from src.infrastructure.persistence.database import Base
+from src.shared.config import get_settings
+
+METRICS = [
+    ("m1", "w1", "orders", 2.0, datetime(2024, 3, 1, 10, 5)),
+    ("m2", "w1", "orders", 4.0, datetime(2024, 3, 1, 10, 40)),
+    ("m3", None, "orders", 7.0, datetime(2024, 3, 2, 9, 0)),
+]
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    get_settings.cache_clear()
+    engine = sa.create_engine(url)
+    yield engine, Config("alembic.ini")
+    engine.dispose()
+    get_settings.cache_clear()
+
+
+def _insert_metrics(engine):
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "INSERT INTO metrics "
+                "(id, widget_id, metric_name, metric_value, timestamp, created_at) "
+                "VALUES (:id, :widget_id, :metric_name, :metric_value, :timestamp, :timestamp)"
+            ),
+            [
+                dict(zip(("id", "widget_id", "metric_name", "metric_value", "timestamp"), row))
+                for row in METRICS
+            ],
+        )
+
+
+def _hourly_rollups(engine):
+    with engine.connect() as connection:
+        return connection.execute(
+            sa.text(
+                "SELECT widget_id, count, sum, min, max FROM metric_rollups "
+                "WHERE resolution = 'hour' ORDER BY bucket"
+            )
+        ).all()
+
+
+def test_rollup_migration_backfills_existing_metrics(database):
+    engine, config = database
+    command.upgrade(config, "0004_etl_job_stage")
+    _insert_metrics(engine)
+
+    command.upgrade(config, "head")
+
+    assert _hourly_rollups(engine) == [("w1", 2, 6.0, 2.0, 4.0), ("", 1, 7.0, 7.0, 7.0)]
+
+
+def test_rollup_migration_rebuilds_a_table_created_at_startup(database):
+    engine, config = database
+    # init_db runs create_all before Alembic, so the rollups may already hold these buckets.
+    Base.metadata.create_all(engine)
+    _insert_metrics(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "INSERT INTO metric_rollups "
+                "(resolution, metric_name, widget_id, bucket, count, sum, min, max, sketch) "
+                "VALUES ('hour', 'orders', '', :bucket, 1, 7.0, 7.0, 7.0, '{}')"
+            ),
+            {"bucket": datetime(2024, 3, 2, 9)},
+        )
+    command.stamp(config, "0004_etl_job_stage")
+
+    command.upgrade(config, "0005_metric_rollups")
+
+    assert _hourly_rollups(engine) == [("w1", 2, 6.0, 2.0, 4.0), ("", 1, 7.0, 7.0, 7.0)]
@@ -0,0 +1,46 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+from src.application.services.etl_job_stats_service import ETLJobStatsService
+from src.domain.entities import ETLJob
+
+
+class StubJobRepository:
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def list_finished(self, data_source_id, start, end):
+        return self.jobs
+
+
+def _job(job_id, started_at, completed_at, status="completed"):
+    return ETLJob(
+        id=job_id,
+        data_source_id="ds1",
+        job_type="sync",
+        status=status,
+        started_at=started_at,
+        completed_at=completed_at,
+        rows_processed=100,
+    )
+
+
+def test_performance_buckets_aware_timestamps_in_utc_and_skips_unfinished_jobs():
+    offset = timezone(timedelta(hours=-5))
+    jobs = [
+        _job(
+            "j1",
+            datetime(2026, 1, 1, 22, 0, tzinfo=offset),
+            datetime(2026, 1, 1, 22, 0, 10, tzinfo=offset),
+        ),
+        _job("j2", datetime(2026, 1, 2, 4, 0), datetime(2026, 1, 2, 4, 0, 20, tzinfo=UTC)),
+        _job("j3", None, datetime(2026, 1, 2, 5, 0)),
+        _job("j4", datetime(2026, 1, 2, 6, 0), None, status="failed"),
+    ]
+
+    buckets = ETLJobStatsService(StubJobRepository(jobs)).performance(
+        "ds1", datetime(2026, 1, 1), datetime(2026, 1, 3)
+    )
+
+    assert [bucket["period_start"] for bucket in buckets] == [datetime(2026, 1, 2)]
+    assert buckets[0]["runs"] == 2
+    assert buckets[0]["p50_seconds"] == 15.0
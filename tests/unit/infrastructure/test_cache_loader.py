@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+from src.infrastructure.cache import RedisCacheService
+from src.infrastructure.etl.loaders import CacheLoader
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    from src.shared.config import get_settings
+
+    get_settings.cache_clear()
+    try:
+        yield RedisCacheService()
+    finally:
+        get_settings.cache_clear()
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=10, freq="D"),
+            "region": [f"r{index % 3}" for index in range(10)],
+            "revenue": [float(index * 10) for index in range(10)],
+        }
+    )
+
+
+def test_snapshot_round_trips_selected_columns_and_row_ranges(cache, dataframe):
+    loader = CacheLoader(cache=cache, chunk_rows=4)
+
+    assert loader.load(dataframe, "etl:sales:latest") == 10
+    manifest = cache.get("etl:sales:latest")
+    assert [chunk["rows"] for chunk in manifest["chunks"]] == [4, 4, 2]
+
+    pd.testing.assert_frame_equal(loader.read("etl:sales:latest"), dataframe)
+    window = loader.read("etl:sales:latest", columns=["revenue"], start=3, stop=7)
+    assert list(window.columns) == ["revenue"]
+    assert window["revenue"].tolist() == [30.0, 40.0, 50.0, 60.0]
+
+
+def test_snapshot_stops_at_the_size_cap(cache, dataframe):
+    CacheLoader(cache=cache, chunk_rows=4).load(dataframe.iloc[:8], "etl:probe")
+    two_chunk_bytes = cache.get("etl:probe")["bytes"]
+
+    loader = CacheLoader(cache=cache, chunk_rows=4, max_bytes=two_chunk_bytes)
+
+    assert loader.load(dataframe, "etl:sales:latest") == 8
+    manifest = cache.get("etl:sales:latest")
+    assert manifest["truncated"] is True
+    assert manifest["source_rows"] == 10
+    assert len(loader.read("etl:sales:latest")) == 8
+
+
+def test_snapshot_appends_frames_before_publishing(cache, dataframe):
+    loader = CacheLoader(cache=cache, chunk_rows=4)
+    snapshot = loader.begin("etl:sales:latest")
+
+    loader.append(snapshot, dataframe.iloc[:6])
+    loader.append(snapshot, dataframe.iloc[6:])
+    assert cache.get("etl:sales:latest") is None
+
+    assert loader.publish(snapshot) == 10
+    pd.testing.assert_frame_equal(loader.read("etl:sales:latest"), dataframe.reset_index(drop=True))
+
+
+def test_publish_sets_chunk_ttls_for_runs_longer_than_the_ttl(cache, dataframe, monkeypatch):
+    clock = [1_000_000.0]
+    monkeypatch.setattr("src.infrastructure.cache.redis_cache.time.time", lambda: clock[0])
+    loader = CacheLoader(cache=cache, chunk_rows=4, ttl=300)
+    snapshot = loader.begin("etl:sales:latest")
+    loader.append(snapshot, dataframe.iloc[:6])
+
+    clock[0] += 1000
+    loader.append(snapshot, dataframe.iloc[6:])
+    loader.publish(snapshot)
+    clock[0] += 200
+    pd.testing.assert_frame_equal(loader.read("etl:sales:latest"), dataframe.reset_index(drop=True))
+
+    clock[0] += 200
+    assert loader.read("etl:sales:latest") is None
+    assert cache.get_many_bytes([f"etl:sales:latest:{snapshot.snapshot_id}:0:0"]) == [None]
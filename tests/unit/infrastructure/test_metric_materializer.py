@@ -0,0 +1,137 @@
+from datetime import UTC, datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from src.domain.entities import Widget
+from src.domain.enums import AggregationType, MetricType, WidgetType
+from src.infrastructure.etl.backfill import MetricBackfill
+from src.infrastructure.etl.metric_materializer import MetricAccumulator, MetricMaterializer
+
+
+def _widget(widget_id: str, config: dict) -> Widget:
+    return Widget(
+        id=widget_id,
+        dashboard_id="d1",
+        name=widget_id,
+        type=WidgetType.NUMBER,
+        position={"x": 0, "y": 0, "width": 4, "height": 2},
+        config=config,
+    )
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame(
+        {
+            "revenue": [100.0, None, 250.0, 50.0],
+            "customers": [10, 20, 30, 40],
+            "region": list("abcd"),
+        }
+    )
+
+
+def test_widgets_sharing_a_column_fan_out_from_one_computation(dataframe):
+    materializer = MetricMaterializer()
+    widgets = [
+        _widget("w1", {"metric": "revenue", "aggregation": "sum"}),
+        _widget("w2", {"metric": "revenue", "aggregation": "total"}),
+        _widget("w3", {"metric": "revenue", "aggregation": "avg"}),
+        _widget("w4", {"metric": "revenue", "aggregation": "percentile"}),
+        _widget("w5", {"metric": "customers", "aggregation": "max"}),
+        _widget("w6", {"aggregation": "count"}),
+    ]
+
+    targets = materializer.resolve_targets(widgets, dataframe)
+    values = materializer.compute(dataframe, targets)
+    metrics = materializer.build_metrics("ds1", targets, values, datetime.now(UTC))
+
+    by_widget = {metric.widget_id: metric for metric in metrics}
+    assert by_widget["w1"].value_as_float == by_widget["w2"].value_as_float == 400.0
+    assert by_widget["w3"].value_as_float == pytest.approx(dataframe["revenue"].mean())
+    assert by_widget["w4"].value_as_float == pytest.approx(dataframe["revenue"].quantile(0.95))
+    assert by_widget["w5"].value_as_float == 40.0
+    assert by_widget["w6"].metric_type == MetricType.COUNT
+    assert by_widget["w6"].value_as_float == 3.0
+
+
+def test_columns_without_numeric_values_produce_no_metrics():
+    materializer = MetricMaterializer()
+    dataframe = pd.DataFrame({"revenue": [1.0], "notes": ["n/a"]})
+    targets = materializer.resolve_targets([_widget("w1", {"metric": "notes"})], dataframe)
+
+    assert materializer.compute(dataframe, targets) == {}
+
+
+def test_period_targets_group_by_bucket_and_match_streamed_chunks():
+    dataframe = pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2024-01-01 08:00", "2024-01-01 17:00", "2024-01-02 09:00", "2024-01-08 10:00"]
+            ),
+            "revenue": [100.0, 50.0, 25.0, 10.0],
+        }
+    )
+    widgets = [
+        _widget("daily", {"metric": "revenue", "aggregation": "sum"}),
+        _widget("weekly", {"metric": "revenue", "aggregation": "avg", "period": "weekly"}),
+    ]
+    materializer = MetricMaterializer()
+
+    targets = materializer.resolve_targets(widgets, dataframe, "date", AggregationType.DAILY)
+    values = materializer.compute_periods(dataframe, targets, "date")
+    metrics = materializer.build_period_metrics("ds1", targets, values)
+
+    daily = {
+        metric.timestamp.date().isoformat(): float(metric.metric_value.value)
+        for metric in metrics
+        if metric.widget_id == "daily"
+    }
+    weekly = {
+        metric.timestamp.date().isoformat(): float(metric.metric_value.value)
+        for metric in metrics
+        if metric.widget_id == "weekly"
+    }
+    assert daily == {"2024-01-01": 150.0, "2024-01-02": 25.0, "2024-01-08": 10.0}
+    assert weekly == {"2024-01-01": pytest.approx(175.0 / 3), "2024-01-08": 10.0}
+
+    accumulator = MetricAccumulator(materializer, widgets, "date", AggregationType.DAILY)
+    for start in range(0, len(dataframe), 3):
+        accumulator.update(dataframe.iloc[start : start + 3])
+    streamed = accumulator.period_values()
+    for key, series in values.items():
+        pd.testing.assert_series_equal(
+            streamed[key], series, check_names=False, check_index_type=False
+        )
+
+
+def test_backfill_windows_are_bucket_aligned_and_read_half_open_ranges(tmp_path):
+    bind = create_engine(f"sqlite:///{tmp_path / 'warehouse.db'}")
+    pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2024-01-31", "2024-02-01", "2024-02-29 23:00", "2024-03-01"], format="ISO8601"
+            ),
+            "revenue": [1, 2, 3, 4],
+        }
+    ).to_sql("data_source_ds1", bind, index=False)
+    backfill = MetricBackfill(bind=bind, window_buckets=1)
+
+    windows = backfill.windows(datetime(2024, 1, 15), datetime(2024, 3, 1), AggregationType.MONTHLY)
+    assert [(start.date().isoformat(), end.date().isoformat()) for start, end in windows] == [
+        ("2024-01-01", "2024-02-01"),
+        ("2024-02-01", "2024-03-01"),
+        ("2024-03-01", "2024-04-01"),
+    ]
+
+    targets = backfill.resolve_targets(
+        [_widget("w1", {"metric": "revenue", "aggregation": "sum"})],
+        "data_source_ds1",
+        "date",
+        AggregationType.MONTHLY,
+    )
+    values = backfill._compute_window(
+        "data_source_ds1", "date", targets, AggregationType.MONTHLY, *windows[1]
+    )
+    assert values[("revenue", AggregationType.MONTHLY, MetricType.SUM)].tolist() == [5.0]
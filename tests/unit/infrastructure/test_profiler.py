@@ -0,0 +1,42 @@
+import pandas as pd
+
+from src.infrastructure.etl.transformers import Aggregator, ETLTransformer
+from src.infrastructure.monitoring.profiler import StageProfiler, summarize_profiles
+
+
+def test_profiler_nests_transform_stages_and_counts_output():
+    profiler = StageProfiler()
+    transformer = ETLTransformer(
+        aggregator=Aggregator(group_by=["region"], aggregations={"revenue": "sum"})
+    )
+    transformer.profiler = profiler
+    frame = pd.DataFrame({"region": ["a", "b", "a"], "revenue": [1.0, 2.0, 3.0]})
+
+    profiler.start()
+    with profiler.stage("transform") as stage:
+        stage.output(transformer.transform(frame))
+    profiler.stop()
+
+    report = profiler.report()
+    assert set(report["stages"]) == {
+        "transform",
+        "transform;clean",
+        "transform;enrich",
+        "transform;aggregate",
+    }
+    transform = report["stages"]["transform"]
+    assert transform["rows"] == 2
+    assert transform["bytes"] > 0
+    assert transform["self_seconds"] <= transform["seconds"]
+    assert report["stages"]["transform;clean"]["rows"] == 3
+    assert (
+        transform["peak_traced_bytes"] >= report["stages"]["transform;clean"]["peak_traced_bytes"]
+    )
+
+    folded = profiler.folded().splitlines()
+    assert all(line.startswith("etl;transform") for line in folded)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in folded)
+
+    summary = summarize_profiles([report, report])
+    assert summary["runs"] == 2
+    assert summary["stages"]["transform;clean"]["rows"] == {"min": 3, "median": 3, "max": 3}
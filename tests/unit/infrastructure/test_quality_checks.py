@@ -0,0 +1,67 @@
+import pandas as pd
+
+from src.domain.entities import DataQualityCheck
+from src.infrastructure.etl.quality_checks import DataQualityEngine
+
+
+def _check(
+    check_id: str, check_type: str, column: str | None, expectation: dict
+) -> DataQualityCheck:
+    return DataQualityCheck(
+        id=check_id,
+        data_source_id="ds1",
+        check_type=check_type,
+        column_name=column,
+        expectation=expectation,
+        failure_count=2,
+    )
+
+
+def test_checks_accumulate_across_chunks():
+    dataframe = pd.DataFrame(
+        {
+            "order_id": [1, 2, 3, 2, 5, 1],
+            "amount": [10.0, None, 250.0, 40.0, -5.0, 60.0],
+            "email": ["a@x.io", "b@x.io", "bad", None, "c@x.io", "d@x.io"],
+        }
+    )
+    checks = [
+        _check("nulls", "null_rate", "amount", {"max_null_rate": 0.2}),
+        _check("range", "range", "amount", {"min": 0, "max": 100}),
+        _check("unique", "unique", "order_id", {"block": True}),
+        _check("regex", "regex", "email", {"pattern": r"[^@]+@[^@]+\.\w+"}),
+        _check("delta", "row_count_delta", None, {"max_change_pct": 10}),
+        _check("missing", "range", "discount", {"min": 0}),
+    ]
+    engine = DataQualityEngine(checks, previous_row_count=4)
+
+    for start in range(0, len(dataframe), 4):
+        engine.update(dataframe.iloc[start : start + 4])
+
+    outcomes = {outcome["id"]: outcome for outcome in engine.outcomes()}
+    assert outcomes["nulls"]["status"] == "passed"
+    assert outcomes["range"]["failures"] == 2
+    assert outcomes["unique"]["failures"] == 2
+    assert outcomes["regex"]["failures"] == 1
+    assert outcomes["delta"]["status"] == "failed"
+    assert outcomes["missing"]["status"] == "error"
+    assert [failure["id"] for failure in engine.blocking_failures()] == ["unique"]
+
+    updated = {check.id: check for check in engine.finish()}
+    assert updated["nulls"].last_status == "passed"
+    assert updated["nulls"].failure_count == 0
+    assert updated["unique"].failure_count == 3
+
+
+def test_unique_check_keeps_seen_values_in_a_sorted_array():
+    values = pd.Series([index % 700 for index in range(2000)] + [None, 3])
+    engine = DataQualityEngine([_check("unique", "unique", "order_id", {})])
+
+    for start in range(0, len(values), 150):
+        engine.update(pd.DataFrame({"order_id": values.iloc[start : start + 150]}))
+
+    state = engine.states[0]
+    assert state.failures == int(values.dropna().duplicated().sum())
+    assert state.seen_hashes.dtype == "uint64"
+    assert len(state.seen_hashes) == 700
+    assert (state.seen_hashes[1:] > state.seen_hashes[:-1]).all()
@@ -0,0 +1,114 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.infrastructure.connectors import RestAPIConnector
+
+ROWS = [{"id": index} for index in range(1, 24)]
+
+
+def _page_handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params["page"])
+    size = int(request.url.params["per_page"])
+    chunk = ROWS[(page - 1) * size : page * size]
+    return httpx.Response(200, json={"data": chunk, "meta": {"total": len(ROWS)}})
+
+
+def test_page_pagination_with_total_fetches_every_page():
+    connector = RestAPIConnector(transport=httpx.MockTransport(_page_handler))
+    config = {
+        "endpoint": "https://crm.example.com/orders",
+        "pagination": {"type": "page", "page_size": 5, "total_field": "meta.total"},
+    }
+
+    assert connector.fetch(config) == ROWS
+
+
+def test_offset_pagination_without_total_stops_on_short_page():
+    requested_offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        requested_offsets.append(offset)
+        return httpx.Response(200, json={"data": ROWS[offset : offset + 10]})
+
+    connector = RestAPIConnector(transport=httpx.MockTransport(handler), max_concurrency=2)
+    config = {
+        "endpoint": "https://crm.example.com/orders",
+        "pagination": {"type": "offset", "page_size": 10},
+    }
+
+    assert connector.fetch(config) == ROWS
+    assert sorted(requested_offsets) == [0, 10, 20]
+
+
+def test_cursor_pagination_follows_next_cursor():
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = int(request.url.params.get("cursor", 0))
+        next_cursor = cursor + 10 if cursor + 10 < len(ROWS) else None
+        return httpx.Response(
+            200, json={"data": ROWS[cursor : cursor + 10], "next_cursor": next_cursor}
+        )
+
+    connector = RestAPIConnector(transport=httpx.MockTransport(handler))
+    config = {"endpoint": "https://crm.example.com/orders", "pagination": {"type": "cursor"}}
+
+    assert connector.fetch(config) == ROWS
+
+
+def test_link_header_pagination_follows_next_link():
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params.get("start", 0))
+        headers = {}
+        if start + 10 < len(ROWS):
+            headers["Link"] = f'<https://crm.example.com/orders?start={start + 10}>; rel="next"'
+        return httpx.Response(200, json=ROWS[start : start + 10], headers=headers)
+
+    connector = RestAPIConnector(transport=httpx.MockTransport(handler))
+    config = {"endpoint": "https://crm.example.com/orders", "pagination": {"type": "link"}}
+
+    assert connector.fetch(config) == ROWS
+
+
+def test_transient_errors_are_retried():
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"data": [{"id": 1}]})
+
+    connector = RestAPIConnector(transport=httpx.MockTransport(handler))
+
+    assert connector.fetch({"endpoint": "https://crm.example.com/orders"}) == {"data": [{"id": 1}]}
+    assert calls["count"] == 2
+
+
+def test_client_errors_are_not_retried():
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        return httpx.Response(404)
+
+    connector = RestAPIConnector(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        connector.fetch({"endpoint": "https://crm.example.com/orders"})
+    assert calls["count"] == 1
+
+
+def test_fetch_works_inside_a_running_event_loop():
+    connector = RestAPIConnector(transport=httpx.MockTransport(_page_handler))
+    config = {
+        "endpoint": "https://crm.example.com/orders",
+        "pagination": {"type": "page", "page_size": 5, "total_field": "meta.total"},
+    }
+
+    async def fetch_from_coroutine():
+        return connector.fetch(config)
+
+    assert asyncio.run(fetch_from_coroutine()) == ROWS
+    assert asyncio.run(connector.fetch_async(config)) == ROWS
@@ -0,0 +1,61 @@
+import pandas as pd
+
+from src.infrastructure.etl.schema_inference import SchemaOptimizer
+from src.infrastructure.etl.transformers import ETLTransformer, PolarsTransformer
+
+
+def _frame(rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.Series(["2024-01-01", "2024-01-02"] * (rows // 2), dtype=object),
+            "channel": pd.Series(["email", "search", "social", None] * (rows // 4), dtype=object),
+            "campaign": pd.Series([f"campaign-{index}" for index in range(rows)], dtype=object),
+            "clicks": list(range(rows)),
+            "spend": [index * 0.5 for index in range(rows)],
+            "ctr": [index / 3 for index in range(rows)],
+        }
+    )
+
+
+def test_optimizer_downcasts_and_reuses_the_cached_schema():
+    optimizer = SchemaOptimizer(category_ratio=0.5)
+    optimized = optimizer.apply(_frame())
+
+    assert optimizer.schema == {
+        "date": "category",
+        "channel": "category",
+        "campaign": "string[pyarrow]",
+        "clicks": "int8",
+        "spend": "float32",
+        "ctr": "float64",
+    }
+    assert optimized["clicks"].dtype == "int8"
+    assert optimizer.memory_after < optimizer.memory_before
+
+    cached = SchemaOptimizer(optimizer.schema)
+    wider = _frame().assign(clicks=lambda frame: frame["clicks"] * 1000)
+    assert cached.apply(wider)["clicks"].dtype == "int32"
+    assert cached.schema["clicks"] == "int32"
+
+
+def test_optimized_frames_transform_like_the_originals():
+    frame = _frame().rename(columns={"spend": "revenue", "clicks": "customers"})
+    optimized = SchemaOptimizer().apply(frame)
+
+    for transformer in (ETLTransformer(workers=1), PolarsTransformer()):
+        expected = transformer.transform(frame)
+        result = transformer.transform(optimized)
+        pd.testing.assert_frame_equal(
+            result.astype(str), expected.astype(str), check_dtype=False, check_categorical=False
+        )
+
+
+def test_string_columns_keep_nulls():
+    frame = pd.DataFrame({"note": pd.Series(["a", None, "b", float("nan")], dtype=object)})
+    optimizer = SchemaOptimizer(category_ratio=0.1)
+
+    optimized = optimizer.apply(frame)
+
+    assert optimizer.schema == {"note": "string[pyarrow]"}
+    assert optimized["note"].isna().tolist() == [False, True, False, True]
+    assert SchemaOptimizer({"note": "str"}).apply(frame)["note"].isna().sum() == 2
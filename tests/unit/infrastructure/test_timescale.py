@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.persistence import SessionLocal
+from src.infrastructure.persistence.repositories import TimescaleMetricRepository
+from src.infrastructure.persistence.timescale import (
+    continuous_aggregate_statements,
+    hypertable_statements,
+)
+from src.shared.config import get_settings
+
+
+def _sql(aggregation: str) -> str:
+    stmt = TimescaleMetricRepository.aggregate_query(
+        "hour",
+        "revenue",
+        datetime(2024, 1, 1),
+        datetime(2024, 4, 1),
+        "w1",
+        timedelta(hours=6),
+        aggregation,
+    )
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_setup_builds_a_compressed_hypertable_and_one_aggregate_per_rollup():
+    statements = hypertable_statements(timedelta(days=7), timedelta(days=30))
+    assert 'ADD PRIMARY KEY (id, "timestamp")' in statements[1]
+    assert "create_hypertable('metrics', 'timestamp'" in statements[2]
+    assert "INTERVAL '2592000 seconds'" in statements[-1]
+
+    views = [sql for sql in continuous_aggregate_statements() if "timescaledb.continuous" in sql]
+    assert [sql.split()[6] for sql in views] == ["metrics_minute", "metrics_hour", "metrics_day"]
+
+
+def test_history_reads_continuous_aggregates_and_percentiles_from_the_hypertable():
+    merged = _sql("avg")
+    assert "FROM metrics_hour" in merged
+    assert "time_bucket(" in merged and "sum(metrics_hour.count)" in merged
+
+    percentile = _sql("p95")
+    assert "FROM metrics " in percentile
+    assert "percentile_cont" in percentile and "WITHIN GROUP" in percentile
+
+
+def test_timescale_mode_falls_back_to_rollup_tables_off_postgres(monkeypatch):
+    monkeypatch.setenv("TIMESCALE_ENABLED", "true")
+    get_settings.cache_clear()
+    session = SessionLocal()
+    try:
+        assert TimescaleMetricRepository(session).timescale is False
+    finally:
+        session.close()
+        monkeypatch.delenv("TIMESCALE_ENABLED")
+        get_settings.cache_clear()
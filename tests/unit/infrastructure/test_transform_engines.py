@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.etl import ETLPipeline
+from src.infrastructure.etl.transformers import Aggregator, ETLTransformer, PolarsTransformer
+
+
+@pytest.fixture
+def dataframe():
+    rng = np.random.default_rng(7)
+    frame = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=60, freq="D").strftime("%Y-%m-%d"),
+            "region": rng.choice(["north", "south", "east"], size=60),
+            "revenue": rng.integers(100, 1000, size=60).astype("float64"),
+            "customers": rng.integers(1, 50, size=60),
+        }
+    )
+    frame.loc[[3, 17], "revenue"] = np.nan
+    return pd.concat([frame, frame.iloc[:5]], ignore_index=True)
+
+
+@pytest.fixture(scope="module")
+def parallel_transformer():
+    transformer = ETLTransformer(workers=3, partition_rows=10)
+    yield transformer
+    transformer.close()
+
+
+@pytest.mark.parametrize(
+    "aggregations",
+    [
+        {"revenue": "sum", "customers": "mean", "avg_ticket": "max"},
+        {"revenue": "median"},
+    ],
+)
+def test_partitioned_transform_matches_serial(dataframe, parallel_transformer, aggregations):
+    aggregator = Aggregator(group_by=["region", "month"], aggregations=aggregations)
+    serial = ETLTransformer(aggregator=aggregator, workers=1).transform(dataframe)
+
+    parallel_transformer.aggregator = aggregator
+    parallel = parallel_transformer.transform(dataframe)
+
+    assert parallel_transformer.workers == 3
+    pd.testing.assert_frame_equal(parallel, serial, check_dtype=False)
+
+
+def test_partitioned_transform_without_aggregator_keeps_rows(dataframe, parallel_transformer):
+    parallel_transformer.aggregator = None
+    parallel = parallel_transformer.transform(dataframe)
+
+    assert parallel_transformer.workers == 3
+    pd.testing.assert_frame_equal(parallel, ETLTransformer(workers=1).transform(dataframe))
+
+
+@pytest.mark.parametrize(
+    "aggregator",
+    [
+        None,
+        Aggregator(
+            group_by=["region", "month"], aggregations={"revenue": "sum", "customers": "mean"}
+        ),
+    ],
+)
+def test_polars_engine_matches_pandas_engine(dataframe, aggregator):
+    dataframe = dataframe.assign(region=dataframe["region"].where(dataframe.index % 7 != 0, None))
+
+    expected = ETLTransformer(aggregator=aggregator, workers=1).transform(dataframe)
+    result = PolarsTransformer(aggregator=aggregator).transform(dataframe)
+
+    pd.testing.assert_frame_equal(result, expected.reset_index(drop=True), check_dtype=False)
+
+
+def test_pipeline_selects_transform_engine():
+    assert isinstance(ETLPipeline(engine="polars").transformer, PolarsTransformer)
+    with pytest.raises(ValueError):
+        ETLPipeline(engine="spark")
+
+
+def test_source_config_selects_transform_engine(tmp_path):
+    source = tmp_path / "sales.csv"
+    source.write_text("date,revenue\n2024-01-01,100\n2024-01-02,200\n")
+    pipeline = ETLPipeline(engine="pandas")
+
+    result = pipeline.run(
+        "csv", {"filepath": str(source), "engine": "polars"}, "test_engine_per_source"
+    )
+
+    assert result["rows_loaded"] == 2
+    assert isinstance(pipeline.transformer, PolarsTransformer)
+    with pytest.raises(ValueError):
+        pipeline.run("csv", {"filepath": str(source), "engine": "spark"}, "test_engine_per_source")
+
+
+def test_aggregator_skips_unused_categories():
+    frame = pd.DataFrame(
+        {
+            "region": pd.Categorical(["north", "north"], categories=["north", "south"]),
+            "revenue": [1.0, 2.0],
+        }
+    )
+
+    result = Aggregator(group_by=["region"], aggregations={"revenue": "sum"}).transform(frame)
+
+    assert result["region"].tolist() == ["north"]
+    assert result["revenue"].tolist() == [3.0]
@@ -0,0 +1,42 @@
+import hashlib
+import io
+
+import pytest
+
+from src.infrastructure.etl.upload_store import CSVUploadStore, sniff_csv
+
+
+def test_sniff_csv_keeps_the_first_row_as_header_by_default():
+    schema = sniff_csv(b"name,city\nAlice,Paris\nBob,Berlin\nCarl,Rome\n", complete=True)
+
+    assert schema["has_header"] is True
+    assert [column["name"] for column in schema["columns"]] == ["name", "city"]
+
+
+def test_sniff_csv_names_columns_of_headerless_tab_separated_rows():
+    schema = sniff_csv(b"1\t2.5\tx\n2\t3.5\ty\n3\t4.5\tz\n", complete=True, has_header=False)
+
+    assert schema["delimiter"] == "\t"
+    assert schema["has_header"] is False
+    assert [column["type"] for column in schema["columns"]] == ["integer", "float", "string"]
+    assert [column["name"] for column in schema["columns"]] == ["column_1", "column_2", "column_3"]
+
+
+def test_upload_store_hashes_in_blocks_and_rejects_before_reading_everything(tmp_path):
+    content = b"id,name\n" + b"".join(f"{index},name {index}\n".encode() for index in range(2000))
+    store = CSVUploadStore(tmp_path, block_size=512, sniff_bytes=1024)
+
+    stored = store.save(io.BytesIO(content), "user-1")
+    duplicate = store.save(io.BytesIO(content), "user-1")
+
+    assert stored.sha256 == hashlib.sha256(content).hexdigest()
+    assert stored.path.read_bytes() == content
+    assert stored.schema["sample_rows"] < 2000
+    assert duplicate.deduplicated and duplicate.path == stored.path
+    assert sorted(path.name for path in (tmp_path / "user-1").iterdir()) == [stored.path.name]
+
+    stream = io.BytesIO(b"\x00\xff" * 4096)
+    with pytest.raises(ValueError):
+        store.save(stream, "user-1")
+    assert stream.tell() == 1024
+    assert sorted(path.name for path in (tmp_path / "user-1").iterdir()) == [stored.path.name]
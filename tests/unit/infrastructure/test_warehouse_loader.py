@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from src.infrastructure.etl.loaders.warehouse_loader import copy_from_stdin
+
+
+class _RecordingCursor:
+    def __init__(self) -> None:
+        self.statement = None
+        self.payload = None
+
+    def copy_expert(self, statement, buffer) -> None:
+        self.statement = statement
+        self.payload = buffer.read()
+
+    def close(self) -> None:
+        pass
+
+
+def test_copy_from_stdin_streams_csv_with_null_marker():
+    cursor = _RecordingCursor()
+    conn = SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor))
+    table = SimpleNamespace(name="data_source_1", schema=None)
+
+    rows = copy_from_stdin(
+        table, conn, ["date", "revenue"], iter([("2024-01-01", 10.5), ("2024-01-02", None)])
+    )
+
+    assert rows == 2
+    assert cursor.statement == (
+        'COPY "data_source_1" ("date", "revenue") FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
+    )
+    assert cursor.payload.splitlines() == ["2024-01-01,10.5", "2024-01-02,\\N"]